@@ -2,6 +2,8 @@
 Read tables from messy spreadsheets.
 """
 from fuzzytable.main.fuzzytable import FuzzyTable
-from fuzzytable.patterns.fieldpattern import FieldPattern
+from fuzzytable.main.batch import read_workbook, read_many
+from fuzzytable.main.cache import ExtractionCache
+from fuzzytable.patterns.fieldpattern import FieldPattern, compile_fields
 
 __version__ = "0.19"
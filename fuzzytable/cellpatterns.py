@@ -6,17 +6,30 @@ import re
 from typing import Optional, List
 from datetime import datetime
 from functools import lru_cache
+from collections import OrderedDict, defaultdict, namedtuple
 
 # --- Intra-Package Imports ---------------------------------------------------
-from fuzzytable.patterns.cellpattern import CellPattern
+from fuzzytable.patterns.cellpattern import CellPattern, normalize_cellpattern
 from fuzzytable.main.utils import force_list
 from fuzzytable.main import string_analysis as strings
+from fuzzytable.main import matchers
 from fuzzytable import exceptions
 
 # --- Third Party Imports -----------------------------------------------------
 # None
 
 
+# --- Precompiled regular expressions -----------------------------------------
+_DIGITS = re.compile(r'\d+')  # consecutive digits
+_DIGIT = re.compile(r'[0-9]')  # individual digits
+_LETTERS = re.compile(r'[a-zA-Z]+')  # consecutive alphabetical characters
+# Strings matching this are accepted by float():
+_FLOAT_STR = re.compile(r'[ \t\n\r\f\v]*[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?[ \t\n\r\f\v]*\Z')
+# Strings containing any of these characters are rejected by float() (it accepts e.g. 'inf' and 'nan'):
+_NOT_FLOAT = re.compile(r'[^\d\s._+\-eEinfatyINFATY]')
+_MAX_EXACT_INT = 2 ** 53  # every int up to this size converts to float (and back) exactly
+
+
 class String(CellPattern):
     """
     Normalizes cell values to ``str``.
@@ -38,6 +51,15 @@ class String(CellPattern):
         # except TypeError:
         #     return self.default_value
 
+    def apply_column(self, values: List) -> List[str]:
+        default_value = self.default_value
+        return [
+            value.strip() if type(value) is str
+            else default_value if value is None
+            else str(value).strip()
+            for value in values
+        ]
+
 
 class IntegerList(CellPattern):
     """
@@ -55,9 +77,37 @@ class IntegerList(CellPattern):
         try:
             return [int(float(value))]
         except (TypeError, ValueError):
-            string_of_ints = re.findall(r'\d+', str(value))
+            string_of_ints = _DIGITS.findall(str(value))
             return [int(val) for val in string_of_ints]
 
+    def apply_column(self, values: List) -> List[List[int]]:
+        # Common cell types are handled inline. Anything unusual goes through apply_pattern.
+        apply_pattern = self.apply_pattern
+        default_value = self.default_value
+        float_match = _FLOAT_STR.match
+        not_float_search = _NOT_FLOAT.search
+        findall_digits = _DIGITS.findall
+        int_lists = []
+        append = int_lists.append
+        for value in values:
+            value_type = type(value)
+            if value_type is str:
+                if float_match(value):
+                    append([int(float(value))])
+                elif not_float_search(value):
+                    append([int(val) for val in findall_digits(value)])
+                else:
+                    append(apply_pattern(value))
+            elif value is None or value_type is bool:
+                append(default_value)
+            elif value_type is int:
+                append([value])
+            elif value_type is float:
+                append([int(value)])
+            else:
+                append(apply_pattern(value))
+        return int_lists
+
 
 class Integer(CellPattern):
     """
@@ -86,6 +136,38 @@ class Integer(CellPattern):
         # except ValueError:
         # return self.default_value
 
+    def apply_column(self, values: List) -> List[Optional[int]]:
+        # Common cell types are handled inline. Anything unusual goes through apply_pattern.
+        apply_pattern = self.apply_pattern
+        default_value = self.default_value
+        float_match = _FLOAT_STR.match
+        not_float_search = _NOT_FLOAT.search
+        search_digits = _DIGITS.search
+        integers = []
+        append = integers.append
+        for value in values:
+            value_type = type(value)
+            if value_type is str:
+                if float_match(value):
+                    append(int(float(value)))
+                elif not_float_search(value):
+                    digits = search_digits(value)
+                    append(default_value if digits is None else int(digits.group()))
+                else:
+                    append(apply_pattern(value))
+            elif value is None or value_type is bool:
+                append(default_value)
+            elif value_type is int:
+                # int(float(value)) only differs from value beyond float's exact integer range.
+                append(value if -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT else int(float(value)))
+            elif value_type is float:
+                append(int(value))
+            elif value_type is datetime:
+                append(value.year)
+            else:
+                append(apply_pattern(value))
+        return integers
+
 
 class Float(CellPattern):
     """
@@ -111,6 +193,35 @@ class Float(CellPattern):
             else:
                 return self.default_value
 
+    def apply_column(self, values: List) -> List[Optional[float]]:
+        # Common cell types are handled inline. Anything unusual goes through apply_pattern.
+        apply_pattern = self.apply_pattern
+        default_value = self.default_value
+        float_match = _FLOAT_STR.match
+        not_float_search = _NOT_FLOAT.search
+        search_digits = _DIGITS.search
+        floats = []
+        append = floats.append
+        for value in values:
+            value_type = type(value)
+            if value_type is str:
+                if float_match(value):
+                    append(float(value))
+                elif not_float_search(value):
+                    digits = search_digits(value)
+                    append(default_value if digits is None else float(int(digits.group())))
+                else:
+                    append(apply_pattern(value))
+            elif value is None or value_type is bool:
+                append(default_value)
+            elif value_type is int or value_type is float:
+                append(float(value))
+            elif value_type is datetime:
+                append(float(value.year))
+            else:
+                append(apply_pattern(value))
+        return floats
+
 
 class WordList(CellPattern):
     """
@@ -122,8 +233,7 @@ class WordList(CellPattern):
     def apply_pattern(self, value) -> List[str]:
         value_str = WordList.get_str(value)
         # p = re.compile(r'\w+')  # Regular Expression for consecutive alphabetical characters
-        p = re.compile(r'[a-zA-Z]+')
-        words = list(p.findall(value_str))
+        words = _LETTERS.findall(value_str)
         return words
 
 
@@ -166,6 +276,9 @@ class Boolean(CellPattern):
     def apply_pattern(self, value) -> bool:
         return bool(value)
 
+    def apply_column(self, values: List) -> List[bool]:
+        return list(map(bool, values))
+
 
 class Digit(CellPattern):
     """
@@ -175,17 +288,23 @@ class Digit(CellPattern):
     get_str = String().apply_pattern
 
     def apply_pattern(self, value) -> Optional[int]:
-        min_integer = 0
-        max_integer = 9
         value_str = Digit.get_str(value)
-        pattern = f'[{min_integer}-{max_integer}]'
-        p = re.compile(pattern)  # Regular Expression for individual digits
-        list_of_individual_digits = p.findall(value_str)
-        try:
-            first_digit = list_of_individual_digits[0]
-            return int(first_digit)
-        except IndexError:
+        first_digit = _DIGIT.search(value_str)
+        if first_digit is None:
             return None
+        return int(first_digit.group())
+
+    def apply_column(self, values: List) -> List[Optional[int]]:
+        search_digit = _DIGIT.search
+        digits = []
+        append = digits.append
+        for value in values:
+            if value is None:
+                append(None)
+                continue
+            first_digit = search_digit(value if type(value) is str else str(value))
+            append(None if first_digit is None else int(first_digit.group()))
+        return digits
 
 
 class StringChoice(CellPattern):
@@ -286,18 +405,25 @@ class StringChoice(CellPattern):
         # The keys are the values that be returned as cell values.
         # The values (and the values alone!) are the matching criteria.
 
+        self._matcher = None
+        self._matcher_settings = None
+
     def apply_pattern(self, value):
         value_str = StringChoice.get_str(value)
-        bestkey = strings.get_bestkey(
-            search_dict=self._choices,
-            target=value_str,
-            min_ratio=self.min_ratio,
-            case_sensitive=self.case_sensitive,
-            mode=self.mode,
-            default_value=self.default_value,
-        )
+        bestkey = self.matcher.get_bestkey(value_str)
+        if bestkey is strings.NoMatch:
+            return self.default_value
         return bestkey.name
 
+    @property
+    def matcher(self):
+        # The choices' lookup structures are built once, and rebuilt only if the settings change.
+        settings = (self.mode, self.case_sensitive, self.min_ratio)
+        if self._matcher_settings != settings:
+            self._matcher = matchers.get_matcher(self._choices, self.mode, self.case_sensitive, self.min_ratio)
+            self._matcher_settings = settings
+        return self._matcher
+
 
 class StringChoiceMulti(CellPattern):
     """
@@ -359,3 +485,128 @@ class StringChoiceMulti(CellPattern):
             if choice_compare in value:
                 found_choices.append(choice_orig)
         return found_choices
+
+
+CacheInfo = namedtuple("CacheInfo", "hits misses bypasses maxsize currsize")
+
+
+class Memoize(CellPattern):
+    """
+    Cache the results of another cell pattern.
+
+    Real columns are highly repetitive (status codes, state names, yes/no flags).
+    Wrap an expensive cell pattern (e.g. an approximate :obj:`StringChoice`)
+    and each distinct cell value is normalized only once.
+
+    .. code-block:: python
+
+        state_field = FieldPattern(
+            name="states",
+            cellpattern=cellpatterns.Memoize(
+                cellpatterns.StringChoice(
+                    choices='pennsylvania new_york north_carolina'.split(),
+                    mode='approx',
+                ),
+                maxsize=500,
+            ),
+        )
+
+    >>> state_field.cellpattern.cache_info()
+    CacheInfo(hits=99630, misses=370, bypasses=0, maxsize=500, currsize=370)
+
+    Args:
+        cellpattern (:obj:`~fuzzytable.patterns.cellpattern.CellPattern` or any callable): the pattern to cache.
+        maxsize (``int`` >= 1 or ``None``, default ``1024``): Maximum number of cached values.
+            ``None`` means unbounded.
+        policy (``str``, default ``'lru'``): Which value to evict when the cache is full.
+            ``'lru'``: the least recently used. ``'lfu'``: the least frequently used.
+
+    Note:
+        Unhashable cell values (e.g. lists) bypass the cache.
+        Cached results are shared between cells,
+        so patterns returning mutable values (e.g. lists) should not be memoized if those values are later modified.
+    """
+
+    user_instantiated = True
+
+    def __init__(self, cellpattern, maxsize=1024, policy='lru'):
+        super().__init__()
+        if policy not in ('lru', 'lfu'):
+            raise exceptions.CachePolicyError(policy)
+        if maxsize is not None and not (isinstance(maxsize, int) and maxsize > 0):
+            raise exceptions.CacheSizeError(maxsize)
+        self.cellpattern = normalize_cellpattern(cellpattern)
+        self.maxsize = maxsize
+        self.policy = policy
+        self.cache_clear()
+
+    def apply_pattern(self, value):
+        # The type is part of the key. Otherwise, e.g. 1, 1.0, and True would share a result.
+        key = (type(value), value)
+        try:
+            result = self._get(key)
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable value
+            self.bypasses += 1
+            return self.cellpattern(value)
+        else:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = self.cellpattern(value)
+        self._put(key, result)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Return the cache statistics, like ``functools.lru_cache``."""
+        return CacheInfo(self.hits, self.misses, self.bypasses, self.maxsize, len(self._results))
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset the statistics."""
+        self.hits = self.misses = self.bypasses = 0
+        self._results = OrderedDict()  # key: result. In LRU order (least recent first)
+        self._counts = {}  # lfu only. key: use count
+        self._count_keys = defaultdict(OrderedDict)  # lfu only. use count: keys (least recent first)
+        self._min_count = 0
+
+    def _get(self, key):
+        result = self._results[key]
+        if self.policy == 'lru':
+            self._results.move_to_end(key)
+        else:
+            self._touch(key)
+        return result
+
+    def _put(self, key, result) -> None:
+        if self.maxsize is not None and len(self._results) >= self.maxsize:
+            self._evict()
+        self._results[key] = result
+        if self.policy == 'lfu':
+            self._counts[key] = 1
+            self._count_keys[1][key] = None
+            self._min_count = 1
+
+    def _evict(self) -> None:
+        if self.policy == 'lru':
+            self._results.popitem(last=False)
+            return
+        keys = self._count_keys[self._min_count]
+        key, _ = keys.popitem(last=False)
+        if not keys:
+            del self._count_keys[self._min_count]
+        del self._counts[key]
+        del self._results[key]
+
+    def _touch(self, key) -> None:
+        # lfu: bump the key's use count
+        count = self._counts[key]
+        keys = self._count_keys[count]
+        del keys[key]
+        if not keys:
+            del self._count_keys[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._count_keys[count + 1][key] = None
@@ -1,3 +1,4 @@
-from fuzzytable.datamodel.records import Records
+from fuzzytable.datamodel.records import Records, Row
 from fuzzytable.datamodel.fields import Field, SingleField, MultiField
 from fuzzytable.datamodel.sheet import Sheet
+from fuzzytable.datamodel.columns import Column, IntColumn, FloatColumn, DictColumn, DictEncoder, compact_column
@@ -0,0 +1,245 @@
+"""
+Compact column storage, an optional alternative to plain lists for ``SingleField.data``.
+
+A list of a million ints or floats costs ~28-32 bytes per boxed value plus an 8-byte pointer.
+These columns store the same values in typed arrays instead:
+
+- :class:`IntColumn`: ``array('q')``, with a null bitmap for ``None`` cells.
+- :class:`FloatColumn`: ``array('d')``, with a null bitmap for ``None`` cells.
+- :class:`DictColumn`: each distinct value stored once, plus an array of integer codes.
+  Used for repetitive string columns, or any column whose FieldPattern has ``dictionary_encode=True``.
+
+All of them are read-only sequences: indexing, slicing, iteration, ``len``,
+and equality with any other sequence (e.g. a list) behave as they would for the original list.
+"""
+
+# --- Standard Library Imports ------------------------------------------------
+import collections
+import reprlib
+from array import array
+from typing import List, Optional, Sequence
+
+# --- Intra-Package Imports ---------------------------------------------------
+# None
+
+# --- Third Party Imports -----------------------------------------------------
+# None
+
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+class Column(collections.abc.Sequence):
+    """Base class for compact, read-only columns."""
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._get(index) for index in range(*item.indices(len(self)))]
+        length = len(self)
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._get(item)
+
+    def _get(self, index):
+        raise NotImplementedError  # pragma: no cover
+
+    def tolist(self) -> List:
+        """Return the values as a plain ``list``."""
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the column's buffers, in bytes."""
+        raise NotImplementedError  # pragma: no cover
+
+    def __eq__(self, other):
+        if isinstance(other, str) or not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        return all(a is b or a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({reprlib.repr(self.tolist())})"
+
+
+class _ArrayColumn(Column):
+    # Numeric values in a typed array. Null cells hold a 0 placeholder and have their bit set in the bitmap.
+
+    typecode = None
+    _placeholder = 0
+
+    def __init__(self, values: Sequence) -> None:
+        nulls = bytearray((len(values) + 7) // 8)
+        has_nulls = False
+        placeholder = self._placeholder
+        for index, value in enumerate(values):
+            if value is None:
+                nulls[index >> 3] |= 1 << (index & 7)
+                has_nulls = True
+        if has_nulls:
+            self._values = array(self.typecode, [placeholder if value is None else value for value in values])
+            self._nulls = nulls
+        else:
+            self._values = array(self.typecode, values)
+            self._nulls = None
+
+    @property
+    def values(self) -> array:
+        """Return the underlying array. Null cells hold a ``0`` placeholder."""
+        return self._values
+
+    def is_null(self, index: int) -> bool:
+        """Return ``True`` if the cell at (non-negative) ``index`` is ``None``."""
+        nulls = self._nulls
+        return nulls is not None and bool(nulls[index >> 3] & (1 << (index & 7)))
+
+    def _get(self, index):
+        nulls = self._nulls
+        if nulls is not None and nulls[index >> 3] & (1 << (index & 7)):
+            return None
+        return self._values[index]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        if self._nulls is None:
+            return iter(self._values)
+        return self._iter_with_nulls()
+
+    def _iter_with_nulls(self):
+        nulls = self._nulls
+        for index, value in enumerate(self._values):
+            if nulls[index >> 3] & (1 << (index & 7)):
+                yield None
+            else:
+                yield value
+
+    def tolist(self) -> List:
+        values = self._values.tolist()
+        if self._nulls is not None:
+            nulls = self._nulls
+            for index in range(len(values)):
+                if nulls[index >> 3] & (1 << (index & 7)):
+                    values[index] = None
+        return values
+
+    @property
+    def nbytes(self) -> int:
+        nulls_size = 0 if self._nulls is None else len(self._nulls)
+        return self._values.itemsize * len(self._values) + nulls_size
+
+
+class IntColumn(_ArrayColumn):
+    """64-bit integer column (``array('q')``). ``None`` cells are tracked in a null bitmap."""
+
+    typecode = 'q'
+
+
+class FloatColumn(_ArrayColumn):
+    """Double precision float column (``array('d')``). ``None`` cells are tracked in a null bitmap."""
+
+    typecode = 'd'
+    _placeholder = 0.0
+
+
+class DictColumn(Column):
+    """Dictionary-encoded column: each distinct value is stored once.
+
+    Attributes:
+        dictionary: ``list`` of the distinct values, in order of first appearance.
+        codes: ``array`` of ``int``, one per cell. ``column[i] == column.dictionary[column.codes[i]]``
+    """
+
+    def __init__(self, codes: List[int], dictionary: List) -> None:
+        self.dictionary = dictionary
+        self.codes = array(_code_typecode(len(dictionary)), codes)
+
+    @classmethod
+    def from_values(cls, values: Sequence) -> 'DictColumn':
+        """Dictionary-encode ``values``. Raises ``TypeError`` if any value is unhashable."""
+        return DictEncoder().encode(values)
+
+    def _get(self, index):
+        return self.dictionary[self.codes[index]]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return map(self.dictionary.__getitem__, self.codes)
+
+    @property
+    def nbytes(self) -> int:
+        # the dictionary's values are counted once each (pointers only; values are shared with the caller)
+        return self.codes.itemsize * len(self.codes) + 8 * len(self.dictionary)
+
+
+class DictEncoder:
+    """Assign integer codes to values, in order of first appearance.
+
+    One encoder can encode many blocks of the same column (e.g. from ``FuzzyTable.chunks``).
+    All of the resulting :class:`DictColumn` objects share its ``dictionary``,
+    so a value has the same code in every block.
+    """
+
+    def __init__(self) -> None:
+        self.dictionary = []
+        self._codes = {}
+
+    def encode(self, values: Sequence) -> DictColumn:
+        """Return ``values`` as a :class:`DictColumn`. Raises ``TypeError`` if any value is unhashable."""
+        code_of = self._code_of
+        return DictColumn([code_of(value) for value in values], self.dictionary)
+
+    def intern(self, value):
+        """Return the one stored instance equal to (and of the same type as) ``value``."""
+        return self.dictionary[self._code_of(value)]
+
+    def _code_of(self, value) -> int:
+        # The type is part of the key. Otherwise, e.g. 1, 1.0, and True would share a code.
+        key = value if type(value) is str else (type(value), value)
+        try:
+            return self._codes[key]
+        except KeyError:
+            code = self._codes[key] = len(self.dictionary)
+            self.dictionary.append(value)
+            return code
+
+
+def _code_typecode(dictionary_size: int) -> str:
+    for typecode in 'BHIL':
+        if dictionary_size <= 2 ** (8 * array(typecode).itemsize):
+            return typecode
+    return 'Q'  # pragma: no cover
+
+
+def compact_column(values: List, max_cardinality: Optional[float] = 0.5) -> Sequence:
+    """Return a compact column holding ``values``, or ``values`` itself if no compact form fits.
+
+    - all ``int`` (within 64 bits) or ``None``: :class:`IntColumn`
+    - all ``float`` or ``None``: :class:`FloatColumn`
+    - all ``str`` or ``None``, with at most ``max_cardinality * len(values)`` distinct values: :class:`DictColumn`
+
+    Columns of other (or mixed) types are returned unchanged, so that no value changes type.
+    """
+    value_types = set(map(type, values))
+    value_types.discard(type(None))
+    if not value_types:
+        return values
+    if value_types == {int}:
+        if all(value is None or _INT64_MIN <= value <= _INT64_MAX for value in values):
+            return IntColumn(values)
+        return values
+    if value_types == {float}:
+        return FloatColumn(values)
+    if value_types == {str} and max_cardinality is not None:
+        if len(set(values)) <= max_cardinality * len(values):
+            return DictColumn.from_values(values)
+    return values
@@ -4,11 +4,13 @@ They store the data, location, header name, etc.
 """
 
 # --- Standard Library Imports ------------------------------------------------
-from typing import Optional, List, Iterable
+from typing import Optional, List, Iterable, Tuple
 from abc import ABC, abstractmethod
+from array import array
 
 # --- Intra-Package Imports ---------------------------------------------------
 from fuzzytable.main.utils import get_repr
+from fuzzytable.datamodel.columns import DictColumn
 
 # --- Third Party Imports -----------------------------------------------------
 # None
@@ -71,6 +73,7 @@ class SingleField(Field):
         self.data = None
         self.ratio = None
         self.cellpattern = None
+        self.dictionary_encode = False
 
         # populated during later step after all matching is done
 
@@ -94,6 +97,23 @@ class SingleField(Field):
     def __len__(self):
         return len(self.data)
 
+    def encode(self) -> Tuple[array, List]:
+        """Return this column dictionary-encoded, as a ``(codes, dictionary)`` pair.
+
+        ``dictionary`` holds each distinct value once; ``codes`` holds one index into it per cell.
+        This is free if the field was extracted with ``FieldPattern(dictionary_encode=True)``.
+
+        >>> codes, dictionary = ft.get_field('region').encode()
+        >>> dictionary
+        ['east', 'west']
+        >>> list(codes)
+        [0, 1, 1, 0]
+        """
+        data = self.data
+        if not isinstance(data, DictColumn):
+            data = DictColumn.from_values(data)
+        return data.codes, data.dictionary
+
 
 class MultiField(Field):
     """
@@ -110,6 +130,7 @@ class MultiField(Field):
         # self._row_count = row_count
         self.matched = True
         self.cellpattern = None
+        self._data_cache = None  # (subfield data objects, their lengths, zipped column)
 
     @property
     def header(self):
@@ -117,10 +138,26 @@ class MultiField(Field):
 
     @property
     def data(self):
-        return [
-            self[i]
-            for i in range(len(self))
-        ]
+        """Return a list of tuples, one per row, each holding one value per subfield.
+
+        The list is built once and cached. It is rebuilt if a subfield's data is replaced or changes length.
+        Call :obj:`invalidate_data` after modifying a subfield's data in place.
+        The cached list is shared: copy it before modifying it.
+        """
+        sources = [field.data for field in self.subfields]
+        lengths = [len(source) for source in sources]
+        cache = self._data_cache
+        if (
+            cache is None
+            or cache[1] != lengths
+            or any(cached is not source for cached, source in zip(cache[0], sources))
+        ):
+            cache = self._data_cache = (sources, lengths, list(zip(*sources)))
+        return cache[2]
+
+    def invalidate_data(self) -> None:
+        """Discard the cached :obj:`data` column."""
+        self._data_cache = None
 
     @property
     def ratio(self):
@@ -131,6 +168,7 @@ class MultiField(Field):
         return len(self.subfields[0])
 
     def __getitem__(self, item):
+        # O(1) per row: only this row's values are read.
         return tuple(
             field.data[item]
             for field in self.subfields
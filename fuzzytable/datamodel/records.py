@@ -5,8 +5,8 @@ Records class is essentially a view on the data stored in SingleField objects.
 
 # --- Standard Library Imports ------------------------------------------------
 import collections
-from typing import List, Dict
-import itertools
+from typing import List, Dict, Iterator, Tuple, Callable
+from itertools import repeat
 
 # --- Intra-Package Imports ---------------------------------------------------
 # from fuzzytable.datamodel import SingleField
@@ -74,33 +74,154 @@ class Records(collections.abc.Sequence):
             self.fields = fields
         else:
             self.fields = list(self._orig_fields)
+        self._names = tuple(field.name for field in self.fields)
+        self._index = {name: position for position, name in enumerate(self._names)}
+        self._make_record = _record_maker(self._names)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Return the field names, in the same order as each record's keys."""
+        return self._names
 
     def __getitem__(self, item: int) -> Dict[str, List]:
-        record = dict()
-        for field in self.fields:
-            record[field.name] = field.data[item]
-        return record
+        if isinstance(item, slice):
+            return {field.name: field.data[item] for field in self.fields}
+        # field[item] reads a single row, even for a MultiField.
+        return self._make_record(tuple(field[item] for field in self.fields))
 
-    def __iter__(self):
-        yield from (
-            self[index]
-            for index in range(len(self))
-        )
+    def __iter__(self) -> Iterator[Dict]:
+        return map(self._make_record, self.as_tuples())
+
+    def as_tuples(self) -> Iterator[Tuple]:
+        """Fast path: yield each record as a plain tuple of values, in :obj:`names` order.
+
+        >>> ft.records.names
+        ('first_name', 'last_name', 'birthday', 'row')
+        >>> next(ft.records.as_tuples())
+        ('John', 'Smith', '1-Jan-01', 2)
+        """
+        columns = [field.data for field in self.fields]
+        if not columns:
+            return repeat((), len(self))
+        return zip(*columns)
+
+    def rows(self) -> Iterator['Row']:
+        """Yield each record as a lightweight, read-only :obj:`Row` (a mapping, like a ``dict``).
+
+        Rows share one name-to-position index, so they cost little more than a tuple.
+
+        >>> row = next(ft.records.rows())
+        >>> row['last_name']
+        'Smith'
+        >>> dict(row)
+        {'first_name': 'John', 'last_name': 'Smith', 'birthday': '1-Jan-01', 'row': 2}
+        """
+        index = self._index
+        return (Row(index, values) for values in self.as_tuples())
 
     def __len__(self):
         return self._len
 
     def __eq__(self, other):
+        if isinstance(other, Records):
+            return self._columns_equal(other)
         empty_dict = dict()
+        names = self._names
+        try:
+            other_records = iter(other)
+        except TypeError:
+            return False
         try:
-            for self_record, other_record in itertools.zip_longest(self, other, fillvalue=empty_dict):
-                self_dict = dict(self_record)
-                other_dict = dict(other_record)
-                if self_dict != other_dict:
+            for values in self.as_tuples():
+                other_record = next(other_records, empty_dict)
+                if type(other_record) is not dict:
+                    other_record = dict(other_record)
+                if len(other_record) != len(names):
                     return False
+                for name, value in zip(names, values):
+                    if name not in other_record:
+                        return False
+                    other_value = other_record[name]
+                    if not (value is other_value or value == other_value):
+                        return False
         except TypeError:
             return False
+        # Any records left over in ``other`` are compared to an empty record.
+        for other_record in other_records:
+            try:
+                if dict(other_record) != empty_dict:
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    def __getstate__(self):
+        # The record maker is generated code; rebuild it rather than pickling it.
+        state = self.__dict__.copy()
+        del state['_make_record']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._make_record = _record_maker(self._names)
+
+    def _columns_equal(self, other: 'Records') -> bool:
+        # Compare column by column. No records are built.
+        if len(self) != len(other) or set(self._names) != set(other._names):
+            return False
+        other_columns = {field.name: field.data for field in other.fields}
+        for field in self.fields:
+            column = field.data
+            other_column = other_columns[field.name]
+            if type(column) is list and type(other_column) is list:
+                if column != other_column:
+                    return False
+            elif not all(a is b or a == b for a, b in zip(column, other_column)):
+                return False
         return True
 
     # def __repr__(self):
     #     return get_repr(self)  # pragma: no cover
+
+
+def _record_maker(names: Tuple) -> Callable[[Tuple], Dict]:
+    # Return a function converting a tuple of values to a record, e.g. for names ('a', 'b'):
+    #     lambda values: {k0: values[0], k1: values[1]}
+    # A dict display is almost twice as fast as dict(zip(names, values)).
+    # The names are passed in as variables (never as source code), so any hashable name is safe.
+    namespace = {f'k{position}': name for position, name in enumerate(names)}
+    items = ', '.join(f'k{position}: values[{position}]' for position in range(len(names)))
+    return eval(f'lambda values: {{{items}}}', namespace)
+
+
+class Row(collections.abc.Mapping):
+    """
+    A single read-only record: a mapping of field names to values, like a ``dict``.
+
+    Yielded by :obj:`Records.rows`. Compares equal to a ``dict`` holding the same items.
+    Use ``dict(row)`` for a modifiable copy.
+    """
+
+    __slots__ = ('_index', '_values')
+
+    def __init__(self, index: Dict[str, int], values: Tuple) -> None:
+        self._index = index  # field name: position. Shared by all rows of a Records object.
+        self._values = values
+
+    def __getitem__(self, name):
+        return self._values[self._index[name]]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def values(self):
+        return self._values
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
@@ -13,7 +13,17 @@ class FuzzyTableError(Exception):
     """
     Standard fuzzytable exception
     """
-    pass
+
+    def __reduce__(self):
+        # Subclasses build their message from custom __init__ arguments,
+        # so the default (cls(*self.args)) can't rebuild them, e.g. when sent back from a worker process.
+        return _rebuild_error, (type(self), self.args), self.__dict__ or None
+
+
+def _rebuild_error(cls, args):
+    error = cls.__new__(cls, *args)
+    error.args = args
+    return error
 
 
 class InvalidFileError(FuzzyTableError):
@@ -147,3 +157,92 @@ class ModeError(FuzzyTableError):
         valid_entries = 'exact approx contains'.split()
         message = f"Cell pattern `mode` argument must be one of {valid_entries}. You passed {repr(mode)} instead."
         super().__init__(message)
+
+
+class InvalidChunksizeError(FuzzyTableError, ValueError):
+    """
+    Raised if :obj:`FuzzyTable.chunks<fuzzytable.FuzzyTable.chunks>` was passed an invalid ``chunksize`` argument.
+
+    ``chunksize`` must be a positive (non-zero) integer.
+    """
+    def __init__(self, chunksize):
+        message = f"chunksize must be a positive, non-zero integer. You entered {chunksize}."
+        super().__init__(message)
+
+
+class InvalidWorkersError(FuzzyTableError, ValueError):
+    """
+    Raised if :func:`fuzzytable.read_workbook` or :func:`fuzzytable.read_many` was passed an invalid ``workers`` argument.
+
+    ``workers`` must be ``None`` or a positive (non-zero) integer.
+    """
+    def __init__(self, workers):
+        message = f"workers must be None or a positive, non-zero integer. You entered {workers}."
+        super().__init__(message)
+
+
+class CachePolicyError(FuzzyTableError, ValueError):
+    """
+    Raised if :obj:`~fuzzytable.cellpatterns.Memoize` was passed an invalid ``policy`` argument.
+
+    Valid ``policy`` arguments are:
+        - ``lru``
+        - ``lfu``
+    """
+    def __init__(self, policy):
+        message = f"Cache policy must be 'lru' or 'lfu'. You passed {repr(policy)} instead."
+        super().__init__(message)
+
+
+class CacheSizeError(FuzzyTableError, ValueError):
+    """
+    Raised if :obj:`~fuzzytable.cellpatterns.Memoize` was passed an invalid ``maxsize`` argument.
+
+    ``maxsize`` must be ``None`` or a positive (non-zero) integer.
+    """
+    def __init__(self, maxsize):
+        message = f"Cache maxsize must be None or a positive, non-zero integer. You entered {maxsize}."
+        super().__init__(message)
+
+
+class SimilarityBackendError(FuzzyTableError, KeyError):
+    """
+    Raised if :func:`fuzzytable.main.similarity.set_backend` was passed an unregistered backend name.
+    """
+    def __init__(self, name, available):
+        message = f"No similarity backend named {repr(name)}. Available backends: {available}."
+        super().__init__(message)
+
+
+class InvalidAssignmentError(FuzzyTableError, ValueError):
+    """
+    Raised if FuzzyTable was passed an invalid ``assignment`` argument.
+
+    Valid ``assignment`` arguments are:
+        - ``greedy``
+        - ``optimal``
+    """
+    def __init__(self, assignment):
+        message = f"assignment must be 'greedy' or 'optimal'. You entered {repr(assignment)}."
+        super().__init__(message)
+
+
+class InvalidCacheDirError(FuzzyTableError, TypeError):
+    """
+    Raised if FuzzyTable was passed a ``cache_dir`` that is not a path
+    (or a :obj:`~fuzzytable.ExtractionCache`).
+    """
+    def __init__(self, cache_dir):
+        message = f"cache_dir must be a path or an ExtractionCache. You entered {repr(cache_dir)}."
+        super().__init__(message)
+
+
+class InvalidMaxBytesError(FuzzyTableError, ValueError):
+    """
+    Raised if :obj:`~fuzzytable.ExtractionCache` was passed an invalid ``max_bytes`` argument.
+
+    ``max_bytes`` must be ``None`` or a positive (non-zero) integer.
+    """
+    def __init__(self, max_bytes):
+        message = f"max_bytes must be None or a positive, non-zero integer. You entered {max_bytes}."
+        super().__init__(message)
@@ -0,0 +1,103 @@
+"""
+Run fuzzytable's blocking work from asyncio code.
+
+Reading a sheet is synchronous (file I/O and cpu-bound parsing).
+FuzzyTable.aload and FuzzyTable.astream split it into steps (header seek, then chunks of rows)
+and run each step in an executor, so the event loop stays free between steps.
+"""
+
+# --- Standard Library Imports ------------------------------------------------
+import asyncio
+import threading
+from itertools import islice
+from typing import AsyncIterator, Iterator, List
+
+# --- Intra-Package Imports ---------------------------------------------------
+# None
+
+# --- Third Party Imports -----------------------------------------------------
+# None
+
+
+_DONE = object()
+
+
+class _Steps:
+    # Drive a generator from executor threads, one step at a time.
+    # The lock keeps close() from running while a step is still in progress.
+
+    def __init__(self, generator: Iterator) -> None:
+        self._generator = generator
+        self._lock = threading.Lock()
+
+    def step(self):
+        with self._lock:
+            return next(self._generator, _DONE)
+
+    def close(self) -> None:
+        with self._lock:
+            self._generator.close()
+
+
+async def iter_steps(generator: Iterator, executor=None) -> AsyncIterator:
+    """Asynchronously yield the items of a generator, computing each one in ``executor``.
+
+    If iteration stops early (the awaiting task is cancelled, or the consumer stops),
+    the step in progress runs to completion (threads can't be interrupted),
+    then the generator is closed, before iteration ends. No further steps run.
+    """
+    loop = asyncio.get_event_loop()
+    steps = _Steps(generator)
+    finished = False
+    try:
+        while True:
+            item = await loop.run_in_executor(executor, steps.step)
+            if item is _DONE:
+                finished = True
+                return
+            yield item
+    finally:
+        if not finished:
+            # Wait (without blocking the event loop) for the step in progress, then the generator's cleanup,
+            # so that the sheet is closed before aload/astream return (and release their semaphore).
+            # Shielded: cancelling the task again doesn't abandon the cleanup.
+            await asyncio.shield(loop.run_in_executor(executor, steps.close))
+
+
+async def run_steps(generator: Iterator, executor=None) -> None:
+    """Exhaust a generator, running each step in ``executor``. See :func:`iter_steps`."""
+    async for _ in iter_steps(generator, executor):
+        pass
+
+
+def batched(iterator: Iterator, size: int) -> Iterator[List]:
+    """Yield lists of (up to) ``size`` items. Closing this generator closes ``iterator``."""
+    try:
+        while True:
+            batch = list(islice(iterator, size))
+            if not batch:
+                return
+            yield batch
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+
+
+class _NoLimit:
+    # Stands in for an asyncio.Semaphore when no concurrency limit is given.
+
+    async def __aenter__(self):
+        pass
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+def limit(semaphore=None):
+    """Return ``semaphore``, or a no-op async context manager if ``None``."""
+    return _NoLimit() if semaphore is None else semaphore
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,242 @@
+"""
+Extract many tables in one call:
+
+- :func:`read_workbook`: every worksheet of a workbook.
+- :func:`read_many`: the same fields from many files.
+"""
+
+# --- Standard Library Imports ------------------------------------------------
+import csv
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+# --- Intra-Package Imports ---------------------------------------------------
+from fuzzytable import exceptions
+from fuzzytable.main import sheetreader
+from fuzzytable.main.cache import get_cache
+from fuzzytable.main.fuzzytable import FuzzyTable
+from fuzzytable.main.string_analysis import DefaultValue
+from fuzzytable.main.utils import force_list
+from fuzzytable.parsers.sheetparser import pos_int
+from fuzzytable.patterns import SheetPattern
+
+# --- Third Party Imports -----------------------------------------------------
+# None
+
+
+def read_workbook(
+        path: Union[str, Path],
+        sheetnames: Optional[Union[str, Iterable[str]]] = None,
+        workers: Optional[int] = None,
+        **kwargs
+) -> Dict[Optional[str], FuzzyTable]:
+    """Extract a :obj:`~fuzzytable.FuzzyTable` from each worksheet of a workbook.
+
+    The workbook is loaded once and shared by all of its worksheets.
+    (Calling ``FuzzyTable(path, sheetname)`` once per worksheet loads it every time.)
+
+    >>> tables = fuzzytable.read_workbook('monthly.xlsx', fields=['first_name', 'birthday'], header_row_seek=True)
+    >>> list(tables)
+    ['Jan', 'Feb', 'Mar']
+    >>> tables['Feb'].sheet.header_row_num
+    3
+
+    Args:
+        path (path-like :obj:`str`, :obj:`pathlib.Path` object): Must be a valid excel file.
+            A csv file holds a single table, keyed by ``None``.
+        sheetnames (``str`` or iterable thereof, default ``None``): The worksheets to read, in this order.
+
+            * ``None``: every worksheet, in workbook order.
+        workers (``int`` >= 1, default ``None``): If given, the worksheets are read concurrently
+            by a pool of (up to) this many processes. Each process loads the workbook once.
+            All other arguments (e.g. ``fields`` and their cell patterns) must then be picklable.
+
+            * ``None``: read the worksheets one after another, in this process.
+        **kwargs: Any other :obj:`~fuzzytable.FuzzyTable` argument (``fields``, ``header_row_seek``, ``mode``...).
+            Each applies to every worksheet. ``name`` defaults to the worksheet's name.
+
+    Returns:
+        ``dict``: worksheet name / :obj:`~fuzzytable.FuzzyTable` pairs.
+
+    Raises:
+        :obj:`fuzzytable.exceptions.InvalidWorkersError`: if ``workers`` is not ``None`` or a positive integer.
+        :obj:`fuzzytable.exceptions.FuzzyTableError`: Any exception that
+            :obj:`~fuzzytable.FuzzyTable` raises for one of the worksheets (e.g. ``SheetnameError``).
+    """
+    if workers is not None and not pos_int(workers):
+        raise exceptions.InvalidWorkersError(workers)
+    sheet_reader = SheetPattern(path).sheet_reader
+    if not isinstance(sheet_reader, sheetreader.ExcelReader):
+        return {None: FuzzyTable(path, **kwargs)}
+
+    # --- in this process -------------------------------------------------
+    if workers is None:
+        with sheet_reader:
+            workbook = sheet_reader.workbook
+            if sheetnames is None:
+                sheetnames = workbook.sheetnames
+            return {
+                sheetname: _read_sheet(path, workbook, sheetname, kwargs)
+                for sheetname in force_list(sheetnames)
+            }
+
+    # --- process pool ----------------------------------------------------
+    if sheetnames is None:
+        with sheet_reader:
+            sheetnames = sheet_reader.workbook.sheetnames
+    sheetnames = force_list(sheetnames)
+    if not sheetnames:
+        return {}
+    workers = min(workers, len(sheetnames))
+    with ProcessPoolExecutor(workers) as executor:
+        tables = executor.map(partial(_read_worker_sheet, path, kwargs), sheetnames)
+        return dict(zip(sheetnames, tables))
+
+
+def _read_sheet(path, workbook, sheetname, kwargs) -> FuzzyTable:
+    kwargs = {'name': sheetname, **kwargs}
+    with SheetPattern(path, sheetname, workbook).sheet_reader as sheet_reader:
+        return FuzzyTable._from_sheet_reader(sheet_reader, **kwargs)
+
+
+FileResult = namedtuple("FileResult", "path table error")
+FileResult.__doc__ = """Outcome of reading one file with :func:`read_many`.
+
+Attributes:
+    path: the path, as passed to :func:`read_many`.
+    table: :obj:`~fuzzytable.FuzzyTable`, or ``None`` if reading the file failed.
+    error: the exception that reading the file raised, or ``None``.
+"""
+
+# Errors that fail a single file of a batch. Any other exception aborts the batch.
+# UnicodeError and csv.Error: a csv file that isn't text in the locale's encoding, or isn't csv.
+FILE_ERRORS = (exceptions.FuzzyTableError, OSError, UnicodeError, csv.Error)
+
+# A batch keeps the similarity scorers of up to this many distinct headers.
+_MAX_SHARED_MATCHERS = 10_000
+
+
+def read_many(
+        paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None,
+        **kwargs
+) -> Iterator[FileResult]:
+    """Extract a :obj:`~fuzzytable.FuzzyTable` from each of many files, all with the same arguments.
+
+    The fields are normalized (and the arguments validated) once, for the whole batch.
+    Headers are analysed once per batch (or worker process) rather than once per file.
+
+    >>> for result in fuzzytable.read_many(paths, fields=['first_name', 'birthday'], workers=4):
+    ...     if result.error is None:
+    ...         load(result.table)
+    ...     else:
+    ...         print(result.path, result.error)
+
+    Args:
+        paths (iterable of path-like :obj:`str`, :obj:`pathlib.Path` objects): Each must be a csv or excel file.
+            Paths are read from this iterable only as workers become free, so it may be a lazy generator.
+        workers (``int`` >= 1, default ``None``): If given, files are read concurrently by a pool of
+            this many processes, with at most ``2 * workers`` files in flight at a time.
+            All other arguments (e.g. ``fields`` and their cell patterns) must then be picklable.
+
+            * ``None``: read the files one after another, in this process.
+        **kwargs: Any other :obj:`~fuzzytable.FuzzyTable` argument (``sheetname``, ``fields``, ``header_row_seek``...).
+            Each applies to every file.
+
+    Yields:
+        :obj:`FileResult`: one per path; in order of completion if ``workers`` is given, otherwise in order of ``paths``.
+        If a file raises a :obj:`~fuzzytable.exceptions.FuzzyTableError` (e.g. ``InvalidFileError``, ``MissingFieldError``)
+        an ``OSError`` (e.g. ``FileNotFoundError``), or a csv decoding error (``UnicodeError``, ``csv.Error``),
+        the exception is returned as the result's ``error``
+        and the batch continues.
+
+    Raises:
+        :obj:`fuzzytable.exceptions.InvalidWorkersError`: if ``workers`` is not ``None`` or a positive integer.
+        :obj:`fuzzytable.exceptions.FuzzyTableError`: if an argument shared by all files is invalid
+            (e.g. ``InvalidFieldError``, ``ModeError``). Raised immediately, before any file is read.
+    """
+    if workers is not None and not pos_int(workers):
+        raise exceptions.InvalidWorkersError(workers)
+    kwargs = _normalize_kwargs(kwargs)
+    if workers is None:
+        return _iter_files(paths, kwargs)
+    return _iter_files_in_pool(paths, workers, kwargs)
+
+
+def _normalize_kwargs(kwargs) -> Dict:
+    # Validate the settings shared by all files and compile the fields, once per batch.
+    probe = FuzzyTable.__new__(FuzzyTable)
+    fields = probe._configure(
+        kwargs.get('fields'),
+        kwargs.get('approximate_match', False),
+        kwargs.get('min_ratio', DefaultValue),
+        kwargs.get('mode', DefaultValue),
+        kwargs.get('case_sensitive', DefaultValue),
+        kwargs.get('assignment', 'greedy'),
+    )
+    if 'cache_dir' in kwargs:
+        kwargs = {**kwargs, 'cache_dir': get_cache(kwargs['cache_dir'])}
+    return {**kwargs, 'fields': fields}
+
+
+def _iter_files(paths, kwargs) -> Iterator[FileResult]:
+    matchers = {}
+    for path in paths:
+        yield _read_file(path, kwargs, matchers)
+
+
+def _iter_files_in_pool(paths, workers, kwargs) -> Iterator[FileResult]:
+    paths = iter(paths)
+    with ProcessPoolExecutor(workers) as executor:
+        pending = {executor.submit(_read_worker_file, kwargs, path) for path in islice(paths, 2 * workers)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for path in islice(paths, len(done)):
+                    pending.add(executor.submit(_read_worker_file, kwargs, path))
+                for future in done:
+                    yield future.result()
+        finally:
+            # e.g. the caller stopped iterating: don't start the files still queued.
+            for future in pending:
+                future.cancel()
+
+
+def _read_file(path, kwargs, matchers) -> FileResult:
+    kwargs = dict(kwargs)
+    sheetname = kwargs.pop('sheetname', None)
+    if len(matchers) > _MAX_SHARED_MATCHERS:
+        matchers.clear()
+    try:
+        with SheetPattern(path, sheetname).sheet_reader as sheet_reader:
+            table = FuzzyTable._from_sheet_reader(sheet_reader, matchers=matchers, **kwargs)
+    except FILE_ERRORS as error:
+        return FileResult(path, None, error)
+    return FileResult(path, table, None)
+
+
+# State of each pool process. Each task carries its own arguments
+# (ProcessPoolExecutor's initializer needs python 3.7).
+# A workbook (read_workbook only) is loaded on the process's first task for it (so that load errors reach the caller)
+# and is then shared by all of its tasks until the process exits. So are the similarity scorers (read_many).
+_worker_readers: Dict[Union[str, Path], sheetreader.ExcelReader] = {}
+_worker_matchers: Dict = {}
+
+
+def _read_worker_sheet(path, kwargs, sheetname) -> FuzzyTable:
+    reader = _worker_readers.get(path)
+    if reader is None:
+        reader = _worker_readers[path] = sheetreader.ExcelReader(path)
+    return _read_sheet(path, reader.workbook, sheetname, kwargs)
+
+
+def _read_worker_file(kwargs, path) -> FileResult:
+    return _read_file(path, kwargs, _worker_matchers)
+
+
+if __name__ == '__main__':
+    pass
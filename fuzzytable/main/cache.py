@@ -0,0 +1,227 @@
+"""
+Opt-in on-disk cache of extractions: ``FuzzyTable(..., cache_dir=...)``.
+
+An extraction's result (its header row, field matches, and column data) is stored in one file per
+(file, worksheet, fields, options). Reading the same sheet with the same fields and options again
+loads that file instead of parsing the sheet.
+
+- Key: the file's absolute path, size and modification time (or a hash of its contents), the worksheet name,
+  and the fields' match settings and FuzzyTable's header/assignment options. Changing the file changes the key.
+- Value: a pickle of the columns *before* cell patterns are applied. Cell patterns, dictionary encoding,
+  and ``compact`` are applied on every load, so they may change without invalidating the cache
+  (and a field's cell pattern need not be picklable or even deterministic).
+- Writers never leave a partial file behind: each writes a temporary file, then renames it into place.
+  Concurrent writers of the same entry write identical data; the last rename wins.
+- Size-bounded: once the directory holds more than ``max_bytes`` of entries,
+  the least recently used ones are deleted.
+- Best effort: an unreadable entry is a cache miss, and a failed write (e.g. a full disk) is ignored.
+"""
+
+# --- Standard Library Imports ------------------------------------------------
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import List, Optional
+
+# --- Intra-Package Imports ---------------------------------------------------
+from fuzzytable import exceptions
+
+# --- Third Party Imports -----------------------------------------------------
+# None
+
+
+# Bump whenever CacheEntry (or what goes into a key) changes.
+_FORMAT = 1
+_SUFFIX = '.ftcache'
+_TEMP_SUFFIX = '.tmp'
+# Temporary files older than this were left behind by a writer that died mid-write.
+_STALE_TEMP_SECONDS = 24 * 60 * 60
+
+CacheEntry = namedtuple("CacheEntry", "key header_row_num header_ratio row_count fields columns")
+# One stored extraction.
+# fields: one (header, col_num, name, ratio) tuple per SingleField (MultiFields flattened), in data order.
+#     name is None for a header that wasn't matched to a FieldPattern.
+# columns: each SingleField's data, as read from the sheet (before cell patterns are applied).
+
+
+class ExtractionCache:
+    """A directory of stored extractions. Pass one as ``FuzzyTable(cache_dir=...)``.
+
+    ``FuzzyTable(cache_dir=path)`` is short for ``FuzzyTable(cache_dir=ExtractionCache(path))``.
+    Construct one yourself to change the size limit or how changes to a file are detected.
+
+    >>> cache = fuzzytable.ExtractionCache('~/.cache/fuzzytable', max_bytes=2 ** 32)
+    >>> ft = fuzzytable.FuzzyTable('monthly.xlsx', 'Feb', fields=['first_name', 'birthday'], cache_dir=cache)
+
+    Args:
+        directory (path-like :obj:`str`, :obj:`pathlib.Path` object): Created when first written to.
+            Share it between processes as you like. Entries are pickles: only use a directory you trust.
+        max_bytes (``int`` >= 1, default :obj:`ExtractionCache.max_bytes`): size limit of the directory's entries.
+            Past it, the least recently used entries are deleted. An extraction larger than this is never stored.
+        hash_contents (``bool``, default ``False``): How a changed file is detected.
+
+            * ``False``: by its size and modification time. Cheap, whatever the size of the file.
+            * ``True``: by a hash (sha256) of its contents. The file is read in full on each load,
+              which is still far cheaper than parsing it. Use this if files are replaced
+              by copies that keep their size and modification time.
+    """
+
+    # Default size limit of a cache directory (1 GiB).
+    max_bytes = 2 ** 30
+
+    def __init__(self, directory, max_bytes: Optional[int] = None, hash_contents: bool = False) -> None:
+        try:
+            self.directory = Path(directory).expanduser()
+        except TypeError:
+            raise exceptions.InvalidCacheDirError(directory)
+        if max_bytes is not None:
+            if not (isinstance(max_bytes, int) and max_bytes > 0):
+                raise exceptions.InvalidMaxBytesError(max_bytes)
+            self.max_bytes = max_bytes
+        self.hash_contents = hash_contents
+
+    def key(self, sheet_reader, fieldpatterns, header_row, header_row_seek, assignment) -> Optional[str]:
+        """Return the key of an extraction, or ``None`` if the file can't be read.
+
+        (The sheet reader then raises the appropriate error.)
+        """
+        from fuzzytable import __version__
+        try:
+            path = os.path.abspath(sheet_reader.path)
+            if self.hash_contents:
+                signature = _file_digest(path)
+            else:
+                stat = os.stat(path)
+                signature = (stat.st_size, stat.st_mtime_ns)
+        except (OSError, TypeError, ValueError):
+            return None
+        # Everything that decides which header row and which columns are read, and how cells are inferred.
+        # Not cell patterns, dictionary_encode, or compact: those are applied on each load.
+        fields = tuple(
+            (fieldpattern.name, fieldpattern.terms, fieldpattern.mode, fieldpattern.case_sensitive,
+             fieldpattern.min_ratio, fieldpattern.multifield)
+            for fieldpattern in fieldpatterns
+        )
+        return repr((
+            _FORMAT, __version__, path, signature, sheet_reader.sheetname, sheet_reader.literals,
+            header_row, header_row_seek, assignment, fields,
+        ))
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry stored under ``key``, or ``None``."""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as file:
+                entry = pickle.load(file)
+        except Exception:
+            # No entry, or a damaged or foreign one: unpickling can raise almost anything. It's a miss either way.
+            return None
+        if not isinstance(entry, CacheEntry) or entry.key != key:
+            return None
+        try:
+            os.utime(entry_path)  # mark as recently used
+        except OSError:
+            pass
+        return entry
+
+    def store(self, entry: CacheEntry) -> None:
+        """Store ``entry`` (atomically), then evict the least recently used entries if over the size limit."""
+        try:
+            data = pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return  # e.g. an exotic cell value
+        if len(data) > self.max_bytes:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(prefix='.', suffix=_TEMP_SUFFIX, dir=str(self.directory))
+            try:
+                with os.fdopen(descriptor, 'wb') as file:
+                    file.write(data)
+                os.replace(temp_path, str(self._entry_path(entry.key)))
+            except BaseException:
+                _remove(temp_path)
+                raise
+        except OSError:
+            return  # e.g. a full or read-only disk: the table just isn't cached
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the directory is within :attr:`max_bytes`."""
+        now = time.time()
+        entries = []
+        total = 0
+        try:
+            with os.scandir(str(self.directory)) as directory:
+                for dir_entry in directory:
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue  # e.g. just evicted by another process
+                    if dir_entry.name.endswith(_SUFFIX):
+                        entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+                        total += stat.st_size
+                    elif dir_entry.name.endswith(_TEMP_SUFFIX) and now - stat.st_mtime > _STALE_TEMP_SECONDS:
+                        _remove(dir_entry.path)
+        except OSError:
+            return
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, entry_path in entries:
+            _remove(entry_path)
+            total -= size
+            if total <= self.max_bytes:
+                return
+
+    def _entry_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8', 'surrogatepass')).hexdigest()
+        return self.directory / (digest + _SUFFIX)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self.directory)!r}, max_bytes={self.max_bytes})"
+
+
+def get_cache(cache_dir) -> Optional[ExtractionCache]:
+    """Return the ExtractionCache for a ``cache_dir`` argument (``None``: no caching)."""
+    if cache_dir is None or isinstance(cache_dir, ExtractionCache):
+        return cache_dir
+    return ExtractionCache(cache_dir)
+
+
+def make_entry(key: str, sheet_parser, single_fields: List, columns: List) -> CacheEntry:
+    """Return the CacheEntry of an extracted sheet, given each SingleField's column as read."""
+    return CacheEntry(
+        key=key,
+        header_row_num=sheet_parser.header_row_num,
+        header_ratio=sheet_parser.header_row_ratio,
+        row_count=sheet_parser.sheet_summary.row_count,
+        fields=[
+            (field.header, field.col_num, field.name if field.matched else None, field.ratio)
+            for field in single_fields
+        ],
+        columns=columns,
+    )
+
+
+def _file_digest(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _remove(path) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass  # already gone (e.g. evicted by another process)
+
+
+if __name__ == '__main__':
+    pass
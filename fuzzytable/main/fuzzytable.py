@@ -11,8 +11,9 @@ The user can interact with the data in three other ways:
 # --- Standard Library Imports ------------------------------------------------
 import collections
 import reprlib
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Union, Optional, Iterable
+from typing import Union, Optional, Iterable, Iterator, AsyncIterator, Dict, List
 
 # --- Intra-Package Imports ---------------------------------------------------
 from fuzzytable.patterns import \
@@ -24,6 +25,10 @@ from fuzzytable.patterns import \
 from fuzzytable.patterns import fieldpattern as fp
 from fuzzytable.main.string_analysis import mode_setter, DefaultValue
 from fuzzytable.parsers import SheetParser
+from fuzzytable.parsers.sheetparser import pos_int, flatten_fields
+from fuzzytable.parsers.fieldparser import ASSIGNMENTS
+from fuzzytable.main import aio
+from fuzzytable.main import cache as extraction_cache
 from fuzzytable import exceptions
 from fuzzytable import datamodel
 
@@ -68,6 +73,9 @@ class FuzzyTable(collections.abc.Mapping):
         fields (:obj:`str` or iterable thereof, default :obj:`None`)
             * ``None``: extract field_names for each non-``None`` cell in header row.
             * ``str`` or iterable thereof: extract matching field_names matching a cell in the header row.
+            * Each item may also be a :obj:`~fuzzytable.FieldPattern`,
+              or compiled ahead of time by :func:`~fuzzytable.compile_fields`.
+              FieldPattern objects are never modified, so one list can be shared by many tables.
         approximate_match (``bool``, default False): If True, subfields will match if they are at
             least 60% similar to the field names supplied. This cutout value can be set with min_ratio.
             *Deprecated in v0.18. To be removed in v1.0. Use* ``mode`` *instead.*
@@ -78,6 +86,22 @@ class FuzzyTable(collections.abc.Mapping):
             ``mode`` overrides approximate_match and contains_match.
         case_sensitive (None or ``bool``, default ``True``): Used when seeking header row and
             matching Fields to FieldPatterns.
+        compact (``bool``, default ``False``): If True, store column data compactly where possible,
+            e.g. integer columns as ``array('q')`` and repetitive string columns dictionary-encoded.
+            See :obj:`~fuzzytable.datamodel.columns.compact_column`.
+            Column data is then a read-only sequence rather than a ``list``.
+        assignment (``str``, default ``'greedy'``): How headers are assigned to fields.
+
+            * ``'greedy'``: the best-matching (field, header) pair first, then the next best, and so on.
+            * ``'optimal'``: the assignment with the highest total match ratio.
+              Use this when headers are near-duplicates of one another and greedy matching picks the wrong columns.
+              For example, given headers ``'Cust.'`` and ``'Customer'``, greedy matching gives ``'Customer'``
+              to the ``customer`` field, leaving nothing for ``customer_name``.
+        cache_dir (path-like :obj:`str`, :obj:`pathlib.Path` object, or :obj:`~fuzzytable.ExtractionCache`,
+            default ``None``): If given, store the extraction (header row, field matches, and column data) in
+            this directory. The next time the same file (unchanged) is read with the same fields and options,
+            the table is loaded from there instead of being parsed again.
+            Cell patterns are still applied on each load. See :obj:`~fuzzytable.ExtractionCache`.
 
     Attributes:
         records: Return :obj:`~fuzzytable.datamodel.Records` object,
@@ -107,34 +131,111 @@ class FuzzyTable(collections.abc.Mapping):
             missingfieldserror_active=False,
             mode=DefaultValue,  # API Change: change default to 'exact'
             case_sensitive=DefaultValue,
+            compact=False,
+            assignment='greedy',
+            cache_dir=None,
     ):
-
-        #################################################
-        # Values that can be overridden by FieldPattern #
-        #################################################
-        self.min_ratio = min_ratio
-        self._mode = mode_setter(mode, approximate_match, False)
-        self._case_sensitive = fp.casesensitive_setter(case_sensitive)
-
-        #################
-        # FieldPatterns #
-        #################
-        if fields is None:
-            fieldpatterns = []
-        elif isinstance(fields, (str, FieldPattern)):
-            fieldpatterns = [fields]
-        else:
-            try:
-                fieldpatterns = list(fields)
-            except TypeError:
-                raise exceptions.InvalidFieldError(fields)
-        fieldpatterns = [normalize_fieldpattern(self, field) for field in fieldpatterns]
+        steps = self._iter_load(
+            path, sheetname, fields, header_row, header_row_seek, name, approximate_match, min_ratio,
+            missingfieldserror_active, mode, case_sensitive, compact, assignment, cache_dir,
+        )
+        for _ in steps:
+            pass  # the data is read in a single step
+
+    def _iter_load(
+            self,
+            path,
+            sheetname=None,
+            fields=None,
+            header_row=None,
+            header_row_seek=False,
+            name=None,
+            approximate_match=False,
+            min_ratio=DefaultValue,
+            missingfieldserror_active=False,
+            mode=DefaultValue,
+            case_sensitive=DefaultValue,
+            compact=False,
+            assignment='greedy',
+            cache_dir=None,
+            chunksize=None,
+    ) -> Iterator[int]:
+        # Generator form of __init__, run step by step by aload. See _iter_extract.
+        fieldpatterns = self._configure(fields, approximate_match, min_ratio, mode, case_sensitive, assignment)
+        with SheetPattern(path, sheetname).sheet_reader as sheet_reader:
+            yield from self._iter_extract(
+                sheet_reader, fieldpatterns, header_row, header_row_seek, missingfieldserror_active, name, compact,
+                chunksize=chunksize, cache_dir=cache_dir,
+            )
+
+    @classmethod
+    def _from_sheet_reader(
+            cls,
+            sheet_reader,
+            fields=None,
+            header_row=None,
+            header_row_seek=False,
+            name=None,
+            approximate_match=False,
+            min_ratio=DefaultValue,
+            missingfieldserror_active=False,
+            mode=DefaultValue,
+            case_sensitive=DefaultValue,
+            compact=False,
+            assignment='greedy',
+            cache_dir=None,
+            matchers=None,
+    ) -> 'FuzzyTable':
+        # Like FuzzyTable(path, sheetname, ...), but read from an already open sheet reader,
+        # e.g. one of several readers sharing a workbook (see batch.read_workbook).
+        # matchers: see SheetParser. Batches share one dictionary across many sheets.
+        fuzzytable = cls.__new__(cls)
+        fieldpatterns = fuzzytable._configure(fields, approximate_match, min_ratio, mode, case_sensitive, assignment)
+        steps = fuzzytable._iter_extract(
+            sheet_reader, fieldpatterns, header_row, header_row_seek, missingfieldserror_active, name, compact, matchers,
+            cache_dir=cache_dir,
+        )
+        for _ in steps:
+            pass
+        return fuzzytable
+
+    def _iter_extract(
+            self, sheet_reader, fieldpatterns, header_row, header_row_seek, missingfieldserror_active, name, compact,
+            matchers=None, chunksize=None, cache_dir=None,
+    ) -> Iterator[int]:
+        # The first step finds the header row and matches the fields (yields 0).
+        # Each later step reads (up to) chunksize rows of data (yields the number read).
+        # The data model is built once the generator is exhausted.
+        # Loaded from the cache (cache_dir), the first step restores the header row and fields instead,
+        # and there are no later steps.
+
+        #########
+        # Cache #
+        #########
+        cache = extraction_cache.get_cache(cache_dir)
+        cache_key = None
+        cache_entry = None
+        if cache is not None:
+            cache_key = cache.key(sheet_reader, fieldpatterns, header_row, header_row_seek, self.assignment)
+            if cache_key is not None:
+                cache_entry = cache.load(cache_key)
 
         ###############
         # SheetParser #
         ###############
-        sheet_reader = SheetPattern(path, sheetname).sheet_reader
-        sheet_parser = SheetParser(sheet_reader, fieldpatterns, header_row, header_row_seek)
+        if cache_entry is None:
+            sheet_parser = SheetParser(
+                sheet_reader, fieldpatterns, header_row, header_row_seek, matchers, self.assignment
+            )
+        else:
+            sheet_parser = SheetParser.from_cache(sheet_reader, fieldpatterns, cache_entry)
+        check_missing_fields(sheet_parser, fieldpatterns, missingfieldserror_active, name)
+        yield 0
+        raw_columns = [] if cache_key is not None and cache_entry is None else None
+        yield from sheet_parser.iter_extract(compact, chunksize, raw_columns)
+        if raw_columns is not None:
+            single_fields = flatten_fields(sheet_parser.fields)
+            cache.store(extraction_cache.make_entry(cache_key, sheet_parser, single_fields, raw_columns))
 
         ##############
         # Data Model #
@@ -148,14 +249,190 @@ class FuzzyTable(collections.abc.Mapping):
             for field in self.fields
         }
 
-        #####################
-        # MissingFieldError #
-        #####################
-        actualfields = set(self.keys())
-        expectedfields = set(fieldpattern.name for fieldpattern in fieldpatterns)
-        missingfieldnames = expectedfields - actualfields
-        if fieldpatterns and missingfieldserror_active and missingfieldnames:
-            raise exceptions.MissingFieldError(missingfieldnames=missingfieldnames, fuzzytablename=name)
+    @classmethod
+    def stream(cls, path: Union[str, Path], *args, include_row_num=True, **kwargs) -> Iterator[Dict]:
+        """Lazily yield records (rows) from a spreadsheet too large to load at once.
+
+        Takes the same arguments as :obj:`~fuzzytable.FuzzyTable`.
+        The header row is found and the fields are matched exactly as they would be for
+        :obj:`~fuzzytable.FuzzyTable`. Then each row is read, normalized, and yielded one at a time,
+        so memory use does not grow with the number of rows.
+
+        >>> for record in FuzzyTable.stream('birthdays.csv', fields=['first_name', 'birthday']):
+        ...     print(record)
+        ...
+        {'first_name': 'John', 'birthday': '1-Jan-01', 'row': 2}
+        {'first_name': 'Typhoid', 'birthday': '2-Aug-83', 'row': 3}
+        {'first_name': 'Jane', 'birthday': '3-Feb-17', 'row': 4}
+
+        Args:
+            include_row_num (``bool``, default ``True``): If True, each record has an additional ``'row'`` key.
+                See :obj:`Records.include_row_num<fuzzytable.datamodel.Records.include_row_num>`.
+
+        Yields:
+            ``dict``: one record per row, identical to those of :obj:`FuzzyTable.records<fuzzytable.datamodel.Records>`.
+
+        Note:
+            Like any generator, nothing is read (and no exceptions are raised) until the first record is requested.
+        """
+        with cls._matched_sheet(path, *args, **kwargs) as sheet_parser:
+            yield from sheet_parser.iter_records(include_row_num)
+
+    @classmethod
+    def chunks(cls, path: Union[str, Path], *args, chunksize=1000, include_row_num=True, **kwargs) -> Iterator[Dict]:
+        """Lazily yield the table in blocks of ``chunksize`` rows.
+
+        Takes the same arguments as :obj:`~fuzzytable.FuzzyTable`.
+        Each block is a dictionary like :obj:`~fuzzytable.FuzzyTable` itself
+        (keys are field names; values are lists of column data), but holds only ``chunksize`` rows.
+        This suits bulk database inserts and other column-oriented processing of very large sheets.
+
+        >>> for chunk in FuzzyTable.chunks('birthdays.csv', fields=['first_name', 'birthday'], chunksize=2):
+        ...     print(chunk)
+        ...
+        {'first_name': ['John', 'Typhoid'], 'birthday': ['1-Jan-01', '2-Aug-83'], 'row': [2, 3]}
+        {'first_name': ['Jane'], 'birthday': ['3-Feb-17'], 'row': [4]}
+
+        Args:
+            chunksize (``int`` >= 1, default ``1000``): number of rows per block. The last block may be shorter.
+            include_row_num (``bool``, default ``True``): If True, each block has an additional ``'row'`` column.
+
+        Yields:
+            ``dict``: field name / column data (``list``) pairs.
+        """
+        if not pos_int(chunksize):
+            raise exceptions.InvalidChunksizeError(chunksize)
+        with cls._matched_sheet(path, *args, **kwargs) as sheet_parser:
+            yield from sheet_parser.iter_chunks(chunksize, include_row_num)
+
+    @classmethod
+    async def aload(
+            cls,
+            path: Union[str, Path],
+            *args,
+            chunksize=10_000,
+            executor=None,
+            semaphore=None,
+            **kwargs
+    ) -> 'FuzzyTable':
+        """Asynchronous :obj:`~fuzzytable.FuzzyTable`: extract a table without blocking the event loop.
+
+        Takes the same arguments as :obj:`~fuzzytable.FuzzyTable`, and returns the same table.
+        The header seek (and field matching), then each block of ``chunksize`` data rows,
+        run one after another in ``executor``.
+        Cancelling the awaiting task stops the extraction after the step in progress.
+
+        >>> limit = asyncio.Semaphore(4)
+        >>> tables = await asyncio.gather(*(
+        ...     FuzzyTable.aload(path, fields=['first_name', 'birthday'], semaphore=limit)
+        ...     for path in paths
+        ... ))
+
+        Args:
+            chunksize (``int`` >= 1, default ``10_000``): number of rows read per step.
+            executor (:obj:`concurrent.futures.Executor`, default ``None``): ``None``: the event loop's default executor.
+            semaphore (:obj:`asyncio.Semaphore`, default ``None``): If given, the extraction waits for
+                (and holds) the semaphore. Share one semaphore among many loads to limit how many run at once.
+        """
+        if not pos_int(chunksize):
+            raise exceptions.InvalidChunksizeError(chunksize)
+        fuzzytable = cls.__new__(cls)
+        async with aio.limit(semaphore):
+            await aio.run_steps(fuzzytable._iter_load(path, *args, chunksize=chunksize, **kwargs), executor)
+        return fuzzytable
+
+    @classmethod
+    async def astream(
+            cls,
+            path: Union[str, Path],
+            *args,
+            include_row_num=True,
+            chunksize=1000,
+            executor=None,
+            semaphore=None,
+            **kwargs
+    ) -> AsyncIterator[Dict]:
+        """Asynchronous :obj:`~fuzzytable.FuzzyTable.stream`: lazily yield records without blocking the event loop.
+
+        Takes the same arguments as :obj:`~fuzzytable.FuzzyTable.stream`, and yields the same records.
+        Records are read in blocks of ``chunksize`` rows, each in ``executor``.
+
+        >>> async for record in FuzzyTable.astream('birthdays.csv', fields=['first_name', 'birthday']):
+        ...     print(record)
+        ...
+        {'first_name': 'John', 'birthday': '1-Jan-01', 'row': 2}
+        {'first_name': 'Typhoid', 'birthday': '2-Aug-83', 'row': 3}
+        {'first_name': 'Jane', 'birthday': '3-Feb-17', 'row': 4}
+
+        Args:
+            chunksize (``int`` >= 1, default ``1000``): number of rows read per step.
+            executor: see :obj:`~fuzzytable.FuzzyTable.aload`.
+            semaphore: see :obj:`~fuzzytable.FuzzyTable.aload`. It is held until the stream ends (or is closed).
+        """
+        if not pos_int(chunksize):
+            raise exceptions.InvalidChunksizeError(chunksize)
+        records = cls.stream(path, *args, include_row_num=include_row_num, **kwargs)
+        async with aio.limit(semaphore):
+            batches = aio.iter_steps(aio.batched(records, chunksize), executor)
+            try:
+                async for batch in batches:
+                    for record in batch:
+                        yield record
+            finally:
+                await batches.aclose()
+
+    @classmethod
+    @contextmanager
+    def _matched_sheet(
+            cls,
+            path,
+            sheetname=None,
+            fields=None,
+            header_row=None,
+            header_row_seek=False,
+            name=None,
+            approximate_match=False,
+            min_ratio=DefaultValue,
+            missingfieldserror_active=False,
+            mode=DefaultValue,
+            case_sensitive=DefaultValue,
+            compact=False,  # not applicable: streamed data is never stored
+            assignment='greedy',
+            cache_dir=None,  # not applicable: streamed data is never stored
+    ) -> SheetParser:
+        # Find the header row and match the fields, but leave the data unread.
+        # The sheet stays open until the with block ends.
+        fuzzytable = cls.__new__(cls)
+        fuzzytable.name = name
+        fieldpatterns = fuzzytable._configure(fields, approximate_match, min_ratio, mode, case_sensitive, assignment)
+        with SheetPattern(path, sheetname).sheet_reader as sheet_reader:
+            sheet_parser = SheetParser(
+                sheet_reader, fieldpatterns, header_row, header_row_seek, assignment=fuzzytable.assignment
+            )
+            check_missing_fields(sheet_parser, fieldpatterns, missingfieldserror_active, name)
+            yield sheet_parser
+
+    def _configure(
+            self, fields, approximate_match, min_ratio, mode, case_sensitive, assignment='greedy'
+    ) -> List[FieldPattern]:
+        # Store the FuzzyTable-wide settings and return the normalized FieldPatterns.
+
+        if assignment not in ASSIGNMENTS:
+            raise exceptions.InvalidAssignmentError(assignment)
+        self.assignment = assignment
+
+        #################################################
+        # Values that can be overridden by FieldPattern #
+        #################################################
+        self.min_ratio = min_ratio
+        self._mode = mode_setter(mode, approximate_match, False)
+        self._case_sensitive = fp.casesensitive_setter(case_sensitive)
+
+        #################
+        # FieldPatterns #
+        #################
+        # Compiled, so that the caller's FieldPattern objects are left untouched.
+        return [fp.compile_field(field, self) for field in fp.force_fields(fields)]
 
     @property
     def case_sensitive(self):
@@ -211,12 +488,13 @@ class FuzzyTable(collections.abc.Mapping):
         return self._fields_dict.get(fieldname)
 
 
-def normalize_fieldpattern(fuzzytable: FuzzyTable, field: Union[str, FieldPattern]) -> FieldPattern:
-    if isinstance(field, str):
-        fieldpattern = FieldPattern(name=field)
-        return normalize_fieldpattern(fuzzytable, fieldpattern)
-    elif isinstance(field, FieldPattern):
-        field.fuzzytable = fuzzytable
-        return field
-    else:
-        raise exceptions.InvalidFieldError(field)
+def check_missing_fields(sheet_parser: SheetParser, fieldpatterns, missingfieldserror_active, fuzzytablename):
+
+    #####################
+    # MissingFieldError #
+    #####################
+    actualfields = set(field.name for field in sheet_parser.fields)
+    expectedfields = set(fieldpattern.name for fieldpattern in fieldpatterns)
+    missingfieldnames = expectedfields - actualfields
+    if fieldpatterns and missingfieldserror_active and missingfieldnames:
+        raise exceptions.MissingFieldError(missingfieldnames=missingfieldnames, fuzzytablename=fuzzytablename)
@@ -0,0 +1,236 @@
+"""
+Precompiled lookup structures for matching a cell string against many search terms.
+
+``string_analysis.get_bestkey`` re-scans every key and search term for every cell.
+The matchers here do that work once, up front, so that the per-cell cost
+no longer depends on the number of choices.
+Results are identical to ``get_bestkey``: the first key (in dictionary order) with a matching term wins.
+"""
+
+# --- Standard Library Imports ------------------------------------------------
+from typing import Dict, List
+from collections import Counter, defaultdict
+
+# --- Intra-Package Imports ---------------------------------------------------
+from fuzzytable.main.string_analysis import BestKey, NoMatch
+from fuzzytable.main import similarity
+
+# --- Third Party Imports -----------------------------------------------------
+# None
+
+
+NO_KEY = float("inf")  # key index meaning "no key"
+
+
+class ExactMatcher:
+    """Hash map from (normalized) search term to key."""
+
+    def __init__(self, search_dict: Dict, case_sensitive=True):
+        self.case_sensitive = case_sensitive
+        self._lookup = {}
+        for key, search_terms in search_dict.items():
+            for search_term in search_terms:
+                if not case_sensitive:
+                    search_term = search_term.lower()
+                self._lookup.setdefault(search_term, key)  # first key wins
+
+    def get_bestkey(self, target: str):
+        if not self.case_sensitive:
+            target = target.lower()
+        try:
+            return BestKey(self._lookup[target], 1.0)
+        except KeyError:
+            return NoMatch
+
+
+class ContainsMatcher:
+    """Aho-Corasick automaton finding the first key having a search term contained in the target.
+
+    Matching costs O(len(target)), regardless of the number of search terms.
+    With only a few search terms, plain ``in`` checks are faster, so those are used instead.
+    """
+
+    max_simple_terms = 8
+
+    def __init__(self, search_dict: Dict, case_sensitive=True):
+        self.case_sensitive = case_sensitive
+        self._keys = list(search_dict.keys())
+
+        # (normalized term, key index) pairs, in search order
+        terms = []
+        for key_index, search_terms in enumerate(search_dict.values()):
+            for search_term in search_terms:
+                if not isinstance(search_term, str):
+                    continue  # a non-string is never contained in a string
+                if not case_sensitive:
+                    search_term = search_term.lower()
+                terms.append((search_term, key_index))
+
+        if len(terms) <= self.max_simple_terms:
+            self._terms = terms
+            self._automaton = None
+        else:
+            self._terms = None
+            self._automaton = _Automaton(terms)
+
+    def get_bestkey(self, target: str):
+        if not self.case_sensitive:
+            target = target.lower()
+        if self._automaton is None:
+            for search_term, key_index in self._terms:
+                if search_term in target:
+                    return BestKey(self._keys[key_index], 1.0)
+            return NoMatch
+        key_index = self._automaton.first_key_index(target)
+        if key_index == NO_KEY:
+            return NoMatch
+        return BestKey(self._keys[key_index], 1.0)
+
+
+class _Automaton:
+    # Aho-Corasick automaton. Each state's output is the lowest key index
+    # of all terms ending at that state (including those reached through failure links).
+
+    def __init__(self, terms: List):
+        goto = [{}]
+        output = [NO_KEY]
+        for term, key_index in terms:
+            state = 0
+            for char in term:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(NO_KEY)
+                state = next_state
+            output[state] = min(output[state], key_index)
+
+        # Breadth-first construction of the failure links.
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] = min(output[next_state], output[fail[next_state]])
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def first_key_index(self, target: str):
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        best = output[0]  # the empty term, if any, is in every target
+        state = 0
+        for char in target:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state] < best:
+                best = output[state]
+                if best == 0:
+                    break
+        return best
+
+
+class ApproxMatcher:
+    """Candidate-pruning index for approximate (``SequenceMatcher.ratio``) matching.
+
+    Full ratios come from the active :mod:`~fuzzytable.main.similarity` backend.
+
+    Search terms are bucketed by length and their character counts are precomputed.
+    For each target, buckets are visited in order of their best possible ratio
+    (``real_quick_ratio``, which depends only on the lengths).
+    Within a bucket, a term's ``quick_ratio`` is computed from the character counts.
+    Only terms whose upper bound could still beat (or, for an earlier key, tie) the best ratio so far
+    get the full, expensive ``ratio()`` calculation.
+    """
+
+    def __init__(self, search_dict: Dict, case_sensitive=True, min_ratio=0.0):
+        self.case_sensitive = case_sensitive
+        self.min_ratio = min_ratio
+        self._keys = list(search_dict.keys())
+        self._exact = {}  # term: lowest key index
+        for key_index, search_terms in enumerate(search_dict.values()):
+            for search_term in search_terms:
+                if not case_sensitive:
+                    search_term = search_term.lower()
+                self._exact.setdefault(search_term, key_index)
+        self._buckets = defaultdict(list)  # term length: [(term, key index, char counts), ...]
+        for search_term, key_index in self._exact.items():
+            self._buckets[len(search_term)].append((search_term, key_index, Counter(search_term)))
+
+    def get_bestkey(self, target: str):
+        if not self.case_sensitive:
+            target = target.lower()
+
+        # An identical term always wins (ratio 1.0); the earliest key holding it is stored.
+        key_index = self._exact.get(target)
+        if key_index is not None:
+            return BestKey(self._keys[key_index], 1.0)
+
+        min_ratio = self.min_ratio
+        target_len = len(target)
+        bucket_bounds = sorted(
+            (
+                (_calculate_ratio(min(term_len, target_len), term_len + target_len), term_len)
+                for term_len in self._buckets
+            ),
+            reverse=True,
+        )
+        best_ratio = 0.0
+        best_key_index = NO_KEY
+        target_counts = None
+        score = None
+        for length_bound, term_len in bucket_bounds:
+            if length_bound < min_ratio or length_bound < best_ratio:
+                break  # remaining buckets are even worse
+            for term, key_index, term_counts in self._buckets[term_len]:
+                if length_bound == best_ratio and key_index >= best_key_index:
+                    continue
+                if target_counts is None:
+                    target_counts = Counter(target)
+                matches = 0
+                for char, count in term_counts.items():
+                    target_count = target_counts[char]
+                    matches += count if count < target_count else target_count
+                quick_ratio = _calculate_ratio(matches, term_len + target_len)
+                if quick_ratio < min_ratio or quick_ratio < best_ratio:
+                    continue
+                if quick_ratio == best_ratio and key_index >= best_key_index:
+                    continue
+                if score is None:
+                    score = similarity.get_backend().scorer(target)
+                ratio = score(term, min_ratio)
+                if ratio < min_ratio:
+                    continue
+                if ratio > best_ratio or (ratio == best_ratio and best_ratio > 0 and key_index < best_key_index):
+                    best_ratio = ratio
+                    best_key_index = key_index
+
+        if best_key_index == NO_KEY:
+            return NoMatch
+        return BestKey(self._keys[best_key_index], best_ratio)
+
+
+def _calculate_ratio(matches, length):
+    # Same arithmetic as difflib, so bounds compare exactly with SequenceMatcher ratios.
+    if length:
+        return 2.0 * matches / length
+    return 1.0
+
+
+def get_matcher(search_dict: Dict, mode: str, case_sensitive=True, min_ratio=0.0):
+    """Return a precompiled matcher for ``'exact'``, ``'contains'``, or ``'approx'`` mode."""
+    if mode == 'exact':
+        return ExactMatcher(search_dict, case_sensitive)
+    elif mode == 'contains':
+        return ContainsMatcher(search_dict, case_sensitive)
+    else:  # i.e. mode == 'approx', just like get_bestkey.
+        return ApproxMatcher(search_dict, case_sensitive, min_ratio)
@@ -4,11 +4,19 @@ Interface between the csv/excel files and the rest of FuzzyTable
 
 # --- Standard Library Imports ------------------------------------------------
 import csv
-from contextlib import contextmanager
-from ast import literal_eval
+import io
+import locale
+import zipfile
+from contextlib import contextmanager, closing
+from operator import itemgetter
+from itertools import chain, islice
+from collections import namedtuple
+from typing import Iterator
 
 # --- Intra-Package Imports ---------------------------------------------------
 from fuzzytable import exceptions
+from fuzzytable.main.typeinference import infer_column
+from fuzzytable.patterns.cellpattern import get_column_function
 
 # --- Third Party Imports -----------------------------------------------------
 from openpyxl.worksheet.worksheet import Worksheet as openpyxlWorksheet
@@ -17,23 +25,84 @@ from openpyxl.utils.exceptions import InvalidFileException
 
 from fuzzytable.main.utils import force_list
 
+ColumnChunk = namedtuple("ColumnChunk", "row_count columns")
 INFINITY = float("inf")
 NEG_INFINITY = float("-inf")
 
 
 class SheetReader:
+    # Head buffer:
+    # The first rows read (the header seek window, the header row) are kept in self._head.
+    # They are read by a single pass over the whole sheet (self._live), which is then left open.
+    # Bounded reads (reader[n], iter_row(end_row=n)) are served from the buffer, extending it as needed.
+    # The first unbounded read (data extraction, streaming) takes over the open pass:
+    # it yields the buffered rows, then continues reading where the buffer stops.
+    # So a FuzzyTable opens its file once and reads each row once.
+    # Any read that the buffer can't serve once the open pass is gone starts a new pass (_iter_file_rows).
+
+    # If True, cells such as '1, 2, 3' or '[1, 2]' are evaluated to python literals
+    # (see typeinference.infer_value). On by default for backwards compatibility.
+    literals = True
 
     def __init__(self, path, sheetname=None) -> None:
         self.path = path
         self._row_count = None
         self.sheetname = sheetname
+        self._head = []  # the first rows of the sheet
+        self._head_is_sheet = False  # True once self._head holds every row
+        self._live = None  # the open pass that is filling self._head
+
+    def iter_row(self, start_row=None, end_row=None) -> Iterator:
+        # Return an iterator over rows start_row to end_row (1-indexed, inclusive).
+        if start_row is None or start_row < 1:
+            start_row = 1
+        if end_row is None:
+            end_row = INFINITY
+        head = self._head
+
+        # --- bounded read: from the head buffer ------------------------------
+        if end_row <= len(head) or self._head_is_sheet:
+            return iter(head[start_row - 1:None if end_row == INFINITY else end_row])
+        if end_row < INFINITY and (self._live is not None or not head):
+            return iter(self.head(end_row)[start_row - 1:])
+
+        # --- unbounded read: take over the open pass -------------------------
+        live, self._live = self._live, None
+        if live is not None:
+            # Chaining straight into the generator (rather than yielding from a wrapper)
+            # keeps the per-row overhead of data extraction at a single generator resume.
+            skip = start_row - 1 - len(head)
+            return chain(head[start_row - 1:], live if skip <= 0 else islice(live, skip, None))
 
-    def iter_row(self, start_row=None, end_row=None):
-        # Generator Function for looping over rows
+        # --- new pass ---------------------------------------------------------
+        return self._iter_file_rows(start_row, end_row)
+
+    def head(self, row_count):
+        # Return the first row_count rows as a list (all rows, if the sheet is shorter).
+        # Only rows not already buffered are read.
+        head = self._head
+        missing = row_count - len(head)
+        if missing > 0 and not self._head_is_sheet:
+            if self._live is None and not head:
+                self._live = self._iter_file_rows()
+            if self._live is not None:
+                head.extend(islice(self._live, missing))
+            else:
+                # The open pass was taken over. Read the missing rows anew.
+                with closing(self._iter_file_rows(len(head) + 1, row_count)) as rows:
+                    head.extend(rows)
+            if len(head) < row_count:
+                self._head_is_sheet = True
+                self._close_live()
+        return head[:row_count]
+
+    def _iter_file_rows(self, start_row=None, end_row=None):
+        # Generator function for looping over rows, read from the file.
         if start_row is None:
             start_row = NEG_INFINITY
         if end_row is None:
             end_row = INFINITY
+        row_num = 0
         with self.get_filereader() as filereader:
             for row_num, row in enumerate(filereader, 1):
                 if row_num > end_row:
@@ -42,31 +111,39 @@ class SheetReader:
                     yield row
         self._row_count = row_num
 
-    def iter_row_str(self, end_row=None):
-        # Generator function for looping over row repr's
-        for row in self.iter_row(end_row=end_row):
-            yield repr(row)
-
-    def get_row_str(self, row_num):
-        # Use this only when you only care about this row and no other.
-        # When looping to find best fit, use self.iter_row_str instead.
-        row = self[row_num]
-        return repr(row)
-
     def get_col(self, col_num, start_row=1, cellpatterns=None):
         # Return column values as list
-        col_index = col_num - 1
-        values = [row[col_index] for row in self.iter_row(start_row=start_row)]
-        cellpatterns = force_list(cellpatterns)
-        cellpatterns.insert(0, _eval)
-        for cellpattern in cellpatterns:
-            for index, value in enumerate(values):
-                new_val = cellpattern(value)
-                values[index] = new_val
-            # NOTE: the above for loop replace the below comprehension for debugging purposes.
-            # I plan to change it back eventually
-            # values = [cellpattern(value) for value in values]
-        return values
+        return self.get_cols([col_num], start_row=start_row, cellpatterns=[cellpatterns])[0]
+
+    def get_cols(self, col_nums, start_row=1, cellpatterns=None):
+        # Return several columns' values as lists, reading the sheet only once.
+        # The pass runs to the end of the sheet, so it also populates self._row_count.
+        for chunk in self.iter_col_chunks(col_nums, start_row=start_row, cellpatterns=cellpatterns):
+            return chunk.columns
+
+    def iter_col_chunks(self, col_nums, start_row=1, cellpatterns=None, chunksize=None):
+        # Generator yielding ColumnChunks of (up to) chunksize rows each. All rows at once if chunksize is None.
+        # ``cellpatterns`` holds one entry (None, callable, or list thereof) per column.
+        col_indexes = [col_num - 1 for col_num in col_nums]
+        if cellpatterns is None:
+            cellpatterns = [None] * len(col_indexes)
+        rows = self.iter_row(start_row=start_row)
+        while True:
+            try:
+                row_count, columns = _read_columns(islice(rows, chunksize), col_indexes)
+            except IndexError:
+                # A (csv) row too short to hold one of the columns.
+                raise exceptions.InvalidFileError(self.path)
+            if row_count or chunksize is None:
+                yield ColumnChunk(
+                    row_count=row_count,
+                    columns=[
+                        _apply_cellpatterns(values, col_cellpatterns, self.literals)
+                        for values, col_cellpatterns in zip(columns, cellpatterns)
+                    ],
+                )
+            if chunksize is None or row_count < chunksize:
+                return
 
     @property
     def row_count(self):
@@ -78,37 +155,141 @@ class SheetReader:
             return self._row_count
 
     def __getitem__(self, desired_row_num):
-        for cur_row_num, row in enumerate(self.iter_row(), 1):
-            if cur_row_num == desired_row_num:
-                return row
+        for row in self.iter_row(start_row=desired_row_num, end_row=desired_row_num):
+            return row
+        return None
 
     @contextmanager
     def get_filereader(self):
-        file = open(self.path)
-        yield csv.reader(file)
-        file.close()
+        with open(self.path) as file:
+            yield csv.reader(file)
+
+    def close(self):
+        # Release any file handles held between passes.
+        self._close_live()
+
+    def _close_live(self):
+        if self._live is not None:
+            self._live.close()
+            self._live = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     # def __repr__(self):
     #     return get_repr(self)  # pragma: no cover
 
 
 class CsvReader(SheetReader):
+    # Row index:
+    # Most reads are served by the head buffer and its single open pass (see SheetReader).
+    # When a new pass must read a bounded range of rows (e.g. reader[n] beyond the buffer),
+    # CsvReader records the byte offset at which each record starts.
+    # Later new passes (reader[n], iter_row(start_row=n)) seek straight
+    # to the nearest indexed row instead of re-reading the file from the top.
+    # Unbounded passes run at full csv.reader speed and don't extend the index.
+
+    def __init__(self, path, sheetname=None, row_index=True) -> None:
+        super().__init__(path, sheetname)
+        self.row_index = row_index
+        self.encoding = locale.getpreferredencoding(False)  # same as open(path) would use
+        self._row_offsets = [0]  # _row_offsets[i] is the byte offset of row i + 1
+
+    def _iter_file_rows(self, start_row=None, end_row=None):
+        if not self.row_index:
+            yield from super()._iter_file_rows(start_row=start_row, end_row=end_row)
+            return
+        if start_row is None or start_row < 1:
+            start_row = 1
+        if end_row is None:
+            end_row = INFINITY
+        known_row_num = min(start_row, len(self._row_offsets))
+        row_num = known_row_num - 1
+        with open(self.path, 'rb') as file:
+            file.seek(self._row_offsets[row_num])
+
+            # --- unbounded pass: no indexing -----------------------------
+            if end_row == INFINITY:
+                with io.TextIOWrapper(file, encoding=self.encoding) as text_file:
+                    for row in csv.reader(text_file):
+                        row_num += 1
+                        if row_num >= start_row:
+                            yield row
+                self._row_count = row_num
+                return
+
+            # --- bounded pass: index each record start -------------------
+            lines = _OffsetLines(file, self.encoding)
+            for row in csv.reader(lines):
+                row_num += 1
+                if lines.exact and row_num == len(self._row_offsets):
+                    # lines.offset is where the next record begins
+                    self._row_offsets.append(lines.offset)
+                if row_num >= start_row:
+                    yield row
+                if row_num >= end_row:
+                    return
+        self._row_count = row_num
+
     # def get_col(self, start_row, col_num, cellpatterns=None):
     #     cellpatterns = force_list(cellpatterns)
-    #     # cellpatterns.insert(0, _eval)
     #     return super().get_col(start_row=start_row, col_num=col_num, cellpatterns=cellpatterns)
-    pass
+
+
+class _OffsetLines:
+    # Decode a binary csv file line by line, tracking the byte offset just past the last line read.
+    # Newlines are translated exactly as a text-mode open(path) would.
+
+    def __init__(self, file, encoding):
+        self.file = file
+        self.encoding = encoding
+        self.offset = file.tell()
+        self.exact = True  # False once offsets no longer line up with csv records
+
+    def __iter__(self):
+        for line in self.file:
+            self.offset += len(line)
+            line = line.decode(self.encoding)
+            if '\r' in line:
+                line = line.replace('\r\n', '\n').replace('\r', '\n')
+                if line.find('\n') != len(line) - 1:
+                    # Lone carriage returns: several text lines share one binary line.
+                    self.exact = False
+                    yield from line.splitlines(keepends=True)
+                    continue
+            yield line
 
 
 class ExcelReader(SheetReader):
+    # The workbook is opened once, on first use, and reused for every pass
+    # (header lookup, header seek, data extraction) until close() is called.
+    # In read-only mode, openpyxl parses the shared strings and styles at load time
+    # and re-streams the worksheet xml on each iteration.
+    # Several readers (one per worksheet) can share one loaded workbook.
+    # A shared workbook is left open by close(); its owner closes it.
+
+    def __init__(self, path, sheetname=None, workbook=None) -> None:
+        super().__init__(path, sheetname)
+        self._workbook = workbook
+        self._owns_workbook = workbook is None
+
+    @property
+    def workbook(self):
+        if self._workbook is None:
+            try:
+                self._workbook = load_workbook(self.path, read_only=True)  # Lazy loader
+            except (InvalidFileException, zipfile.BadZipFile, KeyError):
+                # Not a zip archive, or one without the parts of a workbook.
+                raise exceptions.InvalidFileError(self.path)
+        return self._workbook
 
     @contextmanager
     def get_filereader(self):
         try:
-            wb = load_workbook(self.path, read_only=True)  # Lazy loader
-            ws: openpyxlWorksheet = wb[self.sheetname]
-        except InvalidFileException:
-            raise exceptions.InvalidFileError(self.path)
+            ws: openpyxlWorksheet = self.workbook[self.sheetname]
         except KeyError:
             # worksheet not found
             raise exceptions.SheetnameError(self.path, self.sheetname)
@@ -116,29 +297,39 @@ class ExcelReader(SheetReader):
         # row = [cell.value for cell in row]
         # yield row
 
+    def close(self):
+        super().close()
+        if self._workbook is not None and self._owns_workbook:
+            self._workbook.close()
+            self._workbook = None
+
     # def get_col(self, start_row, col_num):
     #     orig_col = super().get_col(start_row=start_row, col_num=col_num)
     #     return [str(val) for val in orig_col]
 
 
-def _eval(value):
-    if value == '':
-        return None
-    try:
-        return literal_eval(value)
-    except (SyntaxError, ValueError):
-        return _bool(value)
-
-
-def _bool(value):
-    if isinstance(value, bool):
-        return value
-    elif value in 'TRUE True true'.split():
-        return True
-    elif value in 'FALSE false False'.split():
-        return False
+def _read_columns(rows, col_indexes):
+    # Fan rows out into one list per column index. Return the row count and the columns.
+    if len(col_indexes) == 1:
+        col_index = col_indexes[0]
+        column = [row[col_index] for row in rows]
+        return len(column), [column]
+    elif col_indexes:
+        getter = itemgetter(*col_indexes)
+        picked = [getter(row) for row in rows]
+        if not picked:
+            return 0, [[] for _ in col_indexes]
+        return len(picked), [list(col) for col in zip(*picked)]
     else:
-        return value
+        return sum(1 for _ in rows), []
+
+
+def _apply_cellpatterns(values, cellpatterns, literals=True):
+    values = infer_column(values, literals=literals)
+    for cellpattern in force_list(cellpatterns):
+        values = get_column_function(cellpattern)(values)
+    return values
+
 
 if __name__ == '__main__':
     pass
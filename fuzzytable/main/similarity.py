@@ -0,0 +1,138 @@
+"""
+Pluggable similarity backends for approximate string matching.
+
+All approximate matching (header seek, header matching, and ``StringChoice``)
+scores strings with ``difflib.SequenceMatcher.ratio``.
+A backend is an object that produces fast scorers returning exactly those ratios.
+
+Backends shipped with fuzzytable:
+
+- ``difflib``: the pure-python standard library. Always available.
+- ``cydifflib``: compiled drop-in replacement for ``difflib`` (``pip install cydifflib``).
+- ``rapidfuzz``: compatibility mode (``pip install rapidfuzz``).
+  rapidfuzz's compiled ``fuzz.ratio`` (based on the longest common subsequence)
+  is never lower than the difflib ratio.
+  It is used to cheaply reject terms that cannot reach ``min_ratio``.
+  The remaining terms are scored with cydifflib (if installed) or difflib, so ratios are identical.
+
+The first of ``rapidfuzz``, ``cydifflib``, ``difflib`` that can be imported becomes the active backend.
+Use :func:`set_backend` to choose another, and :func:`register_backend` to add your own.
+"""
+
+# --- Standard Library Imports ------------------------------------------------
+import difflib
+from typing import Callable, Dict, List
+
+# --- Intra-Package Imports ---------------------------------------------------
+from fuzzytable import exceptions
+
+# --- Third Party Imports -----------------------------------------------------
+try:
+    import cydifflib
+except ImportError:
+    cydifflib = None
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz
+except ImportError:
+    rapidfuzz_fuzz = None
+
+
+# Scorer: score(term, min_ratio=0.0) -> float
+# Returns the difflib ratio of ``term`` vs. the scorer's target string.
+# If that ratio is below ``min_ratio``, any value below ``min_ratio`` may be returned instead.
+Scorer = Callable[..., float]
+
+
+class DifflibBackend:
+    """Score with ``difflib.SequenceMatcher`` (the default)."""
+
+    name = 'difflib'
+    sequence_matcher = difflib.SequenceMatcher
+
+    def scorer(self, target: str) -> Scorer:
+        """Return a scorer for one target string. The target is analysed only once."""
+        matcher = self.sequence_matcher(None, b=target)
+        set_seq1 = matcher.set_seq1
+        quick_ratio = matcher.quick_ratio
+        ratio = matcher.ratio
+
+        def score(term: str, min_ratio=0.0) -> float:
+            set_seq1(term)
+            if quick_ratio() < min_ratio:
+                return 0.0
+            return ratio()
+        return score
+
+
+class CydifflibBackend(DifflibBackend):
+    """Score with ``cydifflib.SequenceMatcher``, a compiled drop-in for difflib."""
+
+    name = 'cydifflib'
+    sequence_matcher = getattr(cydifflib, 'SequenceMatcher', None)
+
+
+class RapidfuzzBackend(DifflibBackend):
+    """Reject unreachable terms with rapidfuzz, then score the rest with (cy)difflib."""
+
+    name = 'rapidfuzz'
+    sequence_matcher = getattr(cydifflib, 'SequenceMatcher', difflib.SequenceMatcher)
+
+    def scorer(self, target: str) -> Scorer:
+        exact_score = super().scorer(target)
+        upper_bound = rapidfuzz_fuzz.ratio
+
+        def score(term: str, min_ratio=0.0) -> float:
+            # The small tolerance guards against rapidfuzz's float rounding.
+            if min_ratio and upper_bound(term, target) < min_ratio * 100 - 1e-6:
+                return 0.0
+            return exact_score(term, min_ratio)
+        return score
+
+
+_backends: Dict[str, DifflibBackend] = {}
+_active = None
+
+
+def register_backend(backend) -> None:
+    """Make a backend available to :func:`set_backend`, under its ``name`` attribute.
+
+    A backend must have a ``scorer(target)`` method
+    that returns a ``score(term, min_ratio=0.0)`` function (see :class:`DifflibBackend`).
+    For matching results to stay unchanged, scores must equal the difflib ratio
+    whenever that ratio is at least ``min_ratio``.
+    """
+    _backends[backend.name] = backend
+
+
+def available_backends() -> List[str]:
+    """Return the names of all registered backends."""
+    return list(_backends)
+
+
+def set_backend(name: str) -> None:
+    """Use the backend registered under ``name`` for all subsequent matching.
+
+    Raises:
+        :obj:`~fuzzytable.exceptions.SimilarityBackendError`: if no such backend is registered.
+    """
+    global _active
+    try:
+        _active = _backends[name]
+    except KeyError:
+        raise exceptions.SimilarityBackendError(name, available_backends())
+
+
+def get_backend():
+    """Return the active backend."""
+    return _active
+
+
+register_backend(DifflibBackend())
+if cydifflib is not None:
+    register_backend(CydifflibBackend())
+if rapidfuzz_fuzz is not None:
+    register_backend(RapidfuzzBackend())
+for _name in ['rapidfuzz', 'cydifflib', 'difflib']:
+    if _name in _backends:
+        set_backend(_name)
+        break
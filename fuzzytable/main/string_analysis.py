@@ -4,7 +4,6 @@ These are string-matching functions for finding the best-fit header row.
 
 # --- Standard Library Imports ------------------------------------------------
 from typing import List, Dict, Optional
-from difflib import SequenceMatcher
 from collections import namedtuple
 from unittest.mock import sentinel  # https://www.revsys.com/tidbits/sentinel-values-python/
 
@@ -14,6 +13,7 @@ from unittest.mock import sentinel  # https://www.revsys.com/tidbits/sentinel-va
 # --- Third Party Imports -----------------------------------------------------
 # None
 from fuzzytable import exceptions
+from fuzzytable.main import similarity
 
 BestMatch = namedtuple("BestMatch", "index1 index2 string1 string2 ratio")
 NoMatch = sentinel.NoMatch
@@ -22,14 +22,26 @@ DefaultValue = sentinel.DefaultValue
 BestKey = namedtuple('BestKey', 'name ratio')
 
 
-def get_best_match(strings1: List[str], strings2: List[str], min_ratio=0.0, case_sensitive=True) -> BestMatch:
+def get_best_match(
+        strings1: List[str],
+        strings2: List[str],
+        min_ratio=0.0,
+        case_sensitive=True,
+        matchers: Optional[Dict] = None,
+) -> BestMatch:
+    """Return the best-matching pair of strings, one from each list.
+
+    ``matchers`` (optional) is a dictionary of similarity scorers keyed by their ``strings2`` string.
+    Pass the same dictionary to many calls to analyse each ``strings2`` string only once.
+    """
     if case_sensitive:
-        return get_best_match_case_sensitive(strings1, strings2, min_ratio)
+        return get_best_match_case_sensitive(strings1, strings2, min_ratio, matchers)
     else:
         best_match_lowercase = get_best_match_case_sensitive(
             strings1=[val.lower() for val in strings1],
             strings2=[val.lower() for val in strings2],
             min_ratio=min_ratio,
+            matchers=matchers,
         )
         if best_match_lowercase is NoMatch:
             return NoMatch
@@ -43,7 +55,14 @@ def get_best_match(strings1: List[str], strings2: List[str], min_ratio=0.0, case
             )
 
 
-def get_best_match_case_sensitive(strings1: List[str], strings2: List[str], min_ratio=0.0) -> BestMatch:
+def get_best_match_case_sensitive(
+        strings1: List[str],
+        strings2: List[str],
+        min_ratio=0.0,
+        matchers: Optional[Dict] = None,
+) -> BestMatch:
+    if matchers is None:
+        matchers = {}
     best_match = NoMatch
     for index1, string1 in enumerate(strings1):
         for index2, string2 in enumerate(strings2):
@@ -55,10 +74,7 @@ def get_best_match_case_sensitive(strings1: List[str], strings2: List[str], min_
                     string2=string2,
                     ratio=1.0,
                 )
-            matcher = SequenceMatcher(None, string1, string2)
-            if matcher.quick_ratio() < min_ratio:
-                continue
-            ratio = matcher.ratio()
+            ratio = get_matcher(string2, matchers)(string1, min_ratio)
             if ratio < min_ratio:
                 continue
             elif ratio > best_match.ratio:
@@ -72,16 +88,31 @@ def get_best_match_case_sensitive(strings1: List[str], strings2: List[str], min_
     return best_match
 
 
-def get_best_ratio(strings1: List[str], strings2: List[str], min_ratio=0.0) -> float:
-    return get_best_match(strings1, strings2, min_ratio).ratio
+def get_matcher(string2: str, matchers: Dict) -> similarity.Scorer:
+    """Return the similarity scorer for ``string2``, creating and storing it if needed.
+
+    Scorers (e.g. difflib's SequenceMatcher) cache their analysis of ``string2``.
+    Only the search term changes from one comparison to the next.
+    """
+    try:
+        return matchers[string2]
+    except KeyError:
+        matcher = matchers[string2] = similarity.get_backend().scorer(string2)
+        return matcher
+
+
+def get_best_ratio(strings1: List[str], strings2: List[str], min_ratio=0.0, matchers: Optional[Dict] = None) -> float:
+    return get_best_match(strings1, strings2, min_ratio, matchers=matchers).ratio
 
 
-def _get_approxmatch(search_dict: Dict, target: str, min_ratio=0.0, case_sensitive=True):
+def _get_approxmatch(search_dict: Dict, target: str, min_ratio=0.0, case_sensitive=True, matchers=None):
     """
     Return dictionary key whose value (a list of strings) best fits the target value.
 
     Only the dictionary values are matched to the target string.
     """
+    if matchers is None:
+        matchers = {}
     best_key = NoMatch
     best_ratio = 0.0
     for key, value in search_dict.items():
@@ -90,6 +121,7 @@ def _get_approxmatch(search_dict: Dict, target: str, min_ratio=0.0, case_sensiti
             strings2=[target],
             min_ratio=min_ratio,
             case_sensitive=case_sensitive,
+            matchers=matchers,
         ).ratio
         if ratio > best_ratio:
             best_key = BestKey(key, ratio)
@@ -133,6 +165,7 @@ def get_bestkey(
         default_value,
         case_sensitive=True,
         min_ratio=0.0,
+        matchers: Optional[Dict] = None,
 ) -> BestKey:
     if mode in 'exact contains'.split():
         bestkey = _get_exactmatch_or_containsmatch(
@@ -147,6 +180,7 @@ def get_bestkey(
             target=target,
             min_ratio=min_ratio,
             case_sensitive=case_sensitive,
+            matchers=matchers,
         )
 
     if bestkey is NoMatch:
@@ -0,0 +1,165 @@
+"""
+Convert raw cell strings (e.g. from csv files) to typed python values.
+
+Most cells are plain integers, floats, booleans, blanks, or text.
+These are recognized with cheap string checks.
+Only cells that might really be python literals are handed to ``ast.literal_eval``.
+"""
+
+# --- Standard Library Imports ------------------------------------------------
+import re
+import sys
+from ast import literal_eval
+from typing import Any, List
+
+# --- Intra-Package Imports ---------------------------------------------------
+# None
+
+# --- Third Party Imports -----------------------------------------------------
+# None
+
+
+_BOOLS = {
+    'TRUE': True,
+    'True': True,
+    'true': True,
+    'FALSE': False,
+    'false': False,
+    'False': False,
+}
+
+# Whitespace mirrors literal_eval: trailing spaces and tabs are allowed.
+# Leading ones are too from python 3.10, whose literal_eval strips them (before, they are a syntax error).
+_LEADING_SPACE = r'[ \t]*' if sys.version_info >= (3, 10) else ''
+_DIGITS = r'[0-9](?:_?[0-9])*'
+_EXPONENT = rf'[eE][-+]?{_DIGITS}'
+_INT = re.compile(rf'{_LEADING_SPACE}[-+]?(?:[1-9](?:_?[0-9])*|0+(?:_?0)*)[ \t]*\Z')
+_FLOAT = re.compile(
+    rf'{_LEADING_SPACE}[-+]?(?:(?:{_DIGITS})?\.{_DIGITS}(?:{_EXPONENT})?'
+    rf'|{_DIGITS}\.(?:{_EXPONENT})?'
+    rf'|{_DIGITS}{_EXPONENT})[ \t]*\Z'
+)
+
+# A cell beginning with one of these characters might be a number (or a tuple of numbers):
+_NUMERIC_START = frozenset('0123456789.+-')
+
+# Outside of quotes, a python literal that begins with a digit/sign/period
+# can only contain these characters:
+_NUMERIC_LITERAL_CHARS = frozenset(
+    '0123456789'
+    'abcdefABCDEF'  # hex digits and exponents
+    'xXoObBjJ_'  # radix prefixes, imaginary numbers, digit separators
+    'NoneTrueFalse'  # tuple members, e.g. "1, None"
+    '.+-,:()[]{} \t\r\n\x0b\x0c'
+)
+
+_STRING_PREFIX = re.compile(r'[ \t]*(?:[bBrRuU]|[bB][rR]|[rR][bB])[\'"]')
+_NAME_LITERAL = re.compile(r'[ \t]*(?:None|True|False)\b')
+
+_SCALAR_TYPES = (int, float, complex, str, bytes, bool, type(None))
+
+_COLUMN_MEMO_SIZE = 4096
+
+
+def infer_value(value, literals=False) -> Any:
+    """Return the typed value of a single cell.
+
+    Args:
+        value: raw cell value. Non-string values (e.g. from excel) are returned unchanged.
+        literals (``bool``, default ``False``): "safe literal" mode.
+            If True, cells that are python list/tuple/dict/set literals
+            (e.g. ``'1, 2, 3'`` or ``'[1, 2]'``) are evaluated as well.
+            Otherwise, they remain strings.
+    """
+    if type(value) is not str:
+        return value
+    if value == '':
+        return None
+    if _INT.match(value):
+        return _number(int, value)
+    if _FLOAT.match(value):
+        return _number(float, value)
+    if _might_be_literal(value, literals):
+        return _literal(value, literals)
+    return _BOOLS.get(value, value)
+
+
+def infer_column(values: List, literals=False) -> List:
+    """Return a new list holding the typed value of each cell in a column.
+
+    Same results as ``[infer_value(value, literals) for value in values]``,
+    but repeated cell strings are only analyzed once.
+    """
+    memo = {'': None}
+    memo_get = memo.get
+    int_match = _INT.match
+    float_match = _FLOAT.match
+    bools_get = _BOOLS.get
+    might_be_literal = _might_be_literal
+    scalar_types = _SCALAR_TYPES
+    typed_values = []
+    append = typed_values.append
+    for value in values:
+        if type(value) is not str:
+            append(value)
+            continue
+        typed_value = memo_get(value, memo)  # memo doubles as a "missing" sentinel
+        if typed_value is not memo:
+            append(typed_value)
+            continue
+        if int_match(value):
+            typed_value = _number(int, value)
+        elif float_match(value):
+            typed_value = _number(float, value)
+        elif might_be_literal(value, literals):
+            typed_value = _literal(value, literals)
+            if type(typed_value) not in scalar_types:
+                append(typed_value)  # mutable containers are never shared between cells
+                continue
+        else:
+            typed_value = bools_get(value, value)
+        if len(memo) < _COLUMN_MEMO_SIZE:
+            memo[value] = typed_value
+        append(typed_value)
+    return typed_values
+
+
+def _number(convert, value: str):
+    # convert is int or float, and value matched _INT or _FLOAT.
+    try:
+        return convert(value)
+    except ValueError:
+        return value  # e.g. more digits than int() accepts (python 3.11+), which literal_eval rejects too
+
+
+def _might_be_literal(value: str, literals: bool) -> bool:
+    # Cheap check: False means literal_eval would certainly fail (or, without literals, return a container).
+    stripped = value.lstrip(' \t')
+    if not stripped:
+        return False
+    first_char = stripped[0]
+    if first_char.isspace():
+        return True  # e.g. leading newlines, which literal_eval tolerates
+    if first_char in _NUMERIC_START:
+        if '"' in value or "'" in value:
+            return True
+        return all(char in _NUMERIC_LITERAL_CHARS for char in value)
+    if first_char in '"\'(':
+        return True
+    if first_char in '[{':
+        return literals
+    if first_char in 'NTF':
+        return bool(_NAME_LITERAL.match(value))
+    if first_char in 'bBrRuU':
+        return bool(_STRING_PREFIX.match(value))
+    return False
+
+
+def _literal(value: str, literals: bool):
+    try:
+        typed_value = literal_eval(value)
+    except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError):
+        return _BOOLS.get(value, value)
+    if literals or isinstance(typed_value, _SCALAR_TYPES):
+        return typed_value
+    return value
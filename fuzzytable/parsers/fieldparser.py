@@ -1,135 +1,164 @@
 """FieldParser objects do the hard work of figuring out a FieldPattern's best-fit SingleField."""
 
 # --- Standard Library Imports ------------------------------------------------
-from typing import List, Optional, Union
+from typing import List, Optional, Union, Dict
 import collections
-from unittest.mock import sentinel
+import heapq
 
 # --- Intra-Package Imports ---------------------------------------------------
-from fuzzytable.patterns import FieldPattern
+from fuzzytable.patterns.fieldpattern import compile_field
 from fuzzytable.datamodel import SingleField, MultiField
 from fuzzytable.main.utils import get_repr
-from fuzzytable.main import string_analysis as strings
+from fuzzytable.parsers import matching
+from fuzzytable.parsers import similaritymatrix
 
 # --- Third Party Imports -----------------------------------------------------
 # None
 
 
 # The parser looks once at each field only once.
-# It stores the field and it's match ratio here for later reference.
-PotentialField = collections.namedtuple("FieldRatio", "field ratio")
-NullField = sentinel.NullField
-NoMoreFields = PotentialField(field=None, ratio=0.0)
+# It stores the field, its match ratio, and its position among the header row's fields here for later reference.
+PotentialField = collections.namedtuple("PotentialField", "field ratio position")
+
+# assign_fields_optimal: ratios are scaled to integers this large (a float has 52 fraction bits).
+_RATIO_SCALE = 1 << 52
 
 
 class FieldParser:
 
-    def __init__(self, fieldpattern, fields):
+    def __init__(self, fieldpattern, fields, matchers: Optional[Dict] = None, ratios: Optional[List[float]] = None):
+        # matchers: similarity scorers keyed by header string (see string_analysis.get_matcher).
+        # Sharing it between FieldParsers means each header is analysed only once.
+        # ratios: this pattern's match ratio with each field, if already known
+        # (see SimilarityMatrix.field_ratios). Otherwise, they are calculated here.
 
         self.fieldpattern = fieldpattern
         self.matched = False
 
-        field_rankings = []
-        for field in reversed(fields):
-            # Reversed b/c best matches are pulled off the end.
-            # All else being equal, an earlier column is a better match than later column.
-            ratio = self._calc_ratio(field)
+        if ratios is None:
+            headers = [field.header for field in fields]
+            ratios = similaritymatrix.header_ratios(compile_field(fieldpattern), headers, matchers)
+
+        # Every field that this pattern could match (ratio above zero), in column order.
+        self.potential_fields: List[PotentialField] = []
+        for position, (field, ratio) in enumerate(zip(fields, ratios)):
             if ratio == 0:
                 continue  # skip this field; not a good match (ratio likely too low)
-            field_ratio = PotentialField(field, ratio)
-            field_rankings.append(field_ratio)
-        self.field_ratios = sorted(field_rankings, key=lambda fr: fr.ratio)  # ascending
-        # Note: all subfields in this list are potential good matches.
+            self.potential_fields.append(PotentialField(field, ratio, position))
 
-    @property
-    def bestfit_ratio(self) -> float:
-        """Return match ratio with the best-fitting of the remaining subfields."""
-        bestfit_fieldratio = self.get_best_fieldratio()
-        return 0.0 if bestfit_fieldratio is None else bestfit_fieldratio.ratio
-
-    def get_best_fieldratio(self) -> Optional[PotentialField]:
-        # Of all the remaining unmatched Fields, return the best-fit field/ratio tuple
-
-        # Ratio is zero if there are no more subfields available
-        try:
-            bestfit_fieldratio = self.field_ratios[-1]
-        except IndexError:
-            return None
-
-        # If the best-match field is already taken,
-        # remove it from the list and recurse back thru
-        if bestfit_fieldratio.field.matched:
-            self.field_ratios.pop()
-            return self.get_best_fieldratio()
-
-        # Else, return the best-fit field/ratio tuple
-        return bestfit_fieldratio
-
-    def _calc_ratio(self, field: SingleField) -> float:
-        bestkey = strings.get_bestkey(
-            search_dict={self.name: self.fieldpattern.terms},
-            target=field.header,
-            mode=self.fieldpattern.mode,
-            default_value=None,
-            case_sensitive=self.fieldpattern.case_sensitive,
-            min_ratio=self.fieldpattern.min_ratio,
-        )
-        return bestkey.ratio
-
-    @staticmethod
-    def row_ratio(fieldpatterns: List[FieldPattern], headers_string: str) -> float:
-        """Calculate the average ratio for a potential header row"""
-        individual_ratios = (
-            FieldParser._fieldpattern_ratio(fieldpattern, headers_string)
-            for fieldpattern in fieldpatterns
-        )
-        total = sum(individual_ratios)
-        try:
-            average = total / len(fieldpatterns)
-        except ZeroDivisionError:
-            average = 0.0
-        return average
-
-    @staticmethod
-    def _fieldpattern_ratio(fieldpattern: FieldPattern, headers_string: str) -> float:
-        search_terms = fieldpattern.terms
-        if not fieldpattern.case_sensitive:
-            search_terms = [
-                search_term.lower()
-                for search_term in search_terms
-            ]
-            headers_string = headers_string.lower()
-        if fieldpattern.mode == 'approx':
-            return strings.get_best_ratio(search_terms, [headers_string])
-        else:
-            for term in search_terms:
-                if term in headers_string:
-                    return 1.0
-        return 0.0
-
-    def assign_bestfit_field(self) -> None:
+    def assign_field(self, potential_field: PotentialField) -> None:
         # This is called when a FieldPattern has found a match
 
-        field: Union[SingleField, MultiField] = self.get_best_fieldratio().field
-        field.ratio = self.bestfit_ratio
+        field: Union[SingleField, MultiField] = potential_field.field
+        field.ratio = potential_field.ratio
         field.name = self.name
         field.cellpattern = self.fieldpattern.cellpattern
+        field.dictionary_encode = self.fieldpattern.dictionary_encode
 
         # Finally, mark both as matched
         field.matched = True
         self.matched = True
 
-    @property
-    def still_seeking(self):
-        if self.fieldpattern.multifield and self.get_best_fieldratio():
-            return True
-        if self.matched or self.get_best_fieldratio() is None:
-            return False
-        return True
-
     @property
     def name(self):
         return self.fieldpattern.name  # pragma: no cover
 
     def __repr__(self):
         return get_repr(self)  # pragma: no cover
+
+
+def assign_fields(fieldparsers: List[FieldParser]) -> None:
+    """Match fields to FieldPatterns, greedily: the best-matching (pattern, field) pair first.
+
+    Ties go to the earlier FieldPattern, then to the earlier column.
+    Each field is assigned at most once. Each FieldPattern gets one field,
+    except multifield patterns, which get every field they match that isn't taken first.
+
+    All candidate pairs go into one priority queue, ordered by (-ratio, pattern index, column position).
+    Pairs made stale by an earlier assignment are skipped as they come up (lazy invalidation),
+    so matching P patterns to F fields takes O(P*F log(P*F)).
+    """
+    queue = [
+        (-potential_field.ratio, parser_index, potential_field.position, potential_field)
+        for parser_index, fieldparser in enumerate(fieldparsers)
+        for potential_field in fieldparser.potential_fields
+    ]
+    heapq.heapify(queue)
+
+    # Without multifield patterns, stop as soon as every pattern with candidates has its field.
+    any_multifield = any(fieldparser.fieldpattern.multifield for fieldparser in fieldparsers)
+    unmatched = sum(1 for fieldparser in fieldparsers if fieldparser.potential_fields)
+
+    while queue and (unmatched or any_multifield):
+        _, parser_index, _, potential_field = heapq.heappop(queue)
+        fieldparser = fieldparsers[parser_index]
+        multifield = fieldparser.fieldpattern.multifield
+        if potential_field.field.matched:
+            continue  # taken by a better (or earlier) pattern
+        if fieldparser.matched and not multifield:
+            continue  # this pattern already has its field
+        if not multifield:
+            unmatched -= 1
+        fieldparser.assign_field(potential_field)
+
+
+def assign_fields_optimal(fieldparsers: List[FieldParser]) -> None:
+    """Match fields to FieldPatterns so that the total match ratio is as high as possible.
+
+    Greedy matching (:func:`assign_fields`) can give a pattern's best header to an earlier pattern
+    that matched it only slightly better, leaving the first with a poor match, or none.
+    Here, the single-field patterns are solved jointly, as a maximum-weight bipartite matching
+    (see :func:`~fuzzytable.parsers.matching.max_weight_matching`).
+    Multifield patterns then take the remaining fields, as they would with greedy matching.
+    A single-field pattern takes a field only if it matches it better than the multifield patterns do.
+
+    Among equally good assignments, earlier patterns get earlier columns.
+    """
+    # Ratios become integers, so that the solver's arithmetic is exact.
+    def as_int(ratio):
+        return round(ratio * _RATIO_SCALE)
+
+    # What each field is worth if no single-field pattern takes it.
+    multifield_ratios = collections.defaultdict(int)
+    for fieldparser in fieldparsers:
+        if fieldparser.fieldpattern.multifield:
+            for potential_field in fieldparser.potential_fields:
+                position = potential_field.position
+                multifield_ratios[position] = max(multifield_ratios[position], as_int(potential_field.ratio))
+
+    # The tie-breaking bonus of one pair (at most pattern_count * field_count) is added to the scaled gain in ratio.
+    # tie_scale exceeds the total bonus of any matching, so the bonus only decides between equal ratio totals.
+    pattern_count = len(fieldparsers)
+    field_count = 1 + max(
+        (potential_field.position for fieldparser in fieldparsers for potential_field in fieldparser.potential_fields),
+        default=0,
+    )
+    tie_scale = min(pattern_count, field_count) * pattern_count * field_count + 1
+
+    rows = {}
+    potential_fields = {}
+    for parser_index, fieldparser in enumerate(fieldparsers):
+        if fieldparser.fieldpattern.multifield:
+            continue
+        edges = []
+        for potential_field in fieldparser.potential_fields:
+            gain = as_int(potential_field.ratio) - multifield_ratios[potential_field.position]
+            if gain <= 0:
+                continue  # the field is worth as much to a multifield pattern
+            bonus = (pattern_count - parser_index) * (field_count - potential_field.position)
+            edges.append((potential_field.position, gain * tie_scale + bonus))
+            potential_fields[parser_index, potential_field.position] = potential_field
+        if edges:
+            rows[parser_index] = edges
+
+    for parser_index, position in sorted(matching.max_weight_matching(rows).items()):
+        fieldparsers[parser_index].assign_field(potential_fields[parser_index, position])
+
+    assign_fields([fieldparser for fieldparser in fieldparsers if fieldparser.fieldpattern.multifield])
+
+
+# Field-to-pattern assignment strategies, by FuzzyTable ``assignment`` argument.
+ASSIGNMENTS = {
+    'greedy': assign_fields,
+    'optimal': assign_fields_optimal,
+}
@@ -0,0 +1,199 @@
+"""
+Maximum-weight bipartite matching, used by ``FuzzyTable(assignment='optimal')``.
+
+This is the Hungarian algorithm in its shortest-augmenting-path form.
+Rows are added one at a time; each is matched along the cheapest augmenting path over reduced costs.
+The path is found in one of two ways, depending on how many (row, col) edges there are:
+
+- sparse (each FieldPattern matches only a few headers): Dijkstra's algorithm with a heap,
+  visiting only the edges passed in. O(E log V) per row.
+- dense: a scan of every col's best reduced cost (the array-based form of the algorithm),
+  with missing edges at weight 0. O(n^2 m) for n rows and m >= n cols: O(n^3) for a square problem.
+"""
+
+# --- Standard Library Imports ------------------------------------------------
+from heapq import heappop, heappush
+from itertools import count
+from typing import Dict, Hashable, List, Tuple
+
+# --- Intra-Package Imports ---------------------------------------------------
+# None
+
+# --- Third Party Imports -----------------------------------------------------
+# None
+
+
+_INFINITY = float('inf')
+_UNMATCHED = object()
+
+
+# Use the dense solver once at least this fraction of all (row, col) pairs are edges.
+# Past it, the heap's log factor and bookkeeping cost more than scanning every col.
+_DENSE_FRACTION = 0.5
+
+
+def max_weight_matching(rows: Dict[Hashable, List[Tuple[Hashable, int]]]) -> Dict:
+    """Return a ``{row: col}`` matching that maximizes the total weight.
+
+    Args:
+        rows: each row's candidate ``(col, weight)`` pairs. Weights must be positive integers
+            (the arithmetic must be exact for the search to be correct).
+
+    Each row and each col is used at most once.
+    Rows whose every candidate is better used elsewhere are left out of the result.
+    """
+    edge_count = sum(len(edges) for edges in rows.values())
+    col_count = len({col for edges in rows.values() for col, _ in edges})
+    if edge_count and edge_count >= _DENSE_FRACTION * len(rows) * col_count:
+        return _dense_matching(rows)
+    return _sparse_matching(rows)
+
+
+def _dense_matching(rows: Dict[Hashable, List[Tuple[Hashable, int]]]) -> Dict:
+    # max_weight_matching over a full cost matrix: rows x cols, padded with cols of weight 0 up to one per row.
+    # A row assigned to a missing edge (or a padding col), at cost 0, is simply left unmatched.
+    row_keys = list(rows)
+    col_keys = list({col: None for edges in rows.values() for col, _ in edges})
+    col_indexes = {col: col_index for col_index, col in enumerate(col_keys, 1)}
+    row_count = len(row_keys)
+    col_count = max(len(col_keys), row_count)
+
+    # costs[i][j] for row i, col j (both 1-indexed; index 0 is unused). Costs are negated weights.
+    costs = [None]
+    for row in row_keys:
+        row_costs = [0] * (col_count + 1)
+        for col, weight in rows[row]:
+            col_index = col_indexes[col]
+            if -weight < row_costs[col_index]:
+                row_costs[col_index] = -weight
+        costs.append(row_costs)
+
+    # The same search as _sparse_matching, with the heap replaced by a scan of the cols not yet finalized.
+    row_potentials = [0] * (row_count + 1)
+    col_potentials = [0] * (col_count + 1)
+    row_matches = [0] * (row_count + 1)  # the col matched to each row (0: none)
+    col_matches = [0] * (col_count + 1)  # the row matched to each col (0: none)
+    for source in range(1, row_count + 1):
+        # --- cheapest augmenting path from source ----------------------------
+        distances = [_INFINITY] * (col_count + 1)
+        predecessors = [0] * (col_count + 1)
+        unfinalized = list(range(1, col_count + 1))
+        finalized = []
+        row = source
+        distance_to_row = 0
+        while True:
+            # Relax the row's edges, and find the nearest col not yet finalized, in one pass.
+            row_costs = costs[row]
+            distance = _INFINITY
+            col = 0
+            for candidate in unfinalized:
+                candidate_distance = distance_to_row + row_costs[candidate] - col_potentials[candidate]
+                if candidate_distance < distances[candidate]:
+                    distances[candidate] = candidate_distance
+                    predecessors[candidate] = row
+                else:
+                    candidate_distance = distances[candidate]
+                if candidate_distance < distance:
+                    distance = candidate_distance
+                    col = candidate
+            if not col_matches[col]:
+                break  # a free col: augment along the path to it
+            unfinalized.remove(col)
+            finalized.append(col)
+            row = col_matches[col]
+            distance_to_row = distance - row_potentials[row]
+
+        # --- keep reduced costs non-negative and matched edges tight ---------
+        for finalized_col in finalized:
+            delta = distance - distances[finalized_col]
+            col_potentials[finalized_col] -= delta
+            row_potentials[col_matches[finalized_col]] += delta
+        row_potentials[source] = distance
+
+        # --- augment ---------------------------------------------------------
+        while True:
+            row = predecessors[col]
+            previous_col = row_matches[row]
+            row_matches[row] = col
+            col_matches[col] = row
+            if row == source:
+                break
+            col = previous_col
+
+    return {
+        row_keys[row - 1]: col_keys[col - 1]
+        for row, col in enumerate(row_matches)
+        if row and col <= len(col_keys) and costs[row][col] < 0
+    }
+
+
+def _sparse_matching(rows: Dict[Hashable, List[Tuple[Hashable, int]]]) -> Dict:
+    # max_weight_matching over the given edges only (Dijkstra with a heap).
+    # Each row may also stay unmatched: a col of its own, at cost 0.
+    # Costs are negated weights, so the cheapest full assignment is the heaviest matching.
+    adjacency = {
+        row: [(col, -weight) for col, weight in edges] + [((_UNMATCHED, row), 0)]
+        for row, edges in rows.items()
+    }
+    row_potentials = {}
+    col_potentials = {col: 0 for edges in adjacency.values() for col, _ in edges}
+    row_matches = {}
+    col_matches = {}
+
+    for source in adjacency:
+        # --- cheapest augmenting path from source (Dijkstra) -----------------
+        distances = {}
+        predecessors = {}
+        finalized = []
+        finalized_cols = set()
+        heap = []
+        tiebreak = count()  # cols of different types can't be compared
+
+        def relax(row, distance_to_row):
+            # Reduced costs are non-negative, so finalized cols are never improved upon.
+            get_distance = distances.get
+            for col, cost in adjacency[row]:
+                distance = distance_to_row + cost - col_potentials[col]
+                if distance < get_distance(col, _INFINITY):
+                    distances[col] = distance
+                    predecessors[col] = row
+                    heappush(heap, (distance, next(tiebreak), col))
+
+        relax(source, 0)
+        while True:
+            distance, _, col = heappop(heap)  # never empty: source's own "unmatched" col is always free
+            if col in finalized_cols or distance > distances[col]:
+                continue  # stale entry
+            if col not in col_matches:
+                break  # a free col: augment along the path to it
+            finalized.append(col)
+            finalized_cols.add(col)
+            row = col_matches[col]
+            relax(row, distance - row_potentials[row])
+
+        # --- keep reduced costs non-negative and matched edges tight ---------
+        for finalized_col in finalized:
+            delta = distance - distances[finalized_col]
+            col_potentials[finalized_col] -= delta
+            row_potentials[col_matches[finalized_col]] += delta
+        row_potentials[source] = distance
+
+        # --- augment ---------------------------------------------------------
+        while True:
+            row = predecessors[col]
+            previous_col = row_matches.get(row)
+            row_matches[row] = col
+            col_matches[col] = row
+            if row == source:
+                break
+            col = previous_col
+
+    return {
+        row: col
+        for row, col in row_matches.items()
+        if not (isinstance(col, tuple) and col[0] is _UNMATCHED)
+    }
+
+
+if __name__ == '__main__':
+    pass
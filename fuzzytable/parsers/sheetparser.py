@@ -9,14 +9,18 @@ the best-fit header row. Then, there will be one SheetParser per sheet.
 
 # --- Standard Library Imports ------------------------------------------------
 from collections import namedtuple, defaultdict
-from typing import List, Union
+from typing import List, Optional, Union, Iterator, Dict, Callable
 
 # --- Intra-Package Imports ---------------------------------------------------
 from fuzzytable import exceptions
 from fuzzytable import datamodel
 from fuzzytable import patterns
 from fuzzytable.main import sheetreader
-from fuzzytable.parsers.fieldparser import FieldParser
+from fuzzytable.main.typeinference import infer_value
+from fuzzytable.main.utils import force_list
+from fuzzytable.parsers.fieldparser import FieldParser, ASSIGNMENTS
+from fuzzytable.patterns.cellpattern import get_column_function
+from fuzzytable.parsers.similaritymatrix import SimilarityMatrix, prepare_patterns
 from fuzzytable.datamodel import MultiField, Field, SingleField
 
 # --- Third Party Imports -----------------------------------------------------
@@ -34,42 +38,70 @@ class SheetParser:
             sheet_reader: sheetreader.SheetReader,
             fieldpatterns: List[patterns.FieldPattern],
             header_row,
-            header_row_seek
+            header_row_seek,
+            matchers=None,
+            assignment='greedy',
     ):
+        # matchers: similarity scorers keyed by header string (see string_analysis.get_matcher).
+        # Pass the same dictionary to many SheetParsers to analyse each distinct header only once.
+        # assignment: a key of fieldparser.ASSIGNMENTS (already validated by FuzzyTable).
 
         # --- determine header row --------------------------------------------
-        actual_header_row, header_row_ratio = header_row_and_ratio(
+        # The header row's similarity matrix serves both the header seek and the field matching.
+        actual_header_row, header_matrix = header_row_and_matrix(
             given_header_row=header_row,
             header_row_seek=header_row_seek,
             fieldpatterns=fieldpatterns,
             sheet_reader=sheet_reader,
+            matchers=matchers,
         )
+        header_row_ratio = header_matrix.row_ratio
 
         # --- collect sheet field_names --------------------------------------------
-        header_values = sheet_reader[actual_header_row]
         all_ws_fields = [
             datamodel.SingleField(header=header, col_num=col_num)
-            for col_num, header in enumerate(header_values, 1)
-            if header
+            for col_num, header in header_matrix.cells
         ]
 
         # --- find matches ----------------------------------------------------
-        fieldparsers = [FieldParser(fieldpattern, all_ws_fields) for fieldpattern in fieldpatterns]
-        while True:
-            available_fieldparsers = list(filter(lambda fp: fp.still_seeking, fieldparsers))
-            try:
-                bestfit_fieldparser = max(available_fieldparsers, key=lambda fp: fp.bestfit_ratio)
-            except ValueError:
-                # No more available fieldparsers.
-                break
-            bestfit_fieldparser.assign_bestfit_field()
+        fieldparsers = [
+            FieldParser(fieldpattern, all_ws_fields, ratios=header_matrix.field_ratios(pattern_index))
+            for pattern_index, fieldpattern in enumerate(fieldpatterns)
+        ]
+        ASSIGNMENTS[assignment](fieldparsers)
 
         # --- fuzzy table data model: field_names ----------------------------------
         if fieldpatterns:
             fields_matched = list(filter(lambda f: f.matched, all_ws_fields))
         else:
             fields_matched = all_ws_fields
+        self._set_fields(sheet_reader, fieldpatterns, fields_matched, actual_header_row, header_row_ratio)
+        self.cache_entry = None
+
+    @classmethod
+    def from_cache(cls, sheet_reader, fieldpatterns, cache_entry) -> 'SheetParser':
+        # Instead of __init__: restore the header row and field matches of an earlier extraction.
+        # iter_extract then reads the data from the cache entry (see fuzzytable.main.cache), not the sheet.
+        fieldpatterns_by_name = {fieldpattern.name: fieldpattern for fieldpattern in fieldpatterns}
+        fields_matched = []
+        for header, col_num, name, ratio in cache_entry.fields:
+            field = datamodel.SingleField(header=header, col_num=col_num)
+            if name is not None:
+                fieldpattern = fieldpatterns_by_name[name]
+                field.name = name
+                field.ratio = ratio
+                field.cellpattern = fieldpattern.cellpattern
+                field.dictionary_encode = fieldpattern.dictionary_encode
+                field.matched = True
+            fields_matched.append(field)
+        self = cls.__new__(cls)
+        self._set_fields(
+            sheet_reader, fieldpatterns, fields_matched, cache_entry.header_row_num, cache_entry.header_ratio
+        )
+        self.cache_entry = cache_entry
+        return self
 
+    def _set_fields(self, sheet_reader, fieldpatterns, fields_matched, header_row_num, header_row_ratio):
         fields_dict = defaultdict(list)
         for field in fields_matched:
             fieldname = field.name
@@ -94,9 +126,38 @@ class SheetParser:
         ]
 
         fields = single_fields + multi_fields
-        for field in fields:
-            assign_data_to_field(field, sheet_reader, actual_header_row)
         self.fields = sorted(fields, key=lambda f: f.col_num)
+        self.sheet_reader = sheet_reader
+        self.header_row_num = header_row_num
+        self.header_row_ratio = header_row_ratio
+
+        # populated by self.extract()
+        self.sheet_summary = None
+        self.records = None
+
+    def extract(self, compact=False) -> None:
+        # Read the data region into the matched fields and build the data model.
+        for _ in self.iter_extract(compact):
+            pass  # a single step: all rows are read in one pass
+
+    def iter_extract(self, compact=False, chunksize=None, raw_columns=None) -> Iterator[int]:
+        # Generator form of extract(): each step reads (up to) chunksize rows and yields the number read.
+        # The data model is built once the generator is exhausted.
+        # raw_columns: see iter_assign_data_to_fields. Restored from a cache entry, nothing is read (no steps).
+        sheet_reader = self.sheet_reader
+        if self.cache_entry is None:
+            yield from iter_assign_data_to_fields(
+                self.fields, sheet_reader, self.header_row_num, compact, chunksize, raw_columns
+            )
+            row_count = sheet_reader.row_count
+        else:
+            single_fields = flatten_fields(self.fields)
+            columns = [
+                apply_cellpatterns(column, field.cellpattern)
+                for field, column in zip(single_fields, self.cache_entry.columns)
+            ]
+            assign_columns(single_fields, columns, compact)
+            row_count = self.cache_entry.row_count
 
         ############################
         #  Fuzzy Table Data Model  #
@@ -104,9 +165,9 @@ class SheetParser:
 
         # --- fuzzy table data madel: summary ---------------------------------
         self.sheet_summary = datamodel.Sheet(
-            header_row_num=actual_header_row,
-            row_count=sheet_reader.row_count,
-            ratio=header_row_ratio,
+            header_row_num=self.header_row_num,
+            row_count=row_count,
+            ratio=self.header_row_ratio,
             path=sheet_reader.path,
             sheetname=sheet_reader.sheetname,
         )
@@ -114,9 +175,61 @@ class SheetParser:
         # --- fuzzy table data model: records ---------------------------------
         self.records = datamodel.Records(
             fields=self.fields,
-            header_row_num=actual_header_row,
-            row_count=sheet_reader.row_count
+            header_row_num=self.header_row_num,
+            row_count=row_count
+        )
+
+    def iter_records(self, include_row_num=True) -> Iterator[Dict]:
+        # Instead of extract(): yield one record per data row, reading the sheet lazily.
+        # Only the current row is held in memory.
+        literals = self.sheet_reader.literals
+        getters = []
+        for field in self.fields:
+            if isinstance(field, MultiField):
+                subfield_getters = tuple(_cell_getter(subfield, literals) for subfield in field.subfields)
+                getters.append((field.name, _multicell_getter(subfield_getters)))
+            else:
+                getters.append((field.name, _cell_getter(field, literals)))
+        data_row_start = self.header_row_num + 1
+        rows = self.sheet_reader.iter_row(start_row=data_row_start)
+        for row_num, row in enumerate(rows, data_row_start):
+            record = {
+                name: get_value(row)
+                for name, get_value in getters
+            }
+            if include_row_num:
+                record['row'] = row_num
+            yield record
+
+    def iter_chunks(self, chunksize, include_row_num=True) -> Iterator[Dict[str, List]]:
+        # Instead of extract(): yield {field name: column values} for chunksize rows at a time.
+        single_fields = flatten_fields(self.fields)
+        data_row_start = self.header_row_num + 1
+        chunks = self.sheet_reader.iter_col_chunks(
+            col_nums=[field.col_num for field in single_fields],
+            start_row=data_row_start,
+            cellpatterns=[field.cellpattern for field in single_fields],
+            chunksize=chunksize,
         )
+        encoders = {
+            id(field): datamodel.DictEncoder()
+            for field in single_fields
+            if field.dictionary_encode
+        }  # one per field, so that codes are consistent across chunks
+        for chunk in chunks:
+            columns = dict(zip(map(id, single_fields), chunk.columns))
+            for field_id, encoder in encoders.items():
+                columns[field_id] = _encode(encoder, columns[field_id])
+            block = {}
+            for field in self.fields:
+                if isinstance(field, MultiField):
+                    block[field.name] = list(zip(*(columns[id(subfield)] for subfield in field.subfields)))
+                else:
+                    block[field.name] = columns[id(field)]
+            if include_row_num:
+                block['row'] = list(range(data_row_start, data_row_start + chunk.row_count))
+            data_row_start += chunk.row_count
+            yield block
 
     # def __repr__(self):
     #     return get_repr(self)  # pragma: no cover
@@ -126,13 +239,15 @@ def pos_int(value):
     return bool(isinstance(value, int) and value > 0)
 
 
-def header_row_and_ratio(
+def header_row_and_matrix(
         given_header_row: int,  # The header row number passed to FuzzyTable
         header_row_seek: Union[bool, int],
         fieldpatterns: List[patterns.FieldPattern],
         sheet_reader: sheetreader.SheetReader,
-) -> (int, float):
-    """Given the FuzzyTable arguments, return the actual header row (and match ratio)."""
+        matchers: Optional[Dict] = None,
+) -> (int, SimilarityMatrix):
+    """Given the FuzzyTable arguments, return the actual header row (and its similarity matrix)."""
+    prepared_patterns = prepare_patterns(fieldpatterns)
 
     # --- header row (no seek) --------------------------------------------
     if header_row_seek is False:
@@ -142,9 +257,8 @@ def header_row_and_ratio(
             actual_header_row_num = given_header_row
         else:
             raise exceptions.InvalidRowError(given_header_row)
-        header_row_str = sheet_reader.get_row_str(actual_header_row_num)
-        header_row_ratio = FieldParser.row_ratio(fieldpatterns, header_row_str)
-        return actual_header_row_num, header_row_ratio
+        header_matrix = SimilarityMatrix(prepared_patterns, sheet_reader[actual_header_row_num], matchers)
+        return actual_header_row_num, header_matrix
 
     # --- header row seek -------------------------------------------------
     if not fieldpatterns:
@@ -158,36 +272,121 @@ def header_row_and_ratio(
         raise exceptions.InvalidSeekError(header_row_seek)
 
     best_row_num = None
+    best_matrix = None
     best_ratio = NEG_INFINITY
-    for row_num, row_str in enumerate(sheet_reader.iter_row_str(end_row=header_seek_final_row), 1):
-        ratio = FieldParser.row_ratio(fieldpatterns, row_str)
-        if ratio > best_ratio:
-            best_ratio = ratio
+    for row_num, row in enumerate(sheet_reader.iter_row(end_row=header_seek_final_row), 1):
+        matrix = SimilarityMatrix(prepared_patterns, row, matchers)
+        if matrix.row_ratio > best_ratio:
+            best_ratio = matrix.row_ratio
             best_row_num = row_num
-    actual_header_row_num = best_row_num
-    header_row_ratio = best_ratio
-    return actual_header_row_num, header_row_ratio
+            best_matrix = matrix
+    if best_matrix is None:
+        best_matrix = SimilarityMatrix(prepared_patterns, None, matchers)  # empty sheet
+    return best_row_num, best_matrix
+
+
+def _cell_getter(field: SingleField, literals: bool) -> Callable:
+    # Return a function that pulls this field's normalized value out of a raw row.
+    col_index = field.col_num - 1
+    cellpatterns = force_list(field.cellpattern)
+
+    def get_value(row):
+        value = infer_value(row[col_index], literals=literals)
+        for cellpattern in cellpatterns:
+            value = cellpattern(value)
+        return value
+
+    if not field.dictionary_encode:
+        return get_value
+    intern = datamodel.DictEncoder().intern
 
+    def get_interned_value(row):
+        value = get_value(row)
+        try:
+            return intern(value)
+        except TypeError:
+            return value  # unhashable
 
-def assign_data_to_field(field, sheet_reader, header_row_num):
+    return get_interned_value
 
-    field: MultiField
-    if isinstance(field, MultiField):
-        for subfield in field.subfields:
-            assign_data_to_field(subfield, sheet_reader, header_row_num)
-        return
 
-    field: SingleField
+def _multicell_getter(subfield_getters) -> Callable:
+
+    def get_values(row):
+        return tuple(get_value(row) for get_value in subfield_getters)
+
+    return get_values
+
+
+def flatten_fields(fields: List[Field]) -> List[SingleField]:
+    # Replace each MultiField with its subfields.
+    single_fields: List[SingleField] = []
+    for field in fields:
+        if isinstance(field, MultiField):
+            single_fields.extend(field.subfields)
+        else:
+            single_fields.append(field)
+    return single_fields
+
+
+def iter_assign_data_to_fields(
+        fields, sheet_reader, header_row_num, compact=False, chunksize=None, raw_columns=None
+) -> Iterator[int]:
+    # Read the data region once, fanning each row out to every SingleField / MultiField subfield.
+    # Each step reads (up to) chunksize rows and yields the number read.
+    # The fields' data is assigned once the generator is exhausted.
+    # raw_columns: if a list, each SingleField's column is also appended to it as read,
+    # i.e. before the field's cellpatterns are applied (see fuzzytable.main.cache).
+
     sheet_reader: sheetreader.SheetReader
-    # fieldparsers: List[FieldParser]
-    # fielparser = fieldparsers.ind
+    single_fields = flatten_fields(fields)
     data_row_start = header_row_num + 1
-    data = sheet_reader.get_col(
+    chunks = sheet_reader.iter_col_chunks(
         start_row=data_row_start,
-        col_num=field.col_num,
-        cellpatterns=field.cellpattern,
+        col_nums=[field.col_num for field in single_fields],
+        cellpatterns=None if raw_columns is not None else [field.cellpattern for field in single_fields],
+        chunksize=chunksize,
     )
-    field.data = data
+    columns = None
+    for chunk in chunks:
+        if columns is None:
+            columns = chunk.columns if chunksize is None else [list(values) for values in chunk.columns]
+        else:
+            for column, values in zip(columns, chunk.columns):
+                column.extend(values)
+        yield chunk.row_count
+    if columns is None:
+        columns = [[] for _ in single_fields]  # no data rows
+    if raw_columns is not None:
+        raw_columns.extend(columns)
+        columns = [apply_cellpatterns(column, field.cellpattern) for field, column in zip(single_fields, columns)]
+    assign_columns(single_fields, columns, compact)
+
+
+def apply_cellpatterns(values, cellpatterns) -> List:
+    # Normalize a column already passed through type inference (see SheetReader.iter_col_chunks).
+    # Cell patterns never modify the column passed to them.
+    for cellpattern in force_list(cellpatterns):
+        values = get_column_function(cellpattern)(values)
+    return values
+
+
+def assign_columns(single_fields: List[SingleField], columns: List[List], compact=False) -> None:
+    # Store each SingleField's column, dictionary-encoded or compacted as the field and table ask.
+    for field, data in zip(single_fields, columns):
+        if field.dictionary_encode:
+            data = _encode(datamodel.DictEncoder(), data)
+        elif compact:
+            data = datamodel.compact_column(data)
+        field.data = data
+
+
+def _encode(encoder, values):
+    # Dictionary-encode a column. Columns holding unhashable values (e.g. lists) are left as they are.
+    try:
+        return encoder.encode(values)
+    except TypeError:
+        return values
 
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+"""
+How well each FieldPattern matches a candidate header row.
+
+Header seek scores every FieldPattern against each candidate row as a whole (its repr).
+Field assignment then scores every FieldPattern against each cell of the chosen row.
+Both read the chosen row's SimilarityMatrix, so that:
+
+- each FieldPattern's settings are resolved, and its search terms lowercased, once (see FieldPattern.compile)
+- each row string and each cell is lowercased once, not once per FieldPattern
+- each distinct (search term, string) comparison is made once,
+  however many FieldPatterns share the term and however many cells share the header
+"""
+
+# --- Standard Library Imports ------------------------------------------------
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# --- Intra-Package Imports ---------------------------------------------------
+from fuzzytable.main import string_analysis as strings
+from fuzzytable.patterns.fieldpattern import CompiledField, compile_field
+
+# --- Third Party Imports -----------------------------------------------------
+# None
+
+
+def prepare_patterns(fieldpatterns) -> List[CompiledField]:
+    # Compile any FieldPatterns not compiled already (FuzzyTable compiles them up front).
+    return [compile_field(fieldpattern) for fieldpattern in fieldpatterns]
+
+
+class SimilarityMatrix:
+    """Similarity of each FieldPattern to one row: to the row as a whole, and to each of its (non-empty) cells.
+
+    Each part is computed when first needed. Only the chosen header row's cells are ever scored.
+
+    Args:
+        patterns: CompiledField objects (see :func:`~fuzzytable.patterns.fieldpattern.compile_fields`).
+        row: the row's cell values.
+        matchers: similarity scorers keyed by cell string (see string_analysis.get_matcher).
+            Pass the same dictionary to many matrices to analyse each distinct header only once.
+    """
+
+    def __init__(self, patterns: List[CompiledField], row: Sequence, matchers: Optional[Dict] = None) -> None:
+        self.patterns = patterns
+        self.row = row
+        self._matchers = {} if matchers is None else matchers
+        self._row_ratio = None
+        self._cells = None
+        self._field_ratios = None
+
+    @property
+    def row_ratio(self) -> float:
+        """Return the average, over all FieldPatterns, of each one's best match with the row as a whole."""
+        if self._row_ratio is None:
+            self._row_ratio = string_ratio(self.patterns, repr(self.row))
+        return self._row_ratio
+
+    @property
+    def cells(self) -> List[Tuple[int, object]]:
+        """Return ``(col_num, header)`` for each non-empty cell."""
+        if self._cells is None:
+            self._cells = [(col_num, header) for col_num, header in enumerate(self.row, 1) if header]
+        return self._cells
+
+    def field_ratios(self, pattern_index: int) -> List[float]:
+        """Return a FieldPattern's match ratio with each of :attr:`cells`."""
+        if self._field_ratios is None:
+            headers = [header for _, header in self.cells]
+            lowered_headers = None
+            cache = {}  # shared by all patterns
+            self._field_ratios = []
+            for pattern in self.patterns:
+                if pattern.case_sensitive:
+                    targets = headers
+                else:
+                    if lowered_headers is None:
+                        lowered_headers = [header.lower() for header in headers]
+                    targets = lowered_headers
+                self._field_ratios.append(_header_ratios(pattern, targets, self._matchers, cache))
+        return self._field_ratios[pattern_index]
+
+
+def string_ratio(patterns: List[CompiledField], string: str) -> float:
+    """Return the average, over ``patterns``, of each one's best match with ``string``.
+
+    approx: the best similarity ratio of any search term to ``string``.
+    exact, contains: 1.0 if any search term is contained in ``string``, else 0.0.
+    """
+    if not patterns:
+        return 0.0
+    lowered = None
+    matchers = {}  # the string is analysed once (per case), not once per pattern
+    ratios = {}  # (term, string) -> ratio
+    total = 0.0
+    for pattern in patterns:
+        if pattern.case_sensitive:
+            target = string
+        else:
+            if lowered is None:
+                lowered = string.lower()
+            target = lowered
+        if pattern.mode == 'approx':
+            best = 0.0
+            for term in pattern.match_terms:
+                key = (term, target)
+                try:
+                    ratio = ratios[key]
+                except KeyError:
+                    ratio = ratios[key] = strings.get_best_ratio([term], [target], matchers=matchers)
+                if ratio > best:
+                    best = ratio
+            total += best
+        elif any(term in target for term in pattern.match_terms):
+            total += 1.0
+    return total / len(patterns)
+
+
+def header_ratios(
+        pattern: CompiledField,
+        headers: Sequence,
+        matchers: Optional[Dict] = None,
+        cache: Optional[Dict] = None,
+) -> List[float]:
+    """Return ``pattern``'s match ratio with each header (0.0: no match).
+
+    approx: the best similarity ratio of any search term to the header, if at least ``min_ratio``.
+    contains: 1.0 if any search term is contained in the header.
+    exact: 1.0 if the header is one of the search terms.
+
+    ``cache`` (optional) stores approx ratios by (term, header, min_ratio).
+    Share it between patterns to compare each distinct term and header only once.
+    """
+    if not pattern.case_sensitive:
+        headers = [header.lower() for header in headers]
+    return _header_ratios(pattern, headers, {} if matchers is None else matchers, {} if cache is None else cache)
+
+
+def _header_ratios(pattern: CompiledField, headers: Sequence, matchers: Dict, cache: Dict) -> List[float]:
+    # header_ratios, for headers already lowercased if the pattern is case-insensitive.
+    mode = pattern.mode
+    terms = pattern.match_terms
+    min_ratio = pattern.min_ratio
+
+    if mode == 'approx':
+        # Same result as string_analysis.get_best_match_case_sensitive(terms, [header], min_ratio, matchers).ratio
+        ratios = []
+        for header in headers:
+            score = None
+            best = 0.0
+            for term in terms:
+                key = (term, header, min_ratio)
+                try:
+                    ratio = cache[key]
+                except KeyError:
+                    if term == header:
+                        ratio = 1.0
+                    else:
+                        if score is None:
+                            score = strings.get_matcher(header, matchers)
+                        ratio = score(term, min_ratio)
+                        if ratio < min_ratio:
+                            ratio = 0.0
+                    cache[key] = ratio
+                if ratio > best:
+                    best = ratio
+            ratios.append(best)
+        return ratios
+
+    if mode == 'contains':
+        return [1.0 if any(term in header for term in terms) else 0.0 for header in headers]
+
+    # i.e. mode == 'exact'
+    return [1.0 if header in terms else 0.0 for header in headers]
+
+
+if __name__ == '__main__':
+    pass
@@ -1,5 +1,7 @@
 from fuzzytable.patterns.fieldpattern import \
     FieldPattern, \
+    CompiledField, \
+    compile_fields, \
     minratio_getter,\
     minratio_setter, \
     mode_getter
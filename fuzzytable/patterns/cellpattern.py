@@ -5,6 +5,7 @@ CellPattern provides tools for normalizing and parsing the values retrieved from
 # --- Standard Library Imports ------------------------------------------------
 from abc import ABC, abstractmethod
 from inspect import isclass
+from typing import Callable, List
 
 # --- Intra-Package Imports ---------------------------------------------------
 from fuzzytable import exceptions
@@ -28,6 +29,15 @@ class CellPattern(ABC):
     def apply_pattern(self, value):
         raise NotImplementedError  # pragma: no cover
 
+    def apply_column(self, values: List) -> List:
+        """Return a new list holding the normalized value of each cell in a column.
+
+        Override this to normalize a whole column faster than one ``apply_pattern`` call per cell.
+        Results must be identical to ``[self.apply_pattern(value) for value in values]``.
+        """
+        apply_pattern = self.apply_pattern
+        return [apply_pattern(value) for value in values]
+
 
 def normalize_cellpattern(value):
     # returns a single callable that each cell value will be passed through
@@ -44,3 +54,30 @@ def normalize_cellpattern(value):
         return value
     else:
         raise exceptions.CellPatternError(value)
+
+
+def get_column_function(cellpattern: Callable) -> Callable[[List], List]:
+    # Return a callable that normalizes a whole column,
+    # given a cellpattern already passed through normalize_cellpattern.
+
+    owner = getattr(cellpattern, '__self__', None)
+    if isinstance(owner, CellPattern) and _column_hook_applies(type(owner)):
+        return owner.apply_column
+
+    def apply_column(values):
+        return [cellpattern(value) for value in values]
+    return apply_column
+
+
+def _column_hook_applies(cls) -> bool:
+    # An apply_column hook is only used if it belongs to (a subclass of) the class defining apply_pattern.
+    # Otherwise, e.g. a subclass of Integer overriding only apply_pattern would be bypassed.
+    column_class = _defining_class(cls, 'apply_column')
+    pattern_class = _defining_class(cls, 'apply_pattern')
+    return issubclass(column_class, pattern_class)
+
+
+def _defining_class(cls, attribute):
+    for klass in cls.__mro__:
+        if attribute in vars(klass):
+            return klass
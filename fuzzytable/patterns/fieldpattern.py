@@ -5,7 +5,8 @@ providing more advanded field search options.
 """
 
 # --- Standard Library Imports ------------------------------------------------
-from typing import List, Optional
+from collections import namedtuple
+from typing import List, Optional, Tuple
 
 # --- Intra-Package Imports ---------------------------------------------------
 from fuzzytable import exceptions
@@ -17,6 +18,20 @@ from fuzzytable.patterns.cellpattern import normalize_cellpattern
 # None
 
 
+CompiledField = namedtuple(
+    "CompiledField",
+    "name terms mode case_sensitive min_ratio multifield cellpattern dictionary_encode match_terms",
+)
+CompiledField.__doc__ = """A FieldPattern with every setting resolved. Immutable; see :func:`compile_fields`.
+
+Attributes:
+    name, terms, mode, case_sensitive, min_ratio, multifield, cellpattern, dictionary_encode:
+        as for :obj:`~fuzzytable.FieldPattern`, with FuzzyTable-wide settings applied.
+    match_terms: ``tuple`` of the search terms as compared with headers:
+        lowercased if not ``case_sensitive``, without duplicates.
+"""
+
+
 class FieldPattern:
     """
     Optional argument for :obj:`FuzzyTable subfields<fuzzytable.FuzzyTable>` parameter.
@@ -57,6 +72,12 @@ class FieldPattern:
             will produce no matches!
         case_sensitive (None or ``bool``, default ``True``): Used when seeking header row and
             matching Fields to FieldPatterns.
+        dictionary_encode (``bool``, default ``False``): If True, each distinct (normalized) cell value
+            is stored only once. Use this for repetitive columns (status, region, product line...).
+            The field's data is then a :obj:`~fuzzytable.datamodel.columns.DictColumn`,
+            whose ``codes`` and ``dictionary`` are also available via ``SingleField.encode()``.
+            ``FuzzyTable.chunks`` yields DictColumns sharing one dictionary;
+            ``FuzzyTable.stream`` yields one shared instance per distinct value.
     """
 
     def __init__(
@@ -80,6 +101,8 @@ class FieldPattern:
             # The IS NO corresponding FuzzyTable value:
             searchterms_excludename=False,
             case_sensitive=DefaultValue,
+            # The IS NO corresponding FuzzyTable value:
+            dictionary_encode=False,
     ):
         self.name = name
         self.alias = alias
@@ -89,6 +112,7 @@ class FieldPattern:
         self.searchterms_excludename = searchterms_excludename
         self._mode = mode_setter(mode, approximate_match, contains_match)
         self._case_sensitive = casesensitive_setter(case_sensitive)
+        self.dictionary_encode = bool(dictionary_encode)
         self.fuzzytable = None  #
 
     @property
@@ -101,14 +125,43 @@ class FieldPattern:
         attr_value = self._get_value_allow_fuzzytable_to_override('_mode')
         return mode_getter(attr_value)
 
-    def _get_value_allow_fuzzytable_to_override(self, attr):
+    def _get_value_allow_fuzzytable_to_override(self, attr, fuzzytable=None):
         # FieldPattern attributes override the 'global' arguments passed to FuzzyTable.
         # Any FieldPattern attributes that were left at default use the FuzzyTable's value.
+        # fuzzytable: anything holding the FuzzyTable-wide settings (default: self.fuzzytable).
         self_attr = getattr(self, attr)
         if self_attr is not DefaultValue:
             return self_attr
-        else:
-            return getattr(self.fuzzytable, attr)
+        if fuzzytable is None:
+            fuzzytable = self.fuzzytable
+        if fuzzytable is None:
+            return DefaultValue
+        return getattr(fuzzytable, attr)
+
+    def compile(self, fuzzytable=None) -> CompiledField:
+        """Return this pattern with every setting resolved, as a :obj:`CompiledField`.
+
+        Settings left at default take the value of ``fuzzytable``
+        (anything holding FuzzyTable-wide settings, such as a :obj:`~fuzzytable.FuzzyTable`), or the global default.
+        See :func:`compile_fields`.
+        """
+        def resolve(attr):
+            return self._get_value_allow_fuzzytable_to_override(attr, fuzzytable)
+
+        case_sensitive = casesensitive_getter(resolve('_case_sensitive'))
+        terms = self.terms
+        match_terms = terms if case_sensitive else [term.lower() for term in terms]
+        return CompiledField(
+            name=self.name,
+            terms=tuple(terms),
+            mode=mode_getter(resolve('_mode')),
+            case_sensitive=case_sensitive,
+            min_ratio=minratio_getter(resolve('_min_ratio')),
+            multifield=self.multifield,
+            cellpattern=self.cellpattern,
+            dictionary_encode=self.dictionary_encode,
+            match_terms=tuple(dict.fromkeys(match_terms)),
+        )
 
     @property
     def alias(self):
@@ -144,6 +197,63 @@ class FieldPattern:
         return get_repr(self)  # pragma: no cover
 
 
+class _TableSettings:
+    # The FuzzyTable-wide settings that FieldPatterns fall back on (as stored by FuzzyTable).
+
+    def __init__(self, approximate_match=False, min_ratio=DefaultValue, mode=DefaultValue, case_sensitive=DefaultValue):
+        self._min_ratio = minratio_setter(min_ratio)
+        self._mode = mode_setter(mode, approximate_match, False)
+        self._case_sensitive = casesensitive_setter(case_sensitive)
+
+
+def compile_fields(
+        fields,
+        approximate_match=False,
+        min_ratio=DefaultValue,
+        mode=DefaultValue,
+        case_sensitive=DefaultValue,
+) -> Tuple[CompiledField, ...]:
+    """Resolve the settings of each field once, up front.
+
+    Takes the ``fields`` argument of :obj:`~fuzzytable.FuzzyTable`, and the FuzzyTable-wide settings
+    that FieldPatterns fall back on (``approximate_match``, ``min_ratio``, ``mode``, ``case_sensitive``).
+    Returns a tuple of :obj:`CompiledField`, one per field.
+    Pass it as ``fields`` to any number of :obj:`~fuzzytable.FuzzyTable` calls, threads, or worker processes:
+
+    >>> fields = fuzzytable.compile_fields(['first_name', FieldPattern('dob', alias='birthday')], mode='approx')
+    >>> tables = [FuzzyTable(path, fields=fields) for path in paths]
+
+    The result is immutable, and picklable if every cellpattern is.
+    The FieldPattern objects passed in are left unchanged.
+    A FuzzyTable given compiled fields doesn't apply its own ``mode`` (etc.) to them.
+    """
+    settings = _TableSettings(approximate_match, min_ratio, mode, case_sensitive)
+    return tuple(compile_field(field, settings) for field in force_fields(fields))
+
+
+def force_fields(fields) -> List:
+    # Return the FuzzyTable ``fields`` argument as a list.
+    if fields is None:
+        return []
+    if isinstance(fields, (str, FieldPattern, CompiledField)):
+        return [fields]
+    try:
+        return list(fields)
+    except TypeError:
+        raise exceptions.InvalidFieldError(fields)
+
+
+def compile_field(field, fuzzytable=None) -> CompiledField:
+    # Compile a field name, FieldPattern, or (already) CompiledField. See FieldPattern.compile.
+    if isinstance(field, CompiledField):
+        return field
+    if isinstance(field, str):
+        field = FieldPattern(name=field)
+    elif not isinstance(field, FieldPattern):
+        raise exceptions.InvalidFieldError(field)
+    return field.compile(fuzzytable)
+
+
 def casesensitive_getter(value):
     if value is DefaultValue:
         return True
@@ -52,6 +52,8 @@ class SheetPattern:
             no exception is raised. FuzzyTable will return what tables it can.
         path (:obj:`str`, :obj:`pathlib.Path`, default :obj:`None`): Path to workbook.
             If given, overrides ``FuzzyTable``'s ``path`` parameter.
+        workbook (openpyxl ``Workbook``, default :obj:`None`): An already loaded (read-only) workbook to share.
+            See :func:`fuzzytable.read_workbook`.
 
     Note:
         A worksheet can only match with a single sheetname (and its aliases).
@@ -60,7 +62,7 @@ class SheetPattern:
         use an ``ordereddict`` to set the relative priority of the sheetnames.
     """
 
-    def __init__(self, path, sheetname=None):
+    def __init__(self, path, sheetname=None, workbook=None):
 
         # CSV
         try:
@@ -72,7 +74,7 @@ class SheetPattern:
             return
 
         # EXCEL
-        self.sheet_reader = sheetreader.ExcelReader(path, sheetname)
+        self.sheet_reader = sheetreader.ExcelReader(path, sheetname, workbook)
         # Note: this will raise a custom exception if the openpyxl doesn't accept the path or sheetname
         # This is by design.
 
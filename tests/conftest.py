@@ -205,6 +205,23 @@ def create_csv(path, fields, start_row=1):
         csvwriter.writerows(records)
 
 
+@pytest.fixture(scope='function')
+def make_csv(tmp_path):
+    # Return a function that writes a csv of row_count records (headers in row 3) to tmp_path / filename.
+
+    def make(filename, row_count=20):
+        path = tmp_path / filename
+        create_csv(path, {
+            'id': list(range(row_count)),
+            'Status': ['open' if row_num % 3 else 'closed' for row_num in range(row_count)],
+            'name 1': [f"first {row_num}" for row_num in range(row_count)],
+            'name 2': [f"last {row_num}" for row_num in range(row_count)],
+        }, start_row=3)
+        return path
+
+    return make
+
+
 #############
 #  scratch  #
 ###############################################################################
@@ -0,0 +1,59 @@
+"""
+Benchmark: built-in cell patterns, one apply_pattern call per cell vs. apply_column.
+
+python -m tests.experiments.bench_apply_column
+"""
+
+import random
+import time
+
+from fuzzytable import cellpatterns
+from fuzzytable.main.typeinference import infer_column
+
+
+def make_column(row_count=100_000, seed=0):
+    rng = random.Random(seed)
+    raw = [
+        rng.choice([
+            str(rng.randint(0, 10_000)),
+            f"{rng.random() * 100:.2f}",
+            f"unit {rng.randint(1, 99)}",
+            'n/a',
+            '',
+        ])
+        for _ in range(row_count)
+    ]
+    return infer_column(raw, literals=True)
+
+
+def bench(cellpattern_class, column):
+    cellpattern = cellpattern_class()
+
+    start = time.perf_counter()
+    expected = [cellpattern.apply_pattern(value) for value in column]
+    per_cell = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = cellpattern.apply_column(column)
+    batch = time.perf_counter() - start
+
+    assert actual == expected
+    print(
+        f"{cellpattern_class.__name__:>12}: "
+        f"per cell {per_cell * 1e9 / len(column):7.1f} ns/cell, "
+        f"apply_column {batch * 1e9 / len(column):7.1f} ns/cell, "
+        f"speedup {per_cell / batch:5.1f}x"
+    )
+
+
+if __name__ == '__main__':
+    column = make_column()
+    for cellpattern_class in [
+        cellpatterns.Integer,
+        cellpatterns.Float,
+        cellpatterns.String,
+        cellpatterns.Boolean,
+        cellpatterns.Digit,
+        cellpatterns.IntegerList,
+    ]:
+        bench(cellpattern_class, column)
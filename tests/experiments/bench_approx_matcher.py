@@ -0,0 +1,54 @@
+"""
+Benchmark: approximate StringChoice matching, brute force vs. ApproxMatcher.
+
+python -m tests.experiments.bench_approx_matcher
+"""
+
+import random
+import string
+import time
+
+from fuzzytable.main import matchers
+from fuzzytable.main import string_analysis as strings
+
+
+def random_word(rng, min_len=4, max_len=14):
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(min_len, max_len)))
+
+
+def typo(rng, word):
+    index = rng.randrange(len(word))
+    return word[:index] + rng.choice(string.ascii_lowercase) + word[index + 1:]
+
+
+def bench(choice_count, cell_count=500, min_ratio=0.6, seed=0):
+    rng = random.Random(seed)
+    choices = {}
+    for _ in range(choice_count):
+        key = random_word(rng)
+        choices[key] = [random_word(rng), key]
+    terms = [term for terms in choices.values() for term in terms]
+    cells = [typo(rng, rng.choice(terms)) if rng.random() < 0.7 else random_word(rng) for _ in range(cell_count)]
+
+    start = time.perf_counter()
+    expected = [strings.get_bestkey(choices, cell, 'approx', None, False, min_ratio) for cell in cells]
+    brute_force = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = matchers.get_matcher(choices, 'approx', False, min_ratio)
+    actual = [matcher.get_bestkey(cell) for cell in cells]
+    indexed = time.perf_counter() - start
+
+    actual = [strings.BestKey(None, 0.0) if bestkey is strings.NoMatch else bestkey for bestkey in actual]
+    assert actual == expected
+    print(
+        f"{choice_count:>6} choices: "
+        f"brute force {brute_force * 1e6 / cell_count:9.1f} us/cell, "
+        f"ApproxMatcher {indexed * 1e6 / cell_count:8.1f} us/cell, "
+        f"speedup {brute_force / indexed:5.1f}x"
+    )
+
+
+if __name__ == '__main__':
+    for count in [10, 100, 1000, 5000]:
+        bench(count)
@@ -0,0 +1,54 @@
+"""
+Benchmark: matching hundreds of FieldPatterns to the headers of a very wide sheet.
+
+python -m tests.experiments.bench_assignment
+"""
+
+import csv
+import os
+import random
+import tempfile
+import time
+
+from fuzzytable import FuzzyTable, FieldPattern
+
+words = ['amount', 'date', 'customer', 'region', 'total', 'qty', 'price', 'code', 'status', 'note', 'tax', 'net', 'id']
+
+
+def make_csv(path, col_count=800, row_count=5, seed=0):
+    rng = random.Random(seed)
+    headers = []
+    while len(headers) < col_count:
+        header = ' '.join(rng.sample(words, 2)) + f" {rng.randint(1, 400)}"
+        if header not in headers:
+            headers.append(header)
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(headers)
+        for row_num in range(row_count):
+            writer.writerow([row_num] * col_count)
+    return headers
+
+
+def make_fields(headers, mode, field_count=300, seed=0):
+    rng = random.Random(seed)
+    return [
+        FieldPattern(
+            header.replace(' ', '_'), alias=header.upper(), mode=mode,
+            case_sensitive=False, multifield=(field_num % 50 == 0),
+        )
+        for field_num, header in enumerate(rng.sample(headers, field_count))
+    ]
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'wide.csv')
+        headers = make_csv(path)
+        for assignment in ['greedy', 'optimal']:
+            for mode in ['exact', 'contains', 'approx']:
+                fields = make_fields(headers, mode)
+                start = time.perf_counter()
+                table = FuzzyTable(path, fields=fields, assignment=assignment)
+                elapsed = time.perf_counter() - start
+                print(f"{assignment:>8} {mode:>8}: {elapsed:6.2f} s ({len(table.fields)} fields matched)")
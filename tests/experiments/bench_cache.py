@@ -0,0 +1,47 @@
+"""
+Benchmark: re-reading a large worksheet, with and without an extraction cache (cache_dir).
+
+python -m tests.experiments.bench_cache
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from openpyxl import Workbook
+
+from fuzzytable import FuzzyTable, FieldPattern, cellpatterns
+
+fields = ['first_name', 'last_name', FieldPattern('amount', cellpattern=cellpatterns.Integer)]
+
+
+def make_workbook(path, row_count=100_000, seed=0):
+    rng = random.Random(seed)
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('data')
+    worksheet.append(['report', 'generated', rng.random()])  # junk above the header
+    worksheet.append(['First Name', 'Last Name', 'Amount', 'Notes'])
+    for row_num in range(row_count):
+        worksheet.append([f"first{row_num % 97}", f"last{row_num % 89}", rng.randint(0, 10_000), f"note {row_num}"])
+    workbook.save(path)
+
+
+def timed(label, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>24}: {time.perf_counter() - start:6.2f} s")
+    return result
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'big.xlsx')
+        cache_dir = os.path.join(directory, 'cache')
+        make_workbook(path)
+        kwargs = dict(sheetname='data', fields=fields, header_row_seek=True, mode='approx', case_sensitive=False)
+        expected = timed('no cache', lambda: FuzzyTable(path, **kwargs))
+        timed('cache miss (and store)', lambda: FuzzyTable(path, cache_dir=cache_dir, **kwargs))
+        actual = timed('cache hit', lambda: FuzzyTable(path, cache_dir=cache_dir, **kwargs))
+        assert dict(actual) == dict(expected)
+        print(f"{'entry size':>24}: {sum(entry.stat().st_size for entry in os.scandir(cache_dir)) / 2 ** 20:6.2f} MiB")
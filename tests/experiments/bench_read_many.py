@@ -0,0 +1,56 @@
+"""
+Benchmark: one FuzzyTable per file in a loop vs. read_many (in process and with a process pool).
+
+python -m tests.experiments.bench_read_many
+"""
+
+import csv
+import os
+import random
+import tempfile
+import time
+
+from fuzzytable import FuzzyTable, FieldPattern, read_many
+
+fields = [FieldPattern(name, alias=aliases) for name, aliases in [
+    ('first_name', ['given name', 'forename']),
+    ('last_name', ['surname', 'family name']),
+    ('amount', ['total', 'amount due']),
+    ('invoice_date', ['date', 'billed on']),
+]]
+headers = ['First Name', 'Surname', 'Amount Due', 'Billed On', 'Vendor Notes', 'Vendor Ref']
+
+
+def make_files(directory, file_count=500, row_count=200, seed=0):
+    rng = random.Random(seed)
+    paths = []
+    for file_num in range(file_count):
+        path = os.path.join(directory, f"vendor_{file_num}.csv")
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            for _ in range(rng.randint(0, 5)):
+                writer.writerow(['export', 'generated', rng.random()])
+            writer.writerow(headers)
+            for row_num in range(row_count):
+                writer.writerow([f"first{row_num}", f"last{row_num}", rng.randint(0, 10_000), '2019-12-16', '', row_num])
+        paths.append(path)
+    return paths
+
+
+def timed(label, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>24}: {time.perf_counter() - start:6.2f} s")
+    return result
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_files(directory)
+        kwargs = dict(fields=fields, header_row_seek=True, mode='approx', case_sensitive=False)
+        expected = timed('FuzzyTable loop', lambda: [FuzzyTable(path, **kwargs) for path in paths])
+        actual = timed('read_many', lambda: list(read_many(paths, **kwargs)))
+        assert [result.table.records for result in actual] == [table.records for table in expected]
+        for workers in [2, 4]:
+            actual = timed(f'read_many workers={workers}', lambda: list(read_many(paths, workers=workers, **kwargs)))
+            assert all(result.error is None for result in actual)
@@ -0,0 +1,45 @@
+"""
+Benchmark: similarity backends, scoring many search terms against many targets.
+
+python -m tests.experiments.bench_similarity
+"""
+
+import random
+import string
+import time
+
+from fuzzytable.main import similarity
+
+
+def random_word(rng, min_len=4, max_len=20):
+    return ''.join(rng.choice(string.ascii_lowercase + ' ') for _ in range(rng.randint(min_len, max_len)))
+
+
+def bench(backend_name, min_ratio, target_count=300, term_count=300, seed=0):
+    rng = random.Random(seed)
+    targets = [random_word(rng) for _ in range(target_count)]
+    terms = [random_word(rng) for _ in range(term_count)]
+    backend = similarity._backends[backend_name]
+
+    start = time.perf_counter()
+    scores = []
+    for target in targets:
+        score = backend.scorer(target)
+        scores.extend(score(term, min_ratio) for term in terms)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e6 / (target_count * term_count), scores
+
+
+if __name__ == '__main__':
+    for min_ratio in [0.0, 0.6]:
+        baseline, expected = bench('difflib', min_ratio)
+        for name in similarity.available_backends():
+            per_pair, actual = bench(name, min_ratio)
+            assert all(
+                score == expected_score if expected_score >= min_ratio else score < min_ratio
+                for score, expected_score in zip(actual, expected)
+            )
+            print(
+                f"min_ratio {min_ratio}: {name:>10} {per_pair:6.2f} us/pair, "
+                f"speedup {baseline / per_pair:5.1f}x"
+            )
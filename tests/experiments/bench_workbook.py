@@ -0,0 +1,55 @@
+"""
+Benchmark: one FuzzyTable per worksheet in a loop vs. read_workbook (in process and with a process pool).
+
+python -m tests.experiments.bench_workbook
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from openpyxl import Workbook
+
+from fuzzytable import FuzzyTable, read_workbook
+
+fields = ['first_name', 'last_name', 'amount']
+
+
+def make_workbook(path, sheet_count=60, row_count=2_000, seed=0):
+    rng = random.Random(seed)
+    workbook = Workbook(write_only=True)
+    for sheet_num in range(sheet_count):
+        worksheet = workbook.create_sheet(f"month {sheet_num + 1}")
+        for _ in range(rng.randint(0, 5)):
+            worksheet.append(['report', 'generated', rng.random()])  # junk above the header
+        worksheet.append(['First Name', 'Last Name', 'Amount', 'Notes'])
+        for row_num in range(row_count):
+            worksheet.append([f"first{row_num % 97}", f"last{row_num % 89}", rng.randint(0, 10_000), f"note {row_num}"])
+    workbook.save(path)
+
+
+def timed(label, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>24}: {time.perf_counter() - start:6.2f} s")
+    return result
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'monthly.xlsx')
+        make_workbook(path)
+        kwargs = dict(fields=fields, header_row_seek=True, mode='approx', case_sensitive=False)
+
+        def loop():
+            from openpyxl import load_workbook
+            names = load_workbook(path, read_only=True).sheetnames
+            return {name: FuzzyTable(path, name, **kwargs) for name in names}
+
+        expected = timed('FuzzyTable loop', loop)
+        actual = timed('read_workbook', lambda: read_workbook(path, **kwargs))
+        assert all(actual[name].records == table.records for name, table in expected.items())
+        for workers in [2, 4]:
+            actual = timed(f'read_workbook workers={workers}', lambda: read_workbook(path, workers=workers, **kwargs))
+            assert all(actual[name].records == table.records for name, table in expected.items())
@@ -227,3 +227,31 @@ def test3_9_fuzzytable_invalidmode(first_names):
             path=first_names.path,
             mode=mode
         )
+
+
+# 10  #####
+def test3_10_single_pass_extraction(first_names, monkeypatch):
+
+    # GIVEN a table with several columns...
+    from fuzzytable.main.sheetreader import CsvReader
+    orig_iter_row = CsvReader.iter_row
+    passes = []
+
+    def counting_iter_row(self, *args, **kwargs):
+        passes.append(kwargs.get('start_row'))
+        return orig_iter_row(self, *args, **kwargs)
+
+    monkeypatch.setattr(CsvReader, 'iter_row', counting_iter_row)
+
+    # WHEN user extracts all of them (including a multifield)...
+    fields = ['id', FieldPattern('name', multifield=True, min_ratio=0.3, mode='approx')]
+    ft = FuzzyTable(path=first_names.path, fields=fields)
+
+    # THEN the data region is read only once...
+    data_passes = [start_row for start_row in passes if start_row == 2]
+    assert len(data_passes) == 1
+
+    # ... and every column is still correctly populated.
+    assert ft['id'] == first_names.fields['id']
+    assert ft.get_field('name').subfields[1].data == first_names.fields['name 1']
+    assert ft.sheet.row_count == 4
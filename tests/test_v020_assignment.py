@@ -0,0 +1,198 @@
+import itertools
+import random
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern, exceptions, read_many
+from fuzzytable.datamodel import SingleField
+from fuzzytable.parsers.fieldparser import FieldParser, assign_fields, assign_fields_optimal
+from fuzzytable.parsers import matching
+from fuzzytable.parsers.matching import max_weight_matching
+from tests.conftest import create_csv
+
+
+def greedy_reference(fieldparsers):
+    # The assignment loop as it was before assign_fields:
+    # repeatedly give the best remaining (pattern, field) pair to the earliest pattern that can take it.
+    remaining = [
+        sorted(reversed(fieldparser.potential_fields), key=lambda potential_field: potential_field.ratio)
+        for fieldparser in fieldparsers
+    ]
+
+    def best(parser_index):
+        potential_fields = remaining[parser_index]
+        while potential_fields and potential_fields[-1].field.matched:
+            potential_fields.pop()
+        return potential_fields[-1] if potential_fields else None
+
+    def still_seeking(parser_index):
+        fieldparser = fieldparsers[parser_index]
+        if best(parser_index) is None:
+            return False
+        return fieldparser.fieldpattern.multifield or not fieldparser.matched
+
+    while True:
+        seeking = [parser_index for parser_index in range(len(fieldparsers)) if still_seeking(parser_index)]
+        if not seeking:
+            return
+        parser_index = max(seeking, key=lambda index: best(index).ratio)
+        fieldparsers[parser_index].assign_field(best(parser_index))
+
+
+def make_case(seed):
+    rng = random.Random(seed)
+    words = ['name', 'first', 'last', 'date', 'birth', 'id', 'Name', 'amount']
+    headers = [
+        '_'.join(rng.choice(words) for _ in range(rng.randint(1, 2)))
+        for _ in range(rng.randint(1, 12))
+    ]  # few words, so near-duplicate headers and tied ratios are common
+    fieldpatterns = [
+        FieldPattern(
+            rng.choice(words) + str(pattern_num),
+            alias=[rng.choice(words), rng.choice(headers)],
+            mode=rng.choice(['exact', 'contains', 'approx']),
+            case_sensitive=rng.choice([True, False]),
+            min_ratio=rng.choice([0.3, 0.6]),
+            multifield=rng.random() < 0.2,
+        )
+        for pattern_num in range(rng.randint(1, 6))
+    ]
+    return headers, fieldpatterns
+
+
+def assignments(headers, fieldpatterns, assign):
+    fields = [SingleField(header, col_num) for col_num, header in enumerate(headers, 1)]
+    fieldparsers = [FieldParser(fieldpattern, fields) for fieldpattern in fieldpatterns]
+    assign(fieldparsers)
+    return [(field.name, field.ratio) if field.matched else None for field in fields]
+
+
+@pytest.mark.parametrize('seed', range(200))
+# 020/1 #####
+def test_20_1_assign_fields_same_as_greedy_loop(seed):
+
+    # GIVEN random headers and FieldPatterns (ties, near-duplicate headers, multifield patterns)...
+    headers, fieldpatterns = make_case(seed)
+
+    # WHEN fields are assigned using the priority queue...
+    actual = assignments(headers, fieldpatterns, assign_fields)
+
+    # THEN every field goes to the same pattern as with the original greedy loop.
+    expected = assignments(headers, fieldpatterns, greedy_reference)
+    assert actual == expected
+
+
+# 020/2 #####
+def test_20_2_ties_go_to_earlier_pattern_then_earlier_column():
+    fields = [SingleField(header, col_num) for col_num, header in enumerate(['id', 'id', 'ID'], 1)]
+    fieldparsers = [
+        FieldParser(FieldPattern(name, alias='id', mode='exact', case_sensitive=False), fields)
+        for name in ['a', 'b', 'c', 'd']
+    ]
+    assign_fields(fieldparsers)
+    assert [field.name for field in fields] == ['a', 'b', 'c']
+    assert not fieldparsers[-1].matched
+
+
+# 020/3 #####
+def test_20_3_optimal_assignment(tmp_path):
+
+    # GIVEN an abbreviated header that only the better-fitting field can match...
+    path = tmp_path / 'orders.csv'
+    create_csv(path, {'Cust.': ['c1', 'c2'], 'Customer': ['Ann', 'Bob']})
+    fields = [
+        FieldPattern('customer', mode='approx', min_ratio=0.5, case_sensitive=False),
+        FieldPattern('customer_name', mode='approx', min_ratio=0.5, case_sensitive=False),
+    ]
+
+    # WHEN fields are assigned greedily, 'customer' takes the exact match...
+    greedy = FuzzyTable(path, fields=fields)
+    assert dict(greedy) == {'customer': ['Ann', 'Bob']}
+
+    # THEN ...but the optimal assignment matches both fields.
+    optimal = FuzzyTable(path, fields=fields, assignment='optimal')
+    assert dict(optimal) == {'customer': ['c1', 'c2'], 'customer_name': ['Ann', 'Bob']}
+    assert list(FuzzyTable.stream(path, fields=fields, assignment='optimal')) == list(optimal.records)
+
+    with pytest.raises(exceptions.InvalidAssignmentError):
+        FuzzyTable(path, fields=fields, assignment='best')
+    with pytest.raises(exceptions.InvalidAssignmentError):
+        read_many([path], fields=fields, assignment=None)
+
+
+def brute_force_total(headers, fieldpatterns):
+    # The highest total ratio over every way of giving each single-field pattern one field (or none).
+    # Multifield patterns then take each remaining field they match.
+    fields = [SingleField(header, col_num) for col_num, header in enumerate(headers, 1)]
+    fieldparsers = [FieldParser(fieldpattern, fields) for fieldpattern in fieldpatterns]
+    ratios = [{pf.position: pf.ratio for pf in fieldparser.potential_fields} for fieldparser in fieldparsers]
+    multifield_ratios = [
+        max([ratio[position] for ratio, fieldparser in zip(ratios, fieldparsers)
+             if fieldparser.fieldpattern.multifield and position in ratio], default=0.0)
+        for position in range(len(fields))
+    ]
+    singles = [ratio for ratio, fieldparser in zip(ratios, fieldparsers) if not fieldparser.fieldpattern.multifield]
+    best = 0.0
+    for choice in itertools.product(*([None] + list(ratio) for ratio in singles)):
+        taken = [position for position in choice if position is not None]
+        if len(taken) != len(set(taken)):
+            continue
+        total = sum(ratio[position] for ratio, position in zip(singles, choice) if position is not None)
+        total += sum(multifield_ratio for position, multifield_ratio in enumerate(multifield_ratios) if position not in taken)
+        best = max(best, total)
+    return best
+
+
+@pytest.mark.parametrize('seed', range(200))
+# 020/4 #####
+def test_20_4_optimal_total_ratio(seed):
+
+    # GIVEN random headers and FieldPatterns...
+    headers, fieldpatterns = make_case(seed)
+
+    # WHEN fields are assigned optimally...
+    fields = [SingleField(header, col_num) for col_num, header in enumerate(headers, 1)]
+    assign_fields_optimal([FieldParser(fieldpattern, fields) for fieldpattern in fieldpatterns])
+
+    # THEN the total ratio is the best possible (and so never below that of greedy matching)...
+    total = sum(field.ratio for field in fields if field.matched)
+    assert total == pytest.approx(brute_force_total(headers, fieldpatterns))
+    greedy = assignments(headers, fieldpatterns, assign_fields)
+    assert total >= sum(ratio for _, ratio in filter(None, greedy)) - 1e-9
+
+    # ...and each single-field pattern has at most one field.
+    names = [field.name for field in fields if field.matched]
+    for fieldpattern in fieldpatterns:
+        if not fieldpattern.multifield:
+            assert names.count(fieldpattern.name) <= 1
+
+
+# 020/5 #####
+def test_20_5_optimal_ties_and_greedy_agreement():
+
+    # Ties: earlier patterns get earlier columns, as with greedy matching.
+    headers = ['id', 'id', 'ID']
+    patterns = [FieldPattern(name, alias='id', mode='exact', case_sensitive=False) for name in 'abcd']
+    assert assignments(headers, patterns, assign_fields_optimal) == assignments(headers, patterns, assign_fields)
+
+    # Without conflicts, optimal and greedy matching agree.
+    headers = ['First Name', 'Last Name', 'Birthday', 'Notes']
+    patterns = [FieldPattern(name, mode='approx', case_sensitive=False, min_ratio=0.6) for name in ['first_name', 'last_name', 'dob']]
+    assert assignments(headers, patterns, assign_fields_optimal) == assignments(headers, patterns, assign_fields)
+
+
+@pytest.mark.parametrize('solver', [max_weight_matching, matching._sparse_matching, matching._dense_matching])
+@pytest.mark.parametrize('seed', range(50))
+# 020/6 #####
+def test_20_6_max_weight_matching(seed, solver):
+    rng = random.Random(seed)
+    rows = {
+        row: [(col, rng.randint(1, 5)) for col in rng.sample(range(5), rng.randint(0, 5))]
+        for row in range(rng.randint(1, 5))
+    }
+    result = solver(rows)
+    weights = {(row, col): weight for row, edges in rows.items() for col, weight in edges}
+    assert len(set(result.values())) == len(result)
+    expected = max(
+        sum(weights.get((row, col), 0) for row, col in zip(rows, cols) if col is not None)
+        for cols in itertools.permutations(list(range(5)) + [None] * len(rows), len(rows))
+    )
+    assert sum(weights[row, col] for row, col in result.items()) == expected
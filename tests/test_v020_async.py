@@ -0,0 +1,134 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern, cellpatterns, exceptions
+from fuzzytable.main import sheetreader
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+# 020/1 #####
+@pytest.mark.parametrize('chunksize', [1, 2, 10_000])
+@pytest.mark.parametrize('kwargs', [
+    pytest.param({'fields': ['id', FieldPattern('name', multifield=True, min_ratio=0.3, mode='approx')]}, id='multifield'),
+    pytest.param({'fields': ['id', FieldPattern('name 1', dictionary_encode=True)], 'compact': True}, id='compact'),
+    pytest.param({'fields': ['name 1', FieldPattern('id', cellpattern=cellpatterns.Integer)]}, id='cellpattern'),
+])
+def test_20_1_aload_matches_sync(first_names, chunksize, kwargs):
+
+    # GIVEN a table loaded the usual way...
+    expected = FuzzyTable(first_names.path, header_row_seek=True, **kwargs)
+
+    # WHEN the same table is loaded asynchronously...
+    actual = run(FuzzyTable.aload(first_names.path, header_row_seek=True, chunksize=chunksize, **kwargs))
+
+    # THEN the header, fields, and data are identical.
+    assert isinstance(actual, FuzzyTable)
+    assert actual.sheet.header_row_num == expected.sheet.header_row_num
+    assert actual.sheet.header_ratio == expected.sheet.header_ratio
+    assert actual.sheet.row_count == expected.sheet.row_count
+    assert [field.header for field in actual.fields] == [field.header for field in expected.fields]
+    assert dict(actual) == dict(expected)
+    assert actual.records == expected.records
+
+
+# 020/2 #####
+@pytest.mark.parametrize('chunksize', [1, 1000])
+def test_20_2_astream_matches_stream(get_test_path, dr_who_records, chunksize):
+    kwargs = dict(sheetname='table_bottom_right', fields=dr_who_records[0].keys(), header_row_seek=True)
+    records = run(collect(FuzzyTable.astream(get_test_path(), chunksize=chunksize, **kwargs)))
+    assert records == list(FuzzyTable.stream(get_test_path(), **kwargs))
+
+    # Errors are those of the sync path.
+    with pytest.raises(exceptions.MissingFieldError):
+        run(FuzzyTable.aload(get_test_path(), fields=['middle_name'], missingfieldserror_active=True, **{
+            key: value for key, value in kwargs.items() if key != 'fields'
+        }))
+    with pytest.raises(exceptions.InvalidChunksizeError):
+        run(FuzzyTable.aload(get_test_path(), chunksize=0, **kwargs))
+
+
+# 020/3 #####
+def test_20_3_aload_cancel_between_chunks(make_csv, monkeypatch):
+
+    # GIVEN a load whose first chunk of data is slow...
+    path = make_csv('slow.csv', row_count=100)
+    seen = []
+    closed = []
+    close = sheetreader.SheetReader.close
+
+    def recording_close(self):
+        closed.append(self.path)
+        close(self)
+
+    monkeypatch.setattr(sheetreader.SheetReader, 'close', recording_close)
+
+    async def main():
+        loop = asyncio.get_event_loop()
+        task = None
+
+        def slow_cellpattern(value):
+            if not seen:
+                loop.call_soon_threadsafe(task.cancel)
+                time.sleep(0.1)  # still reading the first chunk when the cancellation arrives
+            seen.append(value)
+            return value
+
+        with ThreadPoolExecutor(1) as executor:
+            task = asyncio.ensure_future(FuzzyTable.aload(
+                path, fields=[FieldPattern('id', cellpattern=slow_cellpattern)],
+                header_row_seek=True, chunksize=10, executor=executor,
+            ))
+            # WHEN the task is cancelled mid-chunk...
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            # THEN the sheet is already closed when the task ends...
+            assert closed == [path]
+
+    run(main())
+
+    # ...and the chunk in progress was finished, but no further chunk was read.
+    assert len(seen) == 10
+
+
+# 020/4 #####
+def test_20_4_semaphore_limits_concurrent_loads(make_csv):
+
+    # GIVEN several files, and a record of which file each cell came from...
+    paths = [make_csv(f"file_{file_num}.csv") for file_num in range(3)]
+    order = []
+
+    def tracking_cellpattern(file_num):
+        def cellpattern(value):
+            order.append(file_num)
+            time.sleep(0.001)
+            return value
+        return cellpattern
+
+    async def main():
+        semaphore = asyncio.Semaphore(1)
+        return await asyncio.gather(*(
+            FuzzyTable.aload(path, fields=[FieldPattern('id', cellpattern=tracking_cellpattern(file_num))],
+                             header_row_seek=True, chunksize=5, semaphore=semaphore)
+            for file_num, path in enumerate(paths)
+        ))
+
+    # WHEN they are loaded concurrently, limited to one at a time...
+    tables = run(main())
+
+    # THEN each file was read from start to end before the next one began.
+    assert order == sorted(order)
+    assert [len(table['id']) for table in tables] == [20, 20, 20]
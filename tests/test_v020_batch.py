@@ -0,0 +1,193 @@
+import pickle
+import zipfile
+
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern, read_workbook, read_many, exceptions
+from fuzzytable.cellpatterns import Integer
+from fuzzytable.main import sheetreader
+from tests.conftest import create_csv
+
+
+fields = ['first_name', 'last_name', FieldPattern('last_appearance', cellpattern=Integer)]
+excel_sheetnames = ['table_top_left', 'table_top_right', 'table_bottom_left', 'table_bottom_right']
+
+
+# 020/1 #####
+@pytest.mark.parametrize('workers', [
+    pytest.param(None, id='in process'),
+    pytest.param(2, id='process pool'),
+])
+def test_20_1_read_workbook(get_test_path, workers):
+
+    # GIVEN a workbook whose worksheets each hold a table...
+    path = get_test_path()
+
+    # WHEN all worksheets are read at once...
+    tables = read_workbook(path, excel_sheetnames, workers=workers, fields=fields, header_row_seek=True)
+
+    # THEN each table equals the one read from that worksheet alone.
+    assert list(tables) == excel_sheetnames
+    for sheetname, table in tables.items():
+        expected = FuzzyTable(path, sheetname, fields=fields, header_row_seek=True)
+        assert table.name == sheetname
+        assert table.sheet.sheetname == sheetname
+        assert table.sheet.header_row_num == expected.sheet.header_row_num
+        assert dict(table) == dict(expected)
+        assert table.records == expected.records
+
+
+# 020/2 #####
+def test_20_2_read_workbook_loads_once(get_test_path, monkeypatch):
+
+    # GIVEN a count of workbook loads...
+    loads = []
+    load_workbook = sheetreader.load_workbook
+
+    def counting_load_workbook(*args, **kwargs):
+        loads.append(args)
+        return load_workbook(*args, **kwargs)
+    monkeypatch.setattr(sheetreader, 'load_workbook', counting_load_workbook)
+
+    # WHEN every worksheet is read...
+    tables = read_workbook(get_test_path())
+
+    # THEN the workbook was loaded only once.
+    assert len(loads) == 1
+    assert list(tables) == excel_sheetnames + ['data_pattern']
+    assert list(tables['data_pattern']) == ['index', 'values', 'notes']
+
+
+# 020/3 #####
+@pytest.mark.parametrize('workers', [None, 2])
+def test_20_3_read_workbook_errors(get_test_path, workers):
+
+    # A missing worksheet raises the same exception in a worker process.
+    with pytest.raises(exceptions.SheetnameError):
+        read_workbook(get_test_path(), ['table_top_left', 'no such sheet'], workers=workers)
+
+    # A csv file holds a single table.
+    tables = read_workbook(get_test_path('csv'), workers=workers)
+    assert list(tables) == [None]
+    assert dict(tables[None]) == dict(FuzzyTable(get_test_path('csv')))
+
+
+# 020/4 #####
+@pytest.mark.parametrize('workers', [0, -1, 1.5, 'two'])
+def test_20_4_invalid_workers(get_test_path, workers):
+    with pytest.raises(exceptions.InvalidWorkersError):
+        read_workbook(get_test_path(), workers=workers)
+
+
+# 020/5 #####
+def test_20_5_pickle(get_test_path):
+
+    # GIVEN a table and an exception...
+    table = FuzzyTable(get_test_path(), 'table_top_left', fields=fields, header_row_seek=True)
+    error = exceptions.MissingFieldError({'age'}, 'people')
+
+    # WHEN they are pickled (e.g. sent back from a worker process)...
+    table_copy = pickle.loads(pickle.dumps(table))
+    error_copy = pickle.loads(pickle.dumps(error))
+
+    # THEN the copies equal the originals.
+    assert dict(table_copy) == dict(table)
+    assert list(table_copy.records) == list(table.records)
+    assert type(error_copy) is exceptions.MissingFieldError
+    assert str(error_copy) == str(error)
+
+
+# 020/6 #####
+@pytest.mark.parametrize('workers', [
+    pytest.param(None, id='in process'),
+    pytest.param(2, id='process pool'),
+])
+def test_20_6_read_many(tmp_path, get_test_path, workers):
+
+    # GIVEN many files, some of them unreadable or missing a field...
+    paths = []
+    for file_num in range(6):
+        path = tmp_path / f"vendor_{file_num}.csv"
+        create_csv(path, {
+            'First Name': [f"first {file_num} {row_num}" for row_num in range(file_num + 1)],
+            'Last Name': [f"last {file_num} {row_num}" for row_num in range(file_num + 1)],
+        }, start_row=file_num % 3 + 1)
+        paths.append(path)
+    missing_field_path = tmp_path / 'missing_field.csv'
+    create_csv(missing_field_path, {'First Name': ['Jane']})
+    bad_paths = [tmp_path / 'not_there.csv', get_test_path('docx'), missing_field_path]
+    kwargs = dict(
+        fields=['first_name', 'last_name'],
+        header_row_seek=True,
+        mode='approx',
+        case_sensitive=False,
+        missingfieldserror_active=True,
+    )
+
+    # WHEN they are read as a batch (paths supplied lazily)...
+    results = list(read_many((path for path in paths + bad_paths), workers=workers, **kwargs))
+
+    # THEN each file has its own result...
+    assert sorted(map(str, (result.path for result in results))) == sorted(map(str, paths + bad_paths))
+    results = {result.path: result for result in results}
+
+    # ... the good files match FuzzyTable...
+    for path in paths:
+        result = results[path]
+        assert result.error is None
+        expected = FuzzyTable(path, **kwargs)
+        assert dict(result.table) == dict(expected)
+        assert result.table.sheet.header_row_num == expected.sheet.header_row_num
+
+    # ... and each failure is captured.
+    assert isinstance(results[bad_paths[0]].error, FileNotFoundError)
+    assert isinstance(results[bad_paths[1]].error, exceptions.InvalidFileError)
+    assert isinstance(results[bad_paths[2]].error, exceptions.MissingFieldError)
+    assert all(results[path].table is None for path in bad_paths)
+
+    # In process, results come in order of the paths.
+    if workers is None:
+        assert [result.path for result in read_many(paths, **kwargs)] == paths
+
+
+# 020/7 #####
+def test_20_7_read_many_invalid_arguments(get_test_path):
+
+    # Invalid arguments shared by all files are raised at once, before any file is read.
+    with pytest.raises(exceptions.InvalidWorkersError):
+        read_many([get_test_path('csv')], workers=0)
+    with pytest.raises(exceptions.InvalidFieldError):
+        read_many([get_test_path('csv')], fields=[1, 2])
+    with pytest.raises(exceptions.ModeError):
+        read_many([get_test_path('csv')], mode='nearby')
+
+
+# 020/8 #####
+def test_20_8_read_many_bad_files(tmp_path, monkeypatch):
+
+    # GIVEN files that can't be read: a garbage .xlsx, a .xlsx archive without a workbook,
+    # a latin-1 csv (read as utf-8, whatever the locale), and a csv with a short row...
+    monkeypatch.setattr('locale.getpreferredencoding', lambda do_setlocale=True: 'utf-8')
+    garbage_path = tmp_path / 'garbage.xlsx'
+    garbage_path.write_bytes(b'not a zip archive')
+    archive_path = tmp_path / 'archive.xlsx'
+    with zipfile.ZipFile(str(archive_path), 'w') as archive:
+        archive.writestr('readme.txt', 'not a workbook')
+    latin_path = tmp_path / 'latin.csv'
+    latin_path.write_bytes('name,city\nJosé,München\n'.encode('latin-1'))
+    short_path = tmp_path / 'short.csv'
+    short_path.write_text('name,city\nJane,Paris\nJoe\n')
+    good_path = tmp_path / 'good.csv'
+    create_csv(good_path, {'name': ['Jane'], 'city': ['Paris']})
+    paths = [garbage_path, archive_path, latin_path, short_path, good_path]
+
+    # WHEN they are read as a batch...
+    results = list(read_many(paths, fields=['name', 'city']))
+
+    # THEN each failure is captured, and the batch goes on.
+    assert [result.path for result in results] == paths
+    assert isinstance(results[0].error, exceptions.InvalidFileError)
+    assert isinstance(results[1].error, exceptions.InvalidFileError)
+    assert isinstance(results[2].error, UnicodeDecodeError)
+    assert isinstance(results[3].error, exceptions.InvalidFileError)
+    assert results[4].error is None
+    assert dict(results[4].table) == {'name': ['Jane'], 'city': ['Paris']}
@@ -0,0 +1,163 @@
+import asyncio
+import os
+import threading
+
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern, ExtractionCache, cellpatterns, exceptions, read_many
+from fuzzytable.main import sheetreader
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    # Count the passes made over any sheet.
+    reads = []
+    iter_row = sheetreader.SheetReader.iter_row
+
+    def counting_iter_row(self, *args, **kwargs):
+        reads.append(self.path)
+        return iter_row(self, *args, **kwargs)
+
+    monkeypatch.setattr(sheetreader.SheetReader, 'iter_row', counting_iter_row)
+    return reads
+
+
+def assert_same_table(actual, expected):
+    assert actual.sheet.header_row_num == expected.sheet.header_row_num
+    assert actual.sheet.header_ratio == expected.sheet.header_ratio
+    assert actual.sheet.row_count == expected.sheet.row_count
+    assert [(field.name, field.header, field.ratio) for field in actual.fields] == \
+           [(field.name, field.header, field.ratio) for field in expected.fields]
+    assert dict(actual) == dict(expected)
+    assert actual.records == expected.records
+
+
+# 020/1 #####
+@pytest.mark.parametrize('kwargs', [
+    pytest.param({'fields': None, 'header_row': 3}, id='all_headers'),
+    pytest.param({'fields': ['id', FieldPattern('name', multifield=True, min_ratio=0.3, mode='approx')]}, id='multifield'),
+    pytest.param({'fields': ['id', FieldPattern('Status', dictionary_encode=True)], 'compact': True}, id='compact'),
+    pytest.param({'fields': ['Status', FieldPattern('id', cellpattern=cellpatterns.Integer)]}, id='cellpattern'),
+])
+def test_20_1_cached_load_matches_uncached(tmp_path, make_csv, count_reads, kwargs):
+    path = make_csv('table.csv')
+    kwargs = {'header_row_seek': kwargs.get('fields') is not None, **kwargs}
+    cache_dir = tmp_path / 'cache'
+    expected = FuzzyTable(path, **kwargs)
+
+    # GIVEN a table loaded once with a cache directory...
+    assert_same_table(FuzzyTable(path, cache_dir=cache_dir, **kwargs), expected)
+    assert len(os.listdir(cache_dir)) == 1
+
+    # WHEN it is loaded again (synchronously or not)...
+    del count_reads[:]
+    cached = FuzzyTable(path, cache_dir=cache_dir, **kwargs)
+    cached_async = asyncio.new_event_loop().run_until_complete(
+        FuzzyTable.aload(path, cache_dir=cache_dir, chunksize=3, **kwargs)
+    )
+
+    # THEN the table is identical, and the sheet was never read.
+    assert_same_table(cached, expected)
+    assert_same_table(cached_async, expected)
+    assert count_reads == []
+
+
+# 020/2 #####
+def test_20_2_cache_keys(tmp_path, make_csv, count_reads):
+    path = make_csv('table.csv')
+    cache_dir = tmp_path / 'cache'
+    FuzzyTable(path, fields=['id', 'Status'], header_row_seek=True, cache_dir=cache_dir)
+
+    # Cell patterns are not part of the key: they are applied to the cached columns on each load.
+    del count_reads[:]
+    table = FuzzyTable(path, fields=['id', FieldPattern('Status', cellpattern=str.upper)],
+                       header_row_seek=True, cache_dir=cache_dir)
+    assert table['Status'][:2] == ['CLOSED', 'OPEN']
+    assert count_reads == []
+
+    # Anything that changes which columns are read is.
+    FuzzyTable(path, fields=['id', 'Status'], header_row_seek=True, cache_dir=cache_dir, assignment='optimal')
+    assert count_reads
+    del count_reads[:]
+    FuzzyTable(path, fields=['id', FieldPattern('Status', case_sensitive=False)], header_row_seek=True,
+               cache_dir=cache_dir)
+    assert count_reads
+    assert len(os.listdir(cache_dir)) == 3
+
+    # A changed file is read again.
+    make_csv('table.csv', row_count=30)
+    del count_reads[:]
+    table = FuzzyTable(path, fields=['id', 'Status'], header_row_seek=True, cache_dir=cache_dir)
+    assert table.sheet.row_count == 33
+    assert count_reads
+
+    # Errors are those of an uncached load.
+    with pytest.raises(exceptions.MissingFieldError):
+        FuzzyTable(path, fields=['middle_name'], header_row_seek=True, missingfieldserror_active=True,
+                   cache_dir=cache_dir)
+    with pytest.raises(FileNotFoundError):
+        FuzzyTable(tmp_path / 'missing.csv', cache_dir=cache_dir)
+    with pytest.raises(exceptions.InvalidCacheDirError):
+        FuzzyTable(path, cache_dir=3)
+    with pytest.raises(exceptions.InvalidMaxBytesError):
+        ExtractionCache(cache_dir, max_bytes=0)
+
+
+# 020/3 #####
+def test_20_3_eviction_and_damaged_entries(tmp_path, make_csv, count_reads):
+
+    # GIVEN a cache with room for about two entries...
+    paths = [make_csv(f"file_{file_num}.csv") for file_num in range(4)]
+    probe = ExtractionCache(tmp_path / 'probe')
+    FuzzyTable(paths[0], cache_dir=probe)
+    entry_size = sum(entry.stat().st_size for entry in probe.directory.iterdir())
+    cache = ExtractionCache(tmp_path / 'cache', max_bytes=int(entry_size * 2.5))
+
+    # WHEN more files than that are cached...
+    for path in paths:
+        FuzzyTable(path, cache_dir=cache)
+
+    # THEN the least recently used entries are evicted.
+    assert len(os.listdir(cache.directory)) == 2
+    del count_reads[:]
+    FuzzyTable(paths[-1], cache_dir=cache)
+    assert count_reads == []
+    FuzzyTable(paths[0], cache_dir=cache)
+    assert count_reads
+
+    # A damaged entry is a cache miss (and is then replaced).
+    for entry in cache.directory.iterdir():
+        entry.write_bytes(b'not a pickle')
+    del count_reads[:]
+    assert dict(FuzzyTable(paths[0], cache_dir=cache)) == dict(FuzzyTable(paths[0]))
+    del count_reads[:]
+    FuzzyTable(paths[0], cache_dir=cache)
+    assert count_reads == []
+
+
+# 020/4 #####
+def test_20_4_concurrent_writers(tmp_path, make_csv):
+
+    # GIVEN several threads loading (and caching) the same uncached file at once...
+    paths = [make_csv('table.csv', row_count=2000)]
+    cache_dir = tmp_path / 'cache'
+    barrier = threading.Barrier(4)
+    tables = []
+
+    def load():
+        barrier.wait()
+        tables.append(FuzzyTable(paths[0], fields=['id', 'Status'], header_row_seek=True, cache_dir=cache_dir))
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # THEN every load succeeds, and they leave a single complete entry (no temporary files).
+    assert len(tables) == 4
+    assert os.listdir(cache_dir) == [name for name in os.listdir(cache_dir) if name.endswith('.ftcache')]
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Batches share the cache too.
+    results = list(read_many(paths, fields=['id', 'Status'], header_row_seek=True, cache_dir=cache_dir))
+    assert dict(results[0].table) == dict(tables[0])
@@ -0,0 +1,65 @@
+import pytest
+from datetime import datetime
+from fuzzytable import FuzzyTable, FieldPattern, cellpatterns
+
+
+tricky_values = [
+    None, True, False, 0, 7, -12, 2 ** 60 + 1, 0.0, 42.6, -3.5, 1e300,
+    datetime(2019, 10, 18), (1, 2, 3), [4, 5],
+    '', '  ', '42', ' 42.6 ', '-.5e3', '1_000', '١٢', 'nan', 'fey',  # ('inf' raises OverflowError either way)
+    '123 456 78hi', '19twenty3', 'two spaces left', 'False',
+]
+
+
+@pytest.mark.parametrize('cellpattern_class', [
+    cellpatterns.Integer,
+    cellpatterns.Float,
+    cellpatterns.String,
+    cellpatterns.Boolean,
+    cellpatterns.Digit,
+    cellpatterns.IntegerList,
+])
+# 020/1 #####
+def test_20_1_apply_column_same_as_apply_pattern(cellpattern_class):
+
+    # GIVEN a built-in cellpattern with a batch implementation...
+    cellpattern = cellpattern_class()
+
+    # WHEN a whole column is normalized at once...
+    actual = cellpattern.apply_column(tricky_values)
+
+    # THEN the results are identical to normalizing one cell at a time.
+    expected = [cellpattern.apply_pattern(value) for value in tricky_values]
+    assert repr(actual) == repr(expected)  # repr, so that e.g. 1 and 1.0 or True and 1 don't compare equal
+
+
+class CustomInteger(cellpatterns.Integer):
+    # Overrides apply_pattern, but inherits Integer.apply_column
+
+    def apply_pattern(self, value):
+        return 'custom'
+
+
+class CustomPattern(cellpatterns.CellPattern):
+    # No apply_column hook at all
+
+    def apply_pattern(self, value):
+        return f'<{value}>'
+
+
+@pytest.mark.parametrize('cellpattern,expected_first_value', [
+    pytest.param(CustomInteger, 'custom', id='subclass'),
+    pytest.param(CustomPattern, '<0>', id='no hook'),
+    pytest.param(lambda value: [value], [0], id='plain callable'),
+])
+# 020/2 #####
+def test_20_2_custom_cellpatterns_fall_back_to_apply_pattern(test_files_dir, cellpattern, expected_first_value):
+
+    # GIVEN a custom cellpattern whose apply_pattern cannot be bypassed...
+    field = FieldPattern(name='values', cellpattern=cellpattern)
+
+    # WHEN the table is extracted...
+    ft = FuzzyTable(test_files_dir / 'data_pattern.csv', fields=[field])
+
+    # THEN each cell went through the custom cellpattern.
+    assert ft['values'][0] == expected_first_value
@@ -0,0 +1,138 @@
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern, cellpatterns
+from fuzzytable.datamodel import columns
+from tests.conftest import create_csv
+
+
+@pytest.mark.parametrize('values,expected_class', [
+    pytest.param([1, None, -2 ** 63, 2 ** 63 - 1, 0], columns.IntColumn, id='int'),
+    pytest.param([1.5, None, -0.0, 1e300], columns.FloatColumn, id='float'),
+    pytest.param(['NY', 'PA', None, 'NY', 'NY', 'PA'], columns.DictColumn, id='low cardinality str'),
+    pytest.param(['a', 'b', 'c', 'd'], list, id='high cardinality str'),
+    pytest.param([1, 2.5, None], list, id='mixed'),
+    pytest.param([True, False], list, id='bool'),
+    pytest.param([2 ** 64, 1], list, id='int too big'),
+    pytest.param([None, None], list, id='all None'),
+])
+# 020/1 #####
+def test_20_1_compact_column(values, expected_class):
+
+    # GIVEN a list of cell values...
+    # WHEN it is compacted...
+    column = columns.compact_column(values)
+
+    # THEN it uses the expected representation...
+    assert type(column) is expected_class
+
+    # AND it behaves just like the original list.
+    assert column == values
+    assert values == column
+    assert len(column) == len(values)
+    assert list(column) == values
+    assert [column[index] for index in range(-len(values), len(values))] == values + values
+    assert column[1:] == values[1:]
+    assert column[::-2] == values[::-2]
+    with pytest.raises(IndexError):
+        column[len(values)]
+    assert [type(value) for value in column] == [type(value) for value in values]
+
+
+# 020/2 #####
+def test_20_2_dict_column_codes():
+
+    # GIVEN a repetitive string column...
+    values = ['red', 'blue', 'red', None, 'red', 'blue']
+
+    # WHEN it is dictionary-encoded...
+    column = columns.DictColumn.from_values(values)
+
+    # THEN each distinct value is stored once...
+    assert column.dictionary == ['red', 'blue', None]
+    assert list(column.codes) == [0, 1, 0, 2, 0, 1]
+
+    # AND it is much smaller than the list it replaces.
+    assert column.nbytes < 8 * len(values)
+
+
+@pytest.mark.parametrize('path_kwargs', [
+    pytest.param({'path': 'data_pattern.csv'}, id='csv'),
+    pytest.param({'path': 'test.xlsx', 'sheetname': 'data_pattern'}, id='excel'),
+])
+@pytest.mark.parametrize('cellpattern', [None, cellpatterns.Integer, cellpatterns.Float, cellpatterns.String])
+# 020/3 #####
+def test_20_3_compact_fuzzytable(test_files_dir, path_kwargs, cellpattern):
+
+    # GIVEN a sheet...
+    kwargs = dict(path_kwargs, path=test_files_dir / path_kwargs['path'])
+    fields = [
+        FieldPattern('index', mode='contains', cellpattern=cellpatterns.Integer),  # 'contains': the csv has a BOM
+        FieldPattern('values', cellpattern=cellpattern),
+    ]
+
+    # WHEN it is read with and without compact storage...
+    expected = FuzzyTable(fields=fields, **kwargs)
+    actual = FuzzyTable(fields=fields, compact=True, **kwargs)
+
+    # THEN all views are identical.
+    for key in expected:
+        assert actual[key] == expected[key]
+    assert actual.records == expected.records
+    assert list(actual.records) == list(expected.records)
+    assert isinstance(actual['index'], columns.IntColumn)
+
+
+@pytest.fixture
+def regions_csv(tmp_path):
+    path = tmp_path / 'regions.csv'
+    fields = {
+        'region': ['east', 'west', ' west', 'east', 'north', 'west', 'east'],
+        'sales': [10, 20, 30, 40, 50, 60, 70],
+    }
+    create_csv(path, fields)
+    return path
+
+
+# 020/4 #####
+def test_20_4_dictionary_encode(regions_csv):
+
+    # GIVEN a FieldPattern asking for dictionary encoding...
+    region = FieldPattern('region', cellpattern=cellpatterns.String, dictionary_encode=True)
+
+    # WHEN the table is extracted...
+    ft = FuzzyTable(regions_csv, fields=[region, 'sales'])
+    expected = ['east', 'west', 'west', 'east', 'north', 'west', 'east']
+
+    # THEN the data is unchanged...
+    assert ft['region'] == expected
+    assert ft.records[2]['region'] == 'west'
+
+    # AND each distinct value is stored only once.
+    codes, dictionary = ft.get_field('region').encode()
+    assert dictionary == ['east', 'west', 'north']
+    assert list(codes) == [0, 1, 1, 0, 2, 1, 0]
+    assert isinstance(ft['region'], columns.DictColumn)
+
+    # Other fields can be encoded on demand.
+    codes, dictionary = ft.get_field('sales').encode()
+    assert len(dictionary) == len(codes) == 7
+    assert isinstance(ft['sales'], list)
+
+
+# 020/5 #####
+def test_20_5_dictionary_encode_chunks_and_stream(regions_csv):
+
+    # GIVEN a FieldPattern asking for dictionary encoding...
+    region = FieldPattern('region', cellpattern=cellpatterns.String, dictionary_encode=True)
+
+    # WHEN the table is read in chunks...
+    chunks = list(FuzzyTable.chunks(regions_csv, fields=[region], chunksize=3))
+
+    # THEN all chunks share one dictionary, so codes are consistent across chunks.
+    assert [list(chunk['region'].codes) for chunk in chunks] == [[0, 1, 1], [0, 2, 1], [0]]
+    assert all(chunk['region'].dictionary is chunks[0]['region'].dictionary for chunk in chunks)
+
+    # WHEN the table is streamed...
+    records = list(FuzzyTable.stream(regions_csv, fields=[region]))
+
+    # THEN equal values are one and the same object.
+    assert records[1]['region'] is records[2]['region'] is records[5]['region']
@@ -0,0 +1,98 @@
+import pickle
+import threading
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern, compile_fields, exceptions, read_many
+from fuzzytable.cellpatterns import Integer
+from fuzzytable.patterns import CompiledField
+from tests.conftest import create_csv
+
+
+# 020/1 #####
+def test_20_1_compile_fields_resolves_settings():
+
+    # GIVEN FieldPatterns, some left at the FuzzyTable-wide defaults...
+    given = FieldPattern('dob', alias=['Birthday', 'birthday', 'DOB'], case_sensitive=False, min_ratio=0.9)
+    fields = compile_fields(['first_name', given], mode='approx', min_ratio=0.5)
+
+    # THEN every setting is resolved, and the search terms are ready for comparison.
+    assert fields == (
+        CompiledField(
+            name='first_name', terms=('first_name',), mode='approx', case_sensitive=True, min_ratio=0.5,
+            multifield=False, cellpattern=None, dictionary_encode=False, match_terms=('first_name',),
+        ),
+        CompiledField(
+            name='dob', terms=('dob', 'Birthday', 'birthday', 'DOB'), mode='approx', case_sensitive=False,
+            min_ratio=0.9, multifield=False, cellpattern=None, dictionary_encode=False, match_terms=('dob', 'birthday'),
+        ),
+    )
+
+    # ...and the FieldPattern itself is unchanged.
+    assert given.fuzzytable is None
+    assert given.mode == 'exact'  # the global default
+
+    # The result is immutable and picklable.
+    with pytest.raises(AttributeError):
+        fields[0].mode = 'exact'
+    assert pickle.loads(pickle.dumps(fields)) == fields
+
+    # Invalid arguments are caught up front.
+    with pytest.raises(exceptions.InvalidRatioError):
+        compile_fields(['first_name'], min_ratio=2)
+    with pytest.raises(exceptions.ModeError):
+        compile_fields(['first_name'], mode='fuzzy')
+    with pytest.raises(exceptions.InvalidFieldError):
+        compile_fields([1])
+
+
+# 020/2 #####
+def test_20_2_compiled_fields_shared_by_tables(tmp_path):
+
+    # GIVEN a csv file, and fields compiled once...
+    path = tmp_path / 'people.csv'
+    create_csv(path, {'First Name': ['Ann', 'Bob'], 'Age': ['30', '40']})
+    patterns = [FieldPattern('first_name', mode='approx', case_sensitive=False), FieldPattern('age', cellpattern=Integer)]
+    fields = compile_fields(patterns, case_sensitive=False)
+
+    # WHEN they are used by several tables, including one with conflicting FuzzyTable-wide settings...
+    expected = {'first_name': ['Ann', 'Bob'], 'age': [30, 40]}
+    assert dict(FuzzyTable(path, fields=fields)) == expected
+    assert dict(FuzzyTable(path, fields=fields, mode='exact', case_sensitive=True)) == expected
+    assert [dict(result.table) for result in read_many([path, path], fields=fields)] == [expected, expected]
+
+    # THEN the fields were compiled once and for all.
+    assert all(isinstance(field, CompiledField) for field in fields)
+
+    # Uncompiled FieldPatterns are no longer modified by FuzzyTable.
+    FuzzyTable(path, fields=patterns, case_sensitive=False)
+    assert all(pattern.fuzzytable is None for pattern in patterns)
+
+
+# 020/3 #####
+def test_20_3_fieldpatterns_shared_by_threads(tmp_path):
+
+    # GIVEN one FieldPattern list, used by tables with different FuzzyTable-wide settings...
+    path = tmp_path / 'people.csv'
+    create_csv(path, {'first name': ['Ann', 'Bob'], 'AGE': ['30', '40']})
+    patterns = [FieldPattern('first_name'), FieldPattern('age')]
+    results = {}
+
+    def load(mode, case_sensitive):
+        for _ in range(20):
+            table = FuzzyTable(path, fields=patterns, mode=mode, case_sensitive=case_sensitive, min_ratio=0.5)
+            results.setdefault((mode, case_sensitive), set()).add(tuple(table.keys()))
+
+    # WHEN they run concurrently...
+    threads = [
+        threading.Thread(target=load, args=args)
+        for args in [('approx', False), ('exact', True)]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # THEN each table used its own settings.
+    assert results == {
+        ('approx', False): {('first_name', 'age')},
+        ('exact', True): {()},
+    }
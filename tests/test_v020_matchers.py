@@ -0,0 +1,118 @@
+import itertools
+import pytest
+from fuzzytable import cellpatterns
+from fuzzytable.main import matchers
+from fuzzytable.main import similarity
+from fuzzytable.main import string_analysis as strings
+
+
+# Overlapping terms: 'bc' (key 'first') is inside 'abcd' (key 'second'),
+# so first-key-wins must hold even when the earlier key's match starts later in the target.
+search_dict = {
+    'first': ['bc', 'XYZ'],
+    'second': ['abcd', 'ab'],
+    'third': ['d', 'cd'],
+    **{f'filler{i}': [f'filler term {i}'] for i in range(20)},
+}
+targets = [''.join(chars) for n in range(5) for chars in itertools.product('abcdxyzXYZ', repeat=n)][:3000]
+
+
+@pytest.mark.parametrize('mode', ['exact', 'contains'])
+@pytest.mark.parametrize('case_sensitive', [True, False])
+# 020/1 #####
+def test_20_1_matcher_same_as_get_bestkey(mode, case_sensitive):
+    matcher = matchers.get_matcher(search_dict, mode, case_sensitive)
+    for target in targets + list(itertools.chain(*search_dict.values())):
+        expected = strings.get_bestkey(search_dict, target, mode, strings.NoMatch, case_sensitive)
+        actual = matcher.get_bestkey(target)
+        assert (actual.name if actual is not strings.NoMatch else strings.NoMatch) == expected.name
+
+
+# 020/2 #####
+def test_20_2_stringchoice_matcher_rebuilt():
+
+    # GIVEN a StringChoice that has already been applied...
+    choice = cellpatterns.StringChoice(choices=['Red', 'Blue'], mode='exact', case_sensitive=True)
+    assert choice.apply_pattern('red') is None
+
+    # WHEN the user changes its settings...
+    choice.case_sensitive = False
+
+    # THEN the new settings take effect.
+    assert choice.apply_pattern('red') == 'Red'
+
+
+@pytest.mark.parametrize('case_sensitive', [True, False])
+@pytest.mark.parametrize('min_ratio', [0.0, 0.4, 0.8])
+# 020/3 #####
+def test_20_3_approx_matcher_same_as_get_bestkey(case_sensitive, min_ratio):
+    approx_dict = {
+        'pennsylvania': ['pennsylvania', 'PA', 'penn'],
+        'new_york': ['new york', 'NY', 'york'],
+        'north_carolina': ['north carolina', 'NC'],
+        'new_jersey': ['new jersey', 'NJ', 'jersey'],
+        'duplicate': ['york', 'penn'],  # same terms as earlier keys: earlier key wins ties
+    }
+    matcher = matchers.get_matcher(approx_dict, 'approx', case_sensitive, min_ratio)
+    approx_targets = [
+        '', 'p', 'Penn', 'pensylvania', 'New York City', 'new yrok', 'north', 'NC',
+        'nj', 'jersy', 'carolina north', 'york', 'Philadelphia', 'zzzz',
+    ]
+    for target in approx_targets:
+        expected = strings.get_bestkey(approx_dict, target, 'approx', None, case_sensitive, min_ratio)
+        actual = matcher.get_bestkey(target)
+        if actual is strings.NoMatch:
+            actual = strings.BestKey(None, 0.0)
+        assert actual == expected
+
+
+@pytest.mark.parametrize('case_sensitive', [True, False])
+@pytest.mark.parametrize('min_ratio', [0.0, 0.5])
+# 020/4 #####
+def test_20_4_get_best_match_reuses_matchers(monkeypatch, case_sensitive, min_ratio):
+    from difflib import SequenceMatcher
+
+    def brute_force(strings1, strings2):
+        # Previous implementation: a new SequenceMatcher for every pair.
+        if not case_sensitive:
+            strings1 = [string.lower() for string in strings1]
+            strings2 = [string.lower() for string in strings2]
+        best = (None, None, 0.0)
+        for index1, string1 in enumerate(strings1):
+            for index2, string2 in enumerate(strings2):
+                if string1 == string2:
+                    return index1, index2, 1.0
+                matcher = SequenceMatcher(None, string1, string2)
+                if matcher.quick_ratio() < min_ratio:
+                    continue
+                ratio = matcher.ratio()
+                if ratio >= min_ratio and ratio > best[2]:
+                    best = (index1, index2, ratio)
+        return best
+
+    # GIVEN search terms and header strings...
+    strings1 = ['first name', 'First', 'last name', 'Surname', 'age', 'AGE']
+    strings2 = ['Name, First', 'name last', 'age in years', 'Age', 'middle name', 'Middle Name']
+
+    # WHEN the best match is found, sharing matchers between calls...
+    created = []
+
+    class CountingMatcher(SequenceMatcher):
+        def __init__(self, *args, **kwargs):
+            created.append(kwargs.get('b'))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(similarity.DifflibBackend, 'sequence_matcher', CountingMatcher)
+    monkeypatch.setattr(similarity, '_active', similarity.DifflibBackend())
+    shared = {}
+    for index1 in range(len(strings1)):
+        actual = strings.get_best_match(strings1[index1:], strings2, min_ratio, case_sensitive, shared)
+        expected_index1, expected_index2, expected_ratio = brute_force(strings1[index1:], strings2)
+
+        # THEN the results are unchanged...
+        assert actual.ratio == expected_ratio
+        if actual is not strings.NoMatch:
+            assert (actual.index1, actual.index2) == (expected_index1, expected_index2)
+
+    # AND each header string was analysed only once.
+    assert len(created) == len(set(created))
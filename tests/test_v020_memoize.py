@@ -0,0 +1,74 @@
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern, cellpatterns, exceptions
+
+
+class CountingPattern(cellpatterns.CellPattern):
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def apply_pattern(self, value):
+        self.calls.append(value)
+        return repr(value)
+
+
+@pytest.mark.parametrize('policy', ['lru', 'lfu'])
+# 020/1 #####
+def test_20_1_memoize_counts(policy):
+
+    # GIVEN a memoized cell pattern...
+    counting_pattern = CountingPattern()
+    memoized = cellpatterns.Memoize(counting_pattern, policy=policy)
+
+    # WHEN it is applied to repetitive values (some of which are equal but of different types, or unhashable)...
+    values = [1, 1, 1.0, True, 'a', 'a', [1], [1]]
+    actual = [memoized.apply_pattern(value) for value in values]
+
+    # THEN the results are unchanged...
+    assert actual == [repr(value) for value in values]
+
+    # ... but the wrapped pattern only sees each distinct hashable value once.
+    assert counting_pattern.calls == [1, 1.0, True, 'a', [1], [1]]
+    assert memoized.cache_info() == cellpatterns.CacheInfo(hits=2, misses=4, bypasses=2, maxsize=1024, currsize=4)
+
+
+@pytest.mark.parametrize('policy,expected_survivor', [
+    ('lru', 'c'),  # 'a' was used more often, but 'c' was used more recently
+    ('lfu', 'a'),
+])
+# 020/2 #####
+def test_20_2_memoize_eviction(policy, expected_survivor):
+    memoized = cellpatterns.Memoize(str.upper, maxsize=2, policy=policy)
+    for value in ['a', 'a', 'a', 'b', 'c', 'd']:
+        memoized.apply_pattern(value)
+    cached_values = [key[1] for key in memoized._results]
+    assert cached_values == [expected_survivor, 'd']
+
+
+@pytest.mark.parametrize('kwargs,exception', [
+    ({'policy': 'fifo'}, exceptions.CachePolicyError),
+    ({'maxsize': 0}, exceptions.CacheSizeError),
+])
+# 020/3 #####
+def test_20_3_memoize_errors(kwargs, exception):
+    with pytest.raises(exception):
+        cellpatterns.Memoize(cellpatterns.String, **kwargs)
+
+
+# 020/4 #####
+def test_20_4_memoize_fieldpattern(test_files_dir):
+
+    # GIVEN a memoized StringChoice...
+    choice = cellpatterns.StringChoice(choices='42 two manager'.split(), mode='contains')
+    memoized = cellpatterns.Memoize(choice)
+
+    # WHEN it is passed to a FieldPattern...
+    tables = [
+        FuzzyTable(test_files_dir / 'data_pattern.csv', fields=FieldPattern('values', cellpattern=pattern))
+        for pattern in [choice, memoized]
+    ]
+
+    # THEN the results are the same as without memoization.
+    assert tables[0]['values'] == tables[1]['values']
+    assert memoized.hits > 0
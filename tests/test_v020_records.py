@@ -0,0 +1,107 @@
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern
+from fuzzytable.datamodel import Row, MultiField
+
+
+# 020/1 #####
+def test_20_1_records_fast_paths(ft_dr_who_all_fields, dr_who_records):
+
+    # GIVEN a table...
+    ft = ft_dr_who_all_fields
+    ft.records.include_row_num = False
+    records = ft.records
+
+    # WHEN the records are read as tuples or rows...
+    tuples = list(records.as_tuples())
+    rows = list(records.rows())
+
+    # THEN they hold the same values as the record dicts.
+    assert records.names == tuple(dr_who_records[0])
+    assert tuples == [tuple(record.values()) for record in dr_who_records]
+    assert rows == dr_who_records
+    assert list(records) == dr_who_records
+    row = rows[1]
+    assert isinstance(row, Row)
+    assert row['last_name'] == 'Pond'
+    assert 'first_name' in row and 'row' not in row
+    assert dict(row) == dr_who_records[1]
+    with pytest.raises(KeyError):
+        row['row']
+
+    # The names follow include_row_num.
+    records.include_row_num = True
+    assert records.names[-1] == 'row'
+    assert next(records.as_tuples())[-1] == 5
+
+
+# 020/2 #####
+def test_20_2_records_equality(get_test_path, dr_who_fields, dr_who_records):
+
+    # GIVEN two extractions of the same table...
+    path = get_test_path('csv')
+    ft1 = FuzzyTable(path, fields=dr_who_fields, header_row_seek=True)
+    ft2 = FuzzyTable(path, fields=dr_who_fields, header_row_seek=True, compact=True)
+
+    # THEN their records compare equal, column by column...
+    assert ft1.records == ft2.records
+
+    # ...unless their fields differ.
+    ft2.records.include_row_num = False
+    assert ft1.records != ft2.records
+
+    # Comparisons with other sequences are record by record.
+    assert ft2.records == dr_who_records
+    assert ft2.records != dr_who_records[:2]
+    assert ft2.records != dr_who_records + [{'first_name': 'Clara'}]
+    assert ft2.records == (record.items() for record in dr_who_records)
+    assert ft2.records != 42
+
+
+def multifield_table(first_names):
+    fields = ['id', FieldPattern('name', multifield=True, min_ratio=0.3, mode='approx')]
+    return FuzzyTable(path=first_names.path, fields=fields)
+
+
+# 020/3 #####
+def test_20_3_multifield_data_cached(first_names):
+
+    # GIVEN a table with a MultiField...
+    ft = multifield_table(first_names)
+    name = ft.get_field('name')
+    expected = list(zip(*(first_names.fields[key] for key in ['name 2', 'name 1', 'name 3'])))
+
+    # WHEN its data is read twice...
+    # THEN the zipped column is built only once.
+    assert name.data == expected
+    assert name.data is name.data
+
+    # WHEN a subfield's data is replaced or resized...
+    # THEN the column is rebuilt.
+    name.subfields[0].data = ['a', 'b', 'c']
+    assert [names[0] for names in name.data] == ['a', 'b', 'c']
+    name.subfields[0].data.append('d')
+    name.subfields[1].data.append('e')
+    name.subfields[2].data.append('f')
+    assert name.data[-1] == ('d', 'e', 'f')
+
+    # WHEN a subfield's data is modified in place...
+    # THEN invalidate_data() refreshes the column.
+    name.subfields[0].data[0] = 'z'
+    name.invalidate_data()
+    assert name.data[0][0] == 'z'
+
+
+# 020/4 #####
+def test_20_4_record_access_reads_one_row(monkeypatch, first_names):
+
+    # GIVEN a table with a MultiField...
+    ft = multifield_table(first_names)
+
+    # WHEN a single record is accessed...
+    def data_not_allowed(self):
+        raise AssertionError("MultiField.data must not be built to read one record")
+    monkeypatch.setattr(MultiField, 'data', property(data_not_allowed))
+
+    # THEN only that row is read.
+    assert ft.records[1] == {'id': 1, 'name': ('francis', 'suz', 'jim'), 'row': 3}
+    assert ft.records[-1]['name'] == ('fran', 'susannah', 'jimmy')
@@ -0,0 +1,141 @@
+import pytest
+from fuzzytable import FuzzyTable
+from fuzzytable.main import sheetreader
+
+
+# 020/1 #####
+def test_20_1_excel_workbook_loaded_once(get_test_path, monkeypatch):
+
+    # GIVEN an excel table whose header row must be sought...
+    load_count = []
+    orig_load_workbook = sheetreader.load_workbook
+
+    def counting_load_workbook(*args, **kwargs):
+        load_count.append(1)
+        return orig_load_workbook(*args, **kwargs)
+
+    monkeypatch.setattr(sheetreader, 'load_workbook', counting_load_workbook)
+
+    # WHEN user extracts several fields...
+    ft = FuzzyTable(
+        path=get_test_path(),
+        sheetname='table_bottom_right',
+        fields='first_name last_name last_appearance'.split(),
+        header_row_seek=True,
+    )
+
+    # THEN the workbook is loaded exactly once.
+    assert len(ft) == 3
+    assert len(load_count) == 1
+
+
+# 020/2 #####
+def test_20_2_excelreader_close(get_test_path):
+
+    # GIVEN an excel reader used as a context manager...
+    with sheetreader.ExcelReader(get_test_path(), 'table_top_left') as reader:
+        first_pass = reader[1]
+        second_pass = reader[1]
+        workbook = reader.workbook
+
+    # THEN the workbook is reused between passes and released on exit.
+    assert first_pass == second_pass == ('first_name', 'last_name', 'last_appearance')
+    assert reader._workbook is None
+    assert workbook is not None
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n', '\r'])
+# 020/3 #####
+def test_20_3_csv_row_index(tmp_path, newline):
+
+    # GIVEN a csv file, including a record that spans several lines...
+    path = tmp_path / 'index.csv'
+    lines = ['a,b', '1,"multi', 'line"', 'hello,world', '3,4', '5,6']
+    path.write_bytes(newline.join(lines).encode() + newline.encode())
+    indexed = sheetreader.CsvReader(path)
+    unindexed = sheetreader.CsvReader(path, row_index=False)
+
+    # WHEN rows are accessed out of order...
+    for row_num in [4, 2, 5, 1, 3, 6]:
+
+        # THEN the indexed and unindexed readers agree.
+        assert indexed[row_num] == unindexed[row_num]
+        assert list(indexed.iter_row(start_row=row_num)) == list(unindexed.iter_row(start_row=row_num))
+
+    assert indexed.row_count == unindexed.row_count == 5
+    if newline != '\r':
+        assert len(indexed._row_offsets) == 6
+
+
+# 020/4 #####
+@pytest.mark.parametrize('read', [
+    pytest.param(lambda path, **kwargs: dict(FuzzyTable(path, **kwargs)), id='FuzzyTable'),
+    pytest.param(lambda path, **kwargs: list(FuzzyTable.stream(path, **kwargs)), id='stream'),
+    pytest.param(lambda path, **kwargs: list(FuzzyTable.chunks(path, chunksize=2, **kwargs)), id='chunks'),
+])
+@pytest.mark.parametrize('header_kwargs', [
+    pytest.param({'header_row_seek': True}, id='seek'),
+    pytest.param({'header_row': 4}, id='header_row'),
+])
+def test_20_4_csv_opened_once(firstlastnames_startrow4, monkeypatch, read, header_kwargs):
+
+    # GIVEN a csv table below a few empty rows, and a count of file opens...
+    opened = []
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return open(*args, **kwargs)
+    monkeypatch.setattr(sheetreader, 'open', counting_open, raising=False)
+    path = firstlastnames_startrow4.path
+
+    # WHEN the table is read...
+    result = read(path, fields=['first_name', 'last_name'], **header_kwargs)
+
+    # THEN the header row and the data come from a single pass over the file.
+    assert result
+    assert opened == [path]
+
+
+# 020/5 #####
+def test_20_5_excel_single_pass(get_test_path, monkeypatch, dr_who_records):
+
+    # GIVEN an excel table whose header row must be sought...
+    passes = []
+    get_filereader = sheetreader.ExcelReader.get_filereader
+
+    def counting_get_filereader(self):
+        passes.append(self.sheetname)
+        return get_filereader(self)
+    monkeypatch.setattr(sheetreader.ExcelReader, 'get_filereader', counting_get_filereader)
+
+    # WHEN the table is read...
+    ft = FuzzyTable(get_test_path(), 'table_bottom_right', fields=dr_who_records[0].keys(), header_row_seek=True)
+
+    # THEN the worksheet was streamed once.
+    ft.records.include_row_num = False
+    assert list(ft.records) == dr_who_records
+    assert ft.sheet.row_count > ft.sheet.header_row_num
+    assert passes == ['table_bottom_right']
+
+
+# 020/6 #####
+@pytest.mark.parametrize('row_count', [0, 3, 10])
+def test_20_6_head_buffer(tmp_path, row_count):
+
+    # GIVEN a csv file...
+    path = tmp_path / 'head.csv'
+    rows = [[str(row_num), 'x'] for row_num in range(1, row_count + 1)]
+    path.write_text(''.join(','.join(row) + '\n' for row in rows))
+
+    # WHEN rows are read from the buffer, then by a full pass, then from the buffer again...
+    with sheetreader.CsvReader(path) as reader:
+        head = reader.head(5)
+        assert reader[2] == (rows[1] if row_count >= 2 else None)
+        data = list(reader.iter_row(start_row=2))
+        later = list(reader.iter_row(start_row=4, end_row=8))
+
+    # THEN each read matches the file.
+    assert head == rows[:5]
+    assert data == rows[1:]
+    assert later == rows[3:8]
+    assert reader.row_count == row_count
@@ -0,0 +1,70 @@
+import random
+import string
+from difflib import SequenceMatcher
+import pytest
+from fuzzytable import exceptions
+from fuzzytable import FuzzyTable
+from fuzzytable.main import similarity
+
+
+def random_strings(count, seed=0):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters[:8] + ' _'
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(count)]
+
+
+@pytest.mark.parametrize('backend_name', similarity.available_backends())
+@pytest.mark.parametrize('min_ratio', [0.0, 0.3, 0.6, 0.9])
+# 020/1 #####
+def test_20_1_backend_conformance(backend_name, min_ratio):
+
+    # GIVEN a registered backend...
+    backend = similarity._backends[backend_name]
+    targets = random_strings(40, seed=1) + ['a' * 250 + 'b']  # long enough to trigger difflib's autojunk
+    terms = random_strings(40, seed=2) + ['a' * 240]
+
+    for target in targets:
+        score = backend.scorer(target)
+        for term in terms:
+
+            # WHEN a term is scored...
+            actual = score(term, min_ratio)
+
+            # THEN the score is identical to the difflib ratio whenever that ratio could match.
+            expected = SequenceMatcher(None, term, target).ratio()
+            if expected >= min_ratio:
+                assert actual == expected
+            else:
+                assert actual < min_ratio
+
+
+@pytest.mark.parametrize('backend_name', similarity.available_backends())
+# 020/2 #####
+def test_20_2_backends_same_table(monkeypatch, get_test_path, backend_name):
+
+    # GIVEN a table whose headers only match approximately...
+    path = get_test_path('csv')
+    field_names = ['first name', 'lastname', 'appearance', 'the doctor']
+
+    # WHEN it is read with each backend...
+    expected = FuzzyTable(path, fields=field_names, header_row_seek=True, approximate_match=True, min_ratio=0.5)
+    monkeypatch.setattr(similarity, '_active', similarity._backends[backend_name])
+    actual = FuzzyTable(path, fields=field_names, header_row_seek=True, approximate_match=True, min_ratio=0.5)
+
+    # THEN the results are identical.
+    assert actual.records == expected.records
+    assert [field.ratio for field in actual.fields] == [field.ratio for field in expected.fields]
+
+
+# 020/3 #####
+def test_20_3_unknown_backend():
+
+    # GIVEN a backend name that was never registered...
+    name = 'levenshtein_distance_3000'
+
+    # WHEN the user selects it...
+    # THEN a SimilarityBackendError is raised and the active backend is unchanged.
+    active = similarity.get_backend()
+    with pytest.raises(exceptions.SimilarityBackendError):
+        similarity.set_backend(name)
+    assert similarity.get_backend() is active
@@ -0,0 +1,106 @@
+import random
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern
+from fuzzytable.main import string_analysis as strings
+from fuzzytable.parsers.similaritymatrix import SimilarityMatrix, prepare_patterns
+from tests.conftest import create_csv
+
+words = ['Name', 'name', 'first', 'last', 'birth', 'date', 'id', 'ID']
+
+
+def random_patterns(rng, count):
+    return [
+        FieldPattern(
+            rng.choice(words) + str(pattern_num),
+            alias=[rng.choice(words) + rng.choice(['', ' ', '_']) + rng.choice(words) for _ in range(rng.randint(0, 4))],
+            mode=rng.choice(['exact', 'contains', 'approx']),
+            case_sensitive=rng.choice([True, False]),
+            min_ratio=rng.choice([0.3, 0.6, 0.9]),
+        )
+        for pattern_num in range(count)
+    ]
+
+
+def reference_field_ratio(fieldpattern, header):
+    # How FieldParser scored a header before SimilarityMatrix
+    return strings.get_bestkey(
+        search_dict={fieldpattern.name: fieldpattern.terms},
+        target=header,
+        mode=fieldpattern.mode,
+        default_value=None,
+        case_sensitive=fieldpattern.case_sensitive,
+        min_ratio=fieldpattern.min_ratio,
+    ).ratio
+
+
+def reference_row_ratio(fieldpatterns, row_string):
+    # How FieldParser.row_ratio scored a candidate header row before SimilarityMatrix
+    total = 0.0
+    for fieldpattern in fieldpatterns:
+        terms = fieldpattern.terms
+        target = row_string
+        if not fieldpattern.case_sensitive:
+            terms = [term.lower() for term in terms]
+            target = target.lower()
+        if fieldpattern.mode == 'approx':
+            total += strings.get_best_ratio(terms, [target])
+        elif any(term in target for term in terms):
+            total += 1.0
+    return total / len(fieldpatterns)
+
+
+@pytest.mark.parametrize('seed', range(50))
+# 020/1 #####
+def test_20_1_matrix_same_as_individual_comparisons(seed):
+
+    # GIVEN random FieldPatterns and a random row...
+    rng = random.Random(seed)
+    fieldpatterns = random_patterns(rng, rng.randint(1, 8))
+    row = [rng.choice(words + ['', '']) + rng.choice(['', '', ' date', '_id']) for _ in range(rng.randint(1, 10))]
+    row = [cell or rng.choice([None, '']) for cell in row]  # some empty cells
+
+    # WHEN the row's similarity matrix is computed...
+    matrix = SimilarityMatrix(prepare_patterns(fieldpatterns), row)
+
+    # THEN each ratio is the one from comparing each pattern with the row (or cell) on its own.
+    assert matrix.row_ratio == pytest.approx(reference_row_ratio(fieldpatterns, repr(row)))
+    assert matrix.cells == [(col_num, cell) for col_num, cell in enumerate(row, 1) if cell]
+    for pattern_index, fieldpattern in enumerate(fieldpatterns):
+        expected = [reference_field_ratio(fieldpattern, header) for _, header in matrix.cells]
+        assert matrix.field_ratios(pattern_index) == expected
+
+
+# 020/2 #####
+def test_20_2_each_comparison_made_once(tmp_path, monkeypatch):
+
+    # GIVEN many approx FieldPatterns sharing aliases, and a sheet with repeated headers...
+    path = tmp_path / 'aliases.csv'
+    create_csv(path, {'x': [None, 'Customer ID', 1], 'y': [None, 'Amount', 2], 'z': [None, 'customer id', 3]})
+    common = ['customer id', 'Customer ID', 'amount', 'total amount']
+    fields = [
+        FieldPattern(name, alias=common, mode='approx', case_sensitive=False, min_ratio=0.5)
+        for name in ['customer', 'cust_id', 'amt', 'total']
+    ]
+
+    # ...and a record of every comparison made...
+    comparisons = []
+    get_matcher = strings.get_matcher
+
+    def counting_get_matcher(string2, matchers):
+        score = get_matcher(string2, matchers)
+
+        def counting_score(string1, min_ratio):
+            comparisons.append((string1, string2, min_ratio))
+            return score(string1, min_ratio)
+
+        return counting_score
+
+    monkeypatch.setattr(strings, 'get_matcher', counting_get_matcher)
+
+    # WHEN the header row is sought and the fields matched...
+    table = FuzzyTable(path, fields=fields, header_row_seek=True)
+
+    # THEN no comparison was made twice.
+    assert table.sheet.header_row_num == 3
+    assert comparisons
+    assert len(comparisons) == len(set(comparisons))
@@ -0,0 +1,80 @@
+import types
+import pytest
+from fuzzytable import FuzzyTable, FieldPattern, cellpatterns, exceptions
+
+
+@pytest.mark.parametrize('kwargs', [
+    pytest.param({'fields': ['id', FieldPattern('name', multifield=True, min_ratio=0.3, mode='approx')]}, id='multifield'),
+    pytest.param({'fields': ['name 1', FieldPattern('id', cellpattern=cellpatterns.String)]}, id='cellpattern'),
+    pytest.param({}, id='all fields'),
+])
+@pytest.mark.parametrize('include_row_num', [True, False])
+# 020/1 #####
+def test_20_1_stream_matches_records(first_names, kwargs, include_row_num):
+
+    # GIVEN a table loaded the usual way...
+    ft = FuzzyTable(path=first_names.path, header_row_seek=bool(kwargs), **kwargs)
+    ft.records.include_row_num = include_row_num
+
+    # WHEN the same table is streamed...
+    stream = FuzzyTable.stream(
+        path=first_names.path,
+        header_row_seek=bool(kwargs),
+        include_row_num=include_row_num,
+        **kwargs
+    )
+
+    # THEN records are yielded lazily, and identical to the loaded ones.
+    assert isinstance(stream, types.GeneratorType)
+    assert list(stream) == list(ft.records)
+
+
+# 020/2 #####
+def test_20_2_stream_excel(get_test_path, dr_who_records):
+    stream = FuzzyTable.stream(
+        path=get_test_path(),
+        sheetname='table_bottom_right',
+        fields=dr_who_records[0].keys(),
+        header_row_seek=True,
+        include_row_num=False,
+    )
+    assert list(stream) == dr_who_records
+
+
+# 020/3 #####
+def test_20_3_stream_missingfielderror(firstlastnames):
+    stream = FuzzyTable.stream(
+        path=firstlastnames.path,
+        fields='first_name middle_name'.split(),
+        missingfieldserror_active=True,
+    )
+    with pytest.raises(exceptions.MissingFieldError):
+        next(stream)
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 3, 5])
+# 020/4 #####
+def test_20_4_chunks_match_table(first_names, chunksize):
+
+    # GIVEN a table loaded the usual way...
+    fields = ['id', FieldPattern('name', multifield=True, min_ratio=0.3, mode='approx')]
+    ft = FuzzyTable(path=first_names.path, fields=fields)
+
+    # WHEN the same table is read in chunks...
+    chunks = list(FuzzyTable.chunks(path=first_names.path, fields=fields, chunksize=chunksize))
+
+    # THEN each chunk holds at most chunksize rows...
+    assert all(len(chunk['id']) <= chunksize for chunk in chunks)
+
+    # ... and together they hold the same table.
+    for key in ['id', 'name', 'row']:
+        actual_column = [value for chunk in chunks for value in chunk[key]]
+        expected_column = [record[key] for record in ft.records]
+        assert actual_column == expected_column
+
+
+@pytest.mark.parametrize('chunksize', [0, -1, 2.5, 'ten'])
+# 020/5 #####
+def test_20_5_invalid_chunksize(first_names, chunksize):
+    with pytest.raises(exceptions.InvalidChunksizeError):
+        next(FuzzyTable.chunks(path=first_names.path, chunksize=chunksize))
@@ -0,0 +1,73 @@
+import sys
+
+import pytest
+from fuzzytable.main.typeinference import infer_value, infer_column
+
+
+@pytest.mark.parametrize('value,expected', [
+    pytest.param('', None, id='empty'),
+    pytest.param('42', 42, id='int'),
+    pytest.param('-7 ', -7, id='int/trailing whitespace'),
+    # literal_eval strips leading spaces and tabs from python 3.10.
+    pytest.param(' -7', -7 if sys.version_info >= (3, 10) else ' -7', id='int/leading whitespace'),
+    pytest.param('\t2.5', 2.5 if sys.version_info >= (3, 10) else '\t2.5', id='float/leading whitespace'),
+    pytest.param('1_000', 1000, id='int/underscore'),
+    pytest.param('007', '007', id='int/leading zeros'),
+    pytest.param('0x1F', 31, id='int/hex'),
+    pytest.param('42.5', 42.5, id='float'),
+    pytest.param('1e3', 1000.0, id='float/exponent'),
+    pytest.param('inf', 'inf', id='float/inf'),
+    pytest.param('TRUE', True, id='bool/upper'),
+    pytest.param('False', False, id='bool/title'),
+    pytest.param('None', None, id='None'),
+    pytest.param('"quoted"', 'quoted', id='str/quoted'),
+    pytest.param('19twenty3', '19twenty3', id='str/digits'),
+    pytest.param('hello, good bye', 'hello, good bye', id='str/comma'),
+    pytest.param('(5)', 5, id='parenthesized'),
+    pytest.param(2019, 2019, id='non-str'),
+])
+@pytest.mark.parametrize('literals', [True, False])
+# 020/1 #####
+def test_20_1_scalars(value, expected, literals):
+    actual = infer_value(value, literals=literals)
+    assert actual == expected
+    assert type(actual) is type(expected)
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('1, 2, 3', (1, 2, 3)),
+    ('[1, 2]', [1, 2]),
+    ("{'a': 1}", {'a': 1}),
+])
+# 020/2 #####
+def test_20_2_safe_literals(value, expected):
+
+    # Containers are only evaluated in "safe literal" mode.
+    assert infer_value(value, literals=True) == expected
+    assert infer_value(value) == value
+
+
+# 020/3 #####
+def test_20_3_infer_column():
+
+    # GIVEN a repetitive column...
+    values = ['1', '[1]', 'x', '1', '[1]', '', 'true'] * 3
+
+    # WHEN it is typed in one pass...
+    actual = infer_column(values, literals=True)
+
+    # THEN the results match cell-by-cell inference...
+    assert actual == [infer_value(value, literals=True) for value in values]
+
+    # ... but mutable values are never shared between cells.
+    assert actual[1] is not actual[4]
+
+
+# 020/4 #####
+def test_20_4_huge_int():
+
+    # An integer with more digits than int() accepts (python 3.11+) stays a string, as with literal_eval.
+    value = '9' * 5000
+    expected = value if hasattr(sys, 'set_int_max_str_digits') else int(value)
+    assert infer_value(value) == expected
+    assert infer_column([value, value]) == [expected, expected]